@@ -0,0 +1,87 @@
+"""
+Benchmark do custo de CPU da compressão gzip contra os bytes economizados.
+
+Gera listagens de tickets típicas (resumo e detalhe) em vários tamanhos e,
+para cada nível de compressão, mede o tempo médio de compressão, a taxa de
+compressão e a vazão.
+
+Uso: python benchmarks/bench_compression.py [--sizes 10 50 500] [--levels 1 6 9]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.glpi_entities import (  # noqa: E402
+    GLPITicket,
+    TicketPriority,
+    TicketStatus,
+)
+from src.interfaces.http.compression import gzip_bytes  # noqa: E402
+from src.interfaces.http.serializers import (  # noqa: E402
+    ticket_detail,
+    ticket_summary,
+)
+
+_WORDS = (
+    "erro acesso sistema impressora rede senha usuário servidor lento "
+    "instalação atualização backup relatório projeto integração falha"
+).split()
+
+
+def make_tickets(count: int, seed: int = 42):
+    """Tickets sintéticos com nomes e descrições de tamanho realista."""
+    rng = random.Random(seed)
+    return [
+        GLPITicket(
+            id=1000 + i,
+            name=f"[PROJ-{rng.randint(1, 20)}] " + " ".join(rng.sample(_WORDS, 4)),
+            content=" ".join(rng.choice(_WORDS) for _ in range(rng.randint(20, 80))),
+            status=rng.choice(list(TicketStatus)),
+            priority=rng.choice(list(TicketPriority)),
+            assigned_user_id=rng.randint(1, 50),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(payload: bytes, level: int, repeat: int) -> dict:
+    """Comprime ``payload`` ``repeat`` vezes e resume custo e ganho."""
+    start = time.process_time()
+    for _ in range(repeat):
+        compressed = gzip_bytes(payload, level)
+    cpu = (time.process_time() - start) / repeat
+
+    return {
+        "level": level,
+        "bytes": len(payload),
+        "gzip_bytes": len(compressed),
+        "saved_pct": round(100 * (1 - len(compressed) / len(payload)), 1),
+        "cpu_ms": round(cpu * 1000, 3),
+        "mb_per_s": round(len(payload) / cpu / 1e6, 1) if cpu else None,
+    }
+
+
+def main():
+    """Executa o benchmark e imprime uma linha por combinação."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 500])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for view, to_dict in (("summary", ticket_summary), ("detail", ticket_detail)):
+        for size in args.sizes:
+            tickets = make_tickets(size)
+            payload = json.dumps([to_dict(ticket) for ticket in tickets]).encode()
+            for level in args.levels:
+                result = measure(payload, level, args.repeat)
+                print({"view": view, "tickets": size, **result})
+
+
+if __name__ == "__main__":
+    main()
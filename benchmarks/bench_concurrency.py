@@ -0,0 +1,85 @@
+"""
+Benchmark de vazão do servidor da API por modelo de concorrência.
+
+Sobe um GLPI falso com latência artificial e mede quantas requisições
+``GET /tickets/{id}`` por segundo a API atende em cada modo.
+
+Uso: python benchmarks/bench_concurrency.py [--latency 0.1] [--requests 200]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_glpi import FakeGLPIServer  # noqa: E402
+from src.core.glpi_entities import GLPIConfig  # noqa: E402
+from src.infrastructure.app_context import build_app_context  # noqa: E402
+from src.interfaces.http.handler import APIHandler  # noqa: E402
+from src.interfaces.http.pool_server import create_server  # noqa: E402
+from src.interfaces.http.server import create_handler  # noqa: E402
+
+
+def _fetch(url: str) -> int:
+    """Faz uma requisição e devolve o status HTTP."""
+    try:
+        with urllib.request.urlopen(url, timeout=60) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def run_mode(mode: str, glpi_url: str, total: int, clients: int) -> dict:
+    """Mede a vazão da API em um modelo de concorrência."""
+    context = build_app_context(GLPIConfig(glpi_url, "app", "user"))
+    context.warm_up()
+    handler = partial(create_handler, context)
+    httpd = create_server(("127.0.0.1", 0), handler, mode=mode)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/tickets/1"
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        statuses = list(pool.map(_fetch, [url] * total))
+    elapsed = time.perf_counter() - start
+
+    httpd.shutdown()
+    httpd.server_close()
+
+    return {
+        "mode": mode,
+        "requests": total,
+        "ok": statuses.count(200),
+        "rejected": statuses.count(503),
+        "seconds": round(elapsed, 3),
+        "req_per_s": round(total / elapsed, 1),
+    }
+
+
+def main():
+    """Executa o benchmark nos dois modos e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=16)
+    args = parser.parse_args()
+
+    # Silencia o log de acesso para não distorcer a medição
+    APIHandler.log_message = lambda *args: None
+
+    with FakeGLPIServer(latency=args.latency) as glpi:
+        for mode in ("single", "threadpool"):
+            result = run_mode(mode, glpi.base_url, args.requests, args.clients)
+            print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark dos backends do adaptador MCP.
+
+Sobe um GLPI falso e uma instância local da API e mede quantas chamadas
+``get_ticket`` por segundo o adaptador faz em cada modo:
+
+- ``remote-legacy``: ``requests.get`` avulso, uma conexão nova por chamada;
+- ``remote``: ``requests.Session`` com keep-alive;
+- ``inprocess``: chamada direta ao caso de uso, sem salto HTTP.
+
+Uso: python benchmarks/bench_mcp_adapter.py [--latency 0.005] [--calls 500]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from functools import partial
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_glpi import FakeGLPIServer  # noqa: E402
+from mcp_adapter import InProcessBackend, RemoteBackend  # noqa: E402
+from src.core.glpi_entities import GLPIConfig  # noqa: E402
+from src.infrastructure.app_context import build_app_context  # noqa: E402
+from src.interfaces.http.handler import APIHandler  # noqa: E402
+from src.interfaces.http.pool_server import create_server  # noqa: E402
+from src.interfaces.http.server import create_handler  # noqa: E402
+
+
+class LegacyBackend:
+    """Comportamento anterior: uma requisição avulsa por chamada."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    def get_ticket(self, ticket_id):
+        return requests.get(f"{self.base_url}/tickets/{ticket_id}").json()
+
+
+def measure(name: str, backend, calls: int) -> dict:
+    """Mede a vazão sequencial de ``get_ticket`` em um backend."""
+    backend.get_ticket(1)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        backend.get_ticket(1)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": name,
+        "calls": calls,
+        "seconds": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+        "ms_per_call": round(elapsed / calls * 1000, 3),
+    }
+
+
+def main():
+    """Executa o benchmark nos três modos e imprime o resultado."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    # Silencia o log de acesso para não distorcer a medição
+    APIHandler.log_message = lambda *args: None
+
+    with FakeGLPIServer(latency=args.latency) as glpi:
+        context = build_app_context(GLPIConfig(glpi.base_url, "app", "user"))
+        context.warm_up()
+        httpd = create_server(("127.0.0.1", 0), partial(create_handler, context))
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        api_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+        remote = RemoteBackend(base_url=api_url)
+        backends = [
+            ("remote-legacy", LegacyBackend(api_url)),
+            ("remote", remote),
+            ("inprocess", InProcessBackend(context.ticket_use_case)),
+        ]
+        try:
+            for name, backend in backends:
+                print(measure(name, backend, args.calls))
+        finally:
+            remote.close()
+            httpd.shutdown()
+            httpd.server_close()
+            context.close()
+
+
+if __name__ == "__main__":
+    main()
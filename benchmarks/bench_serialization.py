@@ -0,0 +1,89 @@
+"""
+Micro-benchmark da serialização das respostas de tickets.
+
+Para a listagem (visão ``summary``) e o detalhe de um ticket, compara a
+conversão campo a campo com ``isinstance`` seguida de ``json.dumps``
+(implementação anterior) com os planos de ``serializers`` usando o ``json``
+da biblioteca padrão e, se instalado, o ``orjson``.
+
+Uso: python benchmarks/bench_serialization.py [--sizes 1 50 1000] [--repeat 200]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from enum import Enum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_compression import make_tickets  # noqa: E402
+from src.core.glpi_entities import SUMMARY_FIELDS  # noqa: E402
+from src.interfaces.http import serializers  # noqa: E402
+from src.interfaces.http.serializers import DETAIL_FIELDS, ticket_plan  # noqa: E402
+
+
+def legacy_fields(ticket, fields):
+    """Conversão anterior: ``getattr`` e ``isinstance`` a cada campo."""
+    data = {}
+    for name in fields:
+        value = getattr(ticket, name)
+        if isinstance(value, Enum):
+            value = value.name
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[name] = value
+    return data
+
+
+def encoders(fields):
+    """Serializadores comparados para uma visão: nome -> tickets -> bytes."""
+    plan = ticket_plan(fields)
+    result = {
+        "legacy+json": lambda tickets: json.dumps(
+            [legacy_fields(ticket, fields) for ticket in tickets]
+        ).encode(),
+        "plan+json": lambda tickets: serializers._stdlib_dumps(
+            [plan.to_dict(ticket) for ticket in tickets]
+        ),
+    }
+    if serializers.orjson is not None:
+        result["plan+orjson"] = lambda tickets: serializers.orjson.dumps(
+            [plan.to_dict(ticket) for ticket in tickets]
+        )
+    return result
+
+
+def measure(encode, tickets, repeat: int) -> dict:
+    """Serializa ``repeat`` vezes e resume a vazão."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = encode(tickets)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return {
+        "bytes": len(body),
+        "us_per_payload": round(elapsed * 1e6, 1),
+        "tickets_per_s": round(len(tickets) / elapsed),
+        "mb_per_s": round(len(body) / elapsed / 1e6, 1),
+    }
+
+
+def main():
+    """Executa o benchmark e imprime uma linha por combinação."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for view, fields in (("summary", SUMMARY_FIELDS), ("detail", DETAIL_FIELDS)):
+        for size in args.sizes:
+            tickets = make_tickets(size)
+            for name, encode in encoders(fields).items():
+                result = measure(encode, tickets, args.repeat)
+                print({"view": view, "tickets": size, "encoder": name, **result})
+
+
+if __name__ == "__main__":
+    main()
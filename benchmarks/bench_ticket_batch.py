@@ -0,0 +1,136 @@
+"""
+Benchmark de memória e CPU das agregações por status e prioridade.
+
+Compara, para N tickets (padrão 100 mil):
+
+- memória de uma lista de tickets com ``__dict__`` (dataclass comum), de
+  tickets com ``slots`` e de um ``TicketBatch`` colunar;
+- tempo de contagem por status e prioridade sobre cada representação;
+- tempo de montagem a partir das linhas de busca do GLPI (tickets x colunas).
+
+Uso: python benchmarks/bench_ticket_batch.py [--tickets 100000] [--repeat 5]
+"""
+import argparse
+import dataclasses
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.glpi_entities import (  # noqa: E402
+    GLPITicket,
+    TicketBatch,
+    TicketPriority,
+    TicketStatus,
+)
+from src.core.use_cases import BATCH_FIELDS  # noqa: E402
+from src.infrastructure.glpi_ticket_repository import GLPITicketMapper  # noqa: E402
+
+# Mesmo formato do ``GLPITicket``, mas com ``__dict__`` por instância
+DictTicket = dataclasses.make_dataclass(
+    "DictTicket",
+    [
+        (field.name, field.type, dataclasses.field(default=field.default))
+        for field in dataclasses.fields(GLPITicket)
+    ],
+)
+
+
+def make_rows(count: int, seed: int = 42):
+    """Linhas de busca do GLPI com ID, status (12) e prioridade (3)."""
+    rng = random.Random(seed)
+    return [
+        {"id": i + 1, "12": rng.randint(1, 6), "3": rng.randint(1, 5)}
+        for i in range(count)
+    ]
+
+
+def allocated(build):
+    """Constrói o objeto e devolve ``(objeto, bytes alocados)``."""
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def best_of(func, repeat: int) -> float:
+    """Menor tempo (ms) de ``repeat`` execuções."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return round(min(times) * 1000, 2)
+
+
+def count_tickets(tickets):
+    """Contagem por status e prioridade percorrendo os objetos."""
+    return Counter(t.status for t in tickets), Counter(t.priority for t in tickets)
+
+
+def main():
+    """Executa o benchmark e imprime um resultado por representação."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickets", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.tickets)
+    mapper = GLPITicketMapper()
+
+    def build_dict_tickets():
+        return [
+            DictTicket(
+                id=row["id"],
+                status=TicketStatus(row["12"]),
+                priority=TicketPriority(row["3"]),
+            )
+            for row in rows
+        ]
+
+    def build_slotted_tickets():
+        return [mapper._parse_ticket_data(row, BATCH_FIELDS) for row in rows]
+
+    def build_batch():
+        batch = TicketBatch()
+        mapper._add_rows(batch, rows)
+        return batch
+
+    dict_tickets, dict_bytes = allocated(build_dict_tickets)
+    slotted_tickets, slotted_bytes = allocated(build_slotted_tickets)
+    batch, batch_bytes = allocated(build_batch)
+    assert batch.status_counts() == dict(count_tickets(slotted_tickets)[0])
+
+    results = [
+        {
+            "representation": "dataclass com __dict__",
+            "memory_mb": round(dict_bytes / 2**20, 2),
+            "count_ms": best_of(lambda: count_tickets(dict_tickets), args.repeat),
+            "build_ms": best_of(build_dict_tickets, args.repeat),
+        },
+        {
+            "representation": "GLPITicket com slots",
+            "memory_mb": round(slotted_bytes / 2**20, 2),
+            "count_ms": best_of(lambda: count_tickets(slotted_tickets), args.repeat),
+            "build_ms": best_of(build_slotted_tickets, args.repeat),
+        },
+        {
+            "representation": "TicketBatch colunar",
+            "memory_mb": round(batch_bytes / 2**20, 2),
+            "count_ms": best_of(
+                lambda: (batch.status_counts(), batch.priority_counts()), args.repeat
+            ),
+            "build_ms": best_of(build_batch, args.repeat),
+        },
+    ]
+    for result in results:
+        print({"tickets": args.tickets, **result})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+Servidor GLPI falso para benchmarks locais.
+
+Implementa o necessário da API REST do GLPI usado pela aplicação:
+``initSession``/``killSession``, CRUD em ``/Ticket`` (inclusive em lote, e
+``GET /Ticket/{id}`` com os nomes dos campos, como o GLPI real) e
+``/search/Ticket`` com ``criteria`` (inclusive grupos aninhados), ``sort``/
+``order``, ``forcedisplay`` e ``range``. Critérios que o servidor não sabe
+avaliar respondem 400, para que a diferença apareça no teste de carga. A base de
+tickets é gerada em memória e cada requisição sofre uma latência artificial
+configurável.
+"""
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+_WORDS = (
+    "erro acesso sistema impressora rede senha usuário servidor lento "
+    "instalação atualização backup relatório integração falha"
+).split()
+
+# Colunas devolvidas pela busca quando não há ``forcedisplay`` (2 é o ID)
+_DEFAULT_COLUMNS = ("1", "2", "21", "12", "3", "19")
+# Campo do GLPI -> opção de busca em que fica guardado
+_FIELD_COLUMNS = {
+    "name": "1",
+    "content": "21",
+    "status": "12",
+    "priority": "3",
+    "itilcategories_id": "7",
+    "users_id_tech": "5",
+    "groups_id_tech": "8",
+    "date_creation": "15",
+    "date_mod": "19",
+}
+# Campos de ``GET /Ticket/{id}`` (técnico e grupo ficam em outras tabelas)
+_ITEM_FIELDS = (
+    "name",
+    "content",
+    "status",
+    "priority",
+    "itilcategories_id",
+    "date_creation",
+    "date_mod",
+)
+# Opções de busca que podem ser filtradas e ordenadas (2 é o ID)
+_SEARCH_COLUMNS = frozenset(("2", *_FIELD_COLUMNS.values()))
+# Campos que a aplicação não pode escrever
+_READ_ONLY_FIELDS = ("date_creation", "date_mod")
+
+
+class FakeGLPIDataset:
+    """Tickets em memória, protegidos por um lock."""
+
+    def __init__(self, size: int = 1000, projects: int = 20, seed: int = 42):
+        rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tickets: Dict[int, Dict[str, Any]] = {}
+        self.next_id = 1
+        self.projects = projects
+        for _ in range(size):
+            self.create(
+                {
+                    "name": f"[PROJ-{rng.randint(1, projects)}] "
+                    + " ".join(rng.sample(_WORDS, 3)),
+                    "content": " ".join(rng.choices(_WORDS, k=rng.randint(20, 60))),
+                    "status": rng.randint(1, 6),
+                    "priority": rng.randint(1, 5),
+                }
+            )
+
+    def create(self, data: Dict[str, Any]) -> int:
+        """Cria um ticket e devolve o ID."""
+        with self.lock:
+            ticket_id = self.next_id
+            self.next_id += 1
+            self.tickets[ticket_id] = self._row(ticket_id, data)
+            return ticket_id
+
+    def update(self, ticket_id: int, data: Dict[str, Any]) -> bool:
+        """Atualiza os campos informados de um ticket."""
+        with self.lock:
+            row = self.tickets.get(ticket_id)
+            if row is None:
+                return False
+            for field_name, column in _FIELD_COLUMNS.items():
+                if field_name in data and field_name not in _READ_ONLY_FIELDS:
+                    row[column] = data[field_name]
+            row["19"] = _now()
+            return True
+
+    def delete(self, ticket_id: int) -> bool:
+        """Remove um ticket."""
+        with self.lock:
+            return self.tickets.pop(ticket_id, None) is not None
+
+    def get(self, ticket_id: int) -> Optional[Dict[str, Any]]:
+        """Ticket no formato de ``GET /Ticket/{id}``: campos por nome."""
+        with self.lock:
+            row = self.tickets.get(ticket_id)
+            if row is None:
+                return None
+            return {
+                "id": row["id"],
+                **{name: row[_FIELD_COLUMNS[name]] for name in _ITEM_FIELDS},
+            }
+
+    def search(
+        self,
+        criteria: Dict[int, Dict[str, Any]],
+        sort: Optional[str],
+        descending: bool,
+        columns: List[str],
+        start: int,
+        end: int,
+    ):
+        """Filtra, ordena, pagina e projeta os tickets; devolve ``(total, linhas)``.
+
+        Lança ``ValueError`` para critérios ou ordenações desconhecidos.
+        """
+        with self.lock:
+            rows = list(self.tickets.values())
+
+        if sort is not None and sort not in _SEARCH_COLUMNS:
+            raise ValueError(f"Ordenação desconhecida: {sort}")
+        rows = [row for row in rows if _matches(row, criteria)]
+        if sort is not None:
+            rows.sort(key=lambda row: _sortable(row[sort]), reverse=descending)
+
+        end = min(end, len(rows) - 1)
+        window = rows[start : end + 1]  # noqa: E203
+        return len(rows), [
+            {"id": row["id"], **{column: row.get(column) for column in columns}}
+            for row in window
+        ]
+
+    @staticmethod
+    def _row(ticket_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        now = _now()
+        return {
+            "id": ticket_id,
+            "1": data.get("name", ""),
+            "2": ticket_id,
+            "21": data.get("content", ""),
+            "12": data.get("status", 1),
+            "3": data.get("priority", 3),
+            "7": data.get("itilcategories_id") or 0,
+            "5": data.get("users_id_tech") or 0,
+            "8": data.get("groups_id_tech") or 0,
+            "15": now,
+            "19": now,
+        }
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _parse_criteria(query: Dict[str, List[str]]) -> Dict[int, Dict[str, Any]]:
+    """Árvore dos ``criteria[n][...]`` da query string, por índice.
+
+    Um critério com ``[criteria]`` é um grupo, com os seus próprios itens.
+    """
+    root: Dict[int, Dict[str, Any]] = {}
+    for key, values in query.items():
+        if not key.startswith("criteria["):
+            continue
+        tokens = re.findall(r"\[(\w+)\]", key)
+        if len(tokens) % 2 or any(t != "criteria" for t in tokens[1:-1:2]):
+            raise ValueError(f"Critério inválido: {key}")
+        items = root
+        for position in range(0, len(tokens) - 1, 2):
+            criterion = items.setdefault(int(tokens[position]), {})
+            if position + 2 < len(tokens):
+                items = criterion.setdefault("criteria", {})
+        criterion[tokens[-1]] = values[0]
+    return root
+
+
+def _matches(row: Dict[str, Any], criteria: Dict[int, Dict[str, Any]]) -> bool:
+    """Avalia os critérios na ordem, com o ``link`` (``AND``/``OR``) de cada um."""
+    result = True
+    for position, index in enumerate(sorted(criteria)):
+        criterion = criteria[index]
+        if "criteria" in criterion:
+            matched = _matches(row, criterion["criteria"])
+        else:
+            matched = _criterion_matches(row, criterion)
+        link = criterion.get("link", "AND").upper()
+        if position == 0:
+            result = matched
+        elif link == "AND":
+            result = result and matched
+        elif link == "OR":
+            result = result or matched
+        else:
+            raise ValueError(f"Ligação não suportada: {link}")
+    return result
+
+
+def _criterion_matches(row: Dict[str, Any], criterion: Dict[str, Any]) -> bool:
+    """Avalia um critério simples (``contains``, ``equals``, ``morethan``...)."""
+    field = criterion.get("field")
+    if field not in _SEARCH_COLUMNS:
+        raise ValueError(f"Campo de busca não suportado: {field}")
+    value = criterion.get("value", "")
+    actual = row[field]
+    searchtype = criterion.get("searchtype", "contains")
+    if searchtype == "contains":
+        return value.strip("%").lower() in str(actual).lower()
+    if searchtype == "equals":
+        return str(actual) == value
+    if searchtype == "morethan":
+        return _sortable(actual) > _sortable(value)
+    if searchtype == "lessthan":
+        return _sortable(actual) < _sortable(value)
+    raise ValueError(f"Tipo de busca não suportado: {searchtype}")
+
+
+def _sortable(value: Any):
+    """Números comparados como números; datas e textos, como texto."""
+    try:
+        return (0, float(value), "")
+    except (TypeError, ValueError):
+        return (1, 0.0, str(value))
+
+
+class FakeGLPIHandler(BaseHTTPRequestHandler):
+    """Handler que simula a API REST do GLPI."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """Sessão, leitura de tickets e busca."""
+        path, query = self._route()
+        dataset = self.server.dataset
+
+        if path == "/initSession":
+            self._send_json({"session_token": "fake-session-token"})
+        elif path == "/killSession":
+            self._send_json({})
+        elif path == "/getActiveProfile":
+            self._send_json({"active_profile": {"id": 4, "name": "Super-Admin"}})
+        elif path.startswith("/Ticket/"):
+            ticket = dataset.get(self._ticket_id(path))
+            if ticket is None:
+                self._send_json(["ERROR_ITEM_NOT_FOUND", "Item não encontrado"], 404)
+            else:
+                self._send_json(ticket)
+        elif path == "/search/Ticket":
+            self._search(query)
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        """Criação de um ou vários tickets."""
+        path, _ = self._route()
+        if path != "/Ticket":
+            self._send_json({"error": "not found"}, status=404)
+            return
+
+        items = self._input()
+        results = [
+            {"id": self.server.dataset.create(item), "message": ""} for item in items
+        ]
+        self._send_json(results if self._is_batch else results[0], status=201)
+
+    def do_PUT(self):
+        """Atualização de um ou vários tickets."""
+        self._write(lambda ticket_id, item: self.server.dataset.update(ticket_id, item))
+
+    def do_DELETE(self):
+        """Exclusão de um ou vários tickets."""
+        self._write(lambda ticket_id, item: self.server.dataset.delete(ticket_id))
+
+    def _write(self, operation):
+        """PUT/DELETE em ``/Ticket/{id}`` ou em lote em ``/Ticket``."""
+        path, _ = self._route()
+        items = self._input()
+        if path.startswith("/Ticket/"):
+            items = [{**(items[0] if items else {}), "id": self._ticket_id(path)}]
+        elif path != "/Ticket":
+            self._send_json({"error": "not found"}, status=404)
+            return
+
+        results = []
+        for item in items:
+            ticket_id = int(item.get("id", 0))
+            results.append({str(ticket_id): operation(ticket_id, item), "message": ""})
+        self._send_json(results)
+
+    def _search(self, query: Dict[str, List[str]]):
+        """``/search/Ticket`` com critérios, ordenação, colunas e janela."""
+        columns = [
+            values[0]
+            for key, values in sorted(query.items())
+            if key.startswith("forcedisplay[")
+        ] or list(_DEFAULT_COLUMNS)
+
+        start, end = 0, 49
+        match = re.fullmatch(r"(\d+)-(\d+)", query.get("range", ["0-49"])[0])
+        if match:
+            start, end = map(int, match.groups())
+
+        sort = query.get("sort", [None])[0]
+        descending = query.get("order", ["ASC"])[0].upper() == "DESC"
+        try:
+            total, rows = self.server.dataset.search(
+                _parse_criteria(query), sort, descending, columns, start, end
+            )
+        except ValueError as e:
+            self._send_json(["ERROR_BAD_ARRAY", str(e)], 400)
+            return
+        last = start + len(rows) - 1
+        self._send_json(
+            {"totalcount": total, "count": len(rows), "data": rows},
+            status=206 if len(rows) < total else 200,
+            headers={"Content-Range": f"{start}-{max(last, start)}/{total}"},
+        )
+
+    def _route(self):
+        """Caminho sem o prefixo da API e parâmetros da query string."""
+        time.sleep(self.server.latency)
+        parsed = urllib.parse.urlparse(self.path)
+        return parsed.path.removeprefix(self.server.prefix), urllib.parse.parse_qs(
+            parsed.query
+        )
+
+    def _input(self) -> List[Dict[str, Any]]:
+        """Itens de ``input`` do corpo (um objeto ou uma lista)."""
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        items = body.get("input", {}) if isinstance(body, dict) else {}
+        self._is_batch = isinstance(items, list)
+        return items if self._is_batch else [items]
+
+    @staticmethod
+    def _ticket_id(path: str) -> int:
+        return int(path.rsplit("/", 1)[-1])
+
+    def _send_json(self, payload, status=200, headers=None):
+        """Escreve uma resposta JSON."""
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silencia o log de acesso."""
+
+
+class FakeGLPIServer:
+    """Servidor GLPI falso executado em uma thread de fundo."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        port: int = 0,
+        prefix: str = "/apirest.php",
+        dataset_size: int = 1000,
+    ):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), FakeGLPIHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.prefix = prefix
+        self.httpd.dataset = FakeGLPIDataset(dataset_size)
+        self.prefix = prefix
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def dataset(self) -> FakeGLPIDataset:
+        """Base de tickets em memória."""
+        return self.httpd.dataset
+
+    @property
+    def base_url(self) -> str:
+        """URL base da API falsa, no formato de ``GLPI_BASE_URL``."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.prefix}"
+
+    def start(self) -> "FakeGLPIServer":
+        """Inicia o servidor."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
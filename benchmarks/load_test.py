@@ -0,0 +1,258 @@
+"""
+Teste de carga ponta a ponta da API contra um GLPI falso.
+
+Sobe o GLPI falso (``fake_glpi.py``) e a API em processo, dispara clientes
+concorrentes com conexões keep-alive sobre uma mistura de endpoints e
+imprime, em JSON, vazão e latências p50/p95/p99 por endpoint. Com
+``--baseline`` compara o resultado com uma execução anterior e termina com
+código 1 se algum endpoint piorar além de ``--threshold``.
+
+Uso: python benchmarks/load_test.py [--duration 10] [--clients 16]
+     [--latency 0.01] [--dataset 1000] [--output atual.json]
+     [--baseline anterior.json] [--threshold 0.2]
+"""
+import argparse
+import contextlib
+import http.client
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from collections import defaultdict
+from functools import partial
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_glpi import FakeGLPIServer  # noqa: E402
+from src.core.glpi_entities import GLPIConfig  # noqa: E402
+from src.infrastructure.app_context import build_app_context  # noqa: E402
+from src.interfaces.http.handler import APIHandler  # noqa: E402
+from src.interfaces.http.pool_server import create_server  # noqa: E402
+from src.interfaces.http.server import create_handler  # noqa: E402
+
+# Endpoint -> peso na mistura de requisições
+SCENARIOS = {
+    "GET /tickets": 3,
+    "GET /tickets/{id}": 5,
+    "GET /projects/{tag}/progress": 2,
+    "POST /tickets": 1,
+}
+
+
+def _request(scenario: str, rng: random.Random, dataset_size: int, projects: int):
+    """Método, caminho e corpo de uma requisição do cenário."""
+    if scenario == "GET /tickets":
+        return "GET", f"/tickets?offset={rng.randrange(dataset_size)}&limit=50", None
+    if scenario == "GET /tickets/{id}":
+        return "GET", f"/tickets/{rng.randint(1, dataset_size)}", None
+    if scenario == "GET /projects/{tag}/progress":
+        return "GET", f"/projects/PROJ-{rng.randint(1, projects)}/progress", None
+    body = {"name": "[PROJ-1] carga", "content": "Criado pelo teste de carga"}
+    return "POST", "/tickets", json.dumps(body).encode()
+
+
+def _worker(
+    base_url: str,
+    deadline: float,
+    seed: int,
+    dataset_size: int,
+    projects: int,
+    results: Dict[str, List[float]],
+    errors: Dict[str, int],
+    lock: threading.Lock,
+) -> None:
+    """Cliente com uma conexão keep-alive disparando requisições até o prazo."""
+    rng = random.Random(seed)
+    names = list(SCENARIOS)
+    weights = list(SCENARIOS.values())
+    url = urllib.parse.urlsplit(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=60)
+    latencies = defaultdict(list)
+    failures = defaultdict(int)
+
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(names, weights)[0]
+        method, path, body = _request(scenario, rng, dataset_size, projects)
+        headers = {"Content-Type": "application/json"} if body else {}
+        start = time.perf_counter()
+        try:
+            connection.request(method, url.path.rstrip("/") + path, body, headers)
+            response = connection.getresponse()
+            response.read()
+            ok = response.status < 500
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            ok = False
+        latencies[scenario].append(time.perf_counter() - start)
+        if not ok:
+            failures[scenario] += 1
+
+    connection.close()
+    with lock:
+        for scenario, values in latencies.items():
+            results[scenario].extend(values)
+        for scenario, count in failures.items():
+            errors[scenario] += count
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Percentil por posição mais próxima, em milissegundos."""
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return round(ordered[index] * 1000, 2)
+
+
+def summarize(
+    results: Dict[str, List[float]], errors: Dict[str, int], seconds: float
+) -> Dict[str, dict]:
+    """Vazão e latências (ms) por endpoint."""
+    summary = {}
+    for scenario in SCENARIOS:
+        ordered = sorted(results.get(scenario, []))
+        if not ordered:
+            continue
+        summary[scenario] = {
+            "requests": len(ordered),
+            "errors": errors.get(scenario, 0),
+            "req_per_s": round(len(ordered) / seconds, 1),
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+            "p50_ms": _percentile(ordered, 0.50),
+            "p95_ms": _percentile(ordered, 0.95),
+            "p99_ms": _percentile(ordered, 0.99),
+        }
+    return summary
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Lista as regressões de ``current`` em relação a ``baseline``.
+
+    Um endpoint regride se o p95 subir ou a vazão cair mais que ``threshold``
+    (fração, ex.: 0.2 = 20%), ou se passar a ter erros.
+    """
+    regressions = []
+    for scenario, before in baseline.get("endpoints", {}).items():
+        after = current["endpoints"].get(scenario)
+        if after is None:
+            regressions.append(f"{scenario}: sem medições")
+            continue
+        if after["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{scenario}: p95 {before['p95_ms']}ms -> {after['p95_ms']}ms"
+            )
+        if after["req_per_s"] < before["req_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{scenario}: vazão {before['req_per_s']} -> {after['req_per_s']} req/s"
+            )
+        if after["errors"] > before["errors"]:
+            regressions.append(
+                f"{scenario}: erros {before['errors']} -> {after['errors']}"
+            )
+    return regressions
+
+
+def run_load(
+    base_url: str,
+    duration: float,
+    clients: int,
+    dataset_size: int,
+    projects: int,
+) -> dict:
+    """Dispara ``clients`` clientes por ``duration`` segundos contra a API."""
+    results: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=_worker,
+            args=(base_url, deadline, seed, dataset_size, projects),
+            kwargs={"results": results, "errors": errors, "lock": lock},
+        )
+        for seed in range(clients)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "config": {
+            "duration_s": duration,
+            "clients": clients,
+            "dataset_size": dataset_size,
+        },
+        "seconds": round(elapsed, 3),
+        "endpoints": summarize(results, errors, elapsed),
+    }
+
+
+def _serve_api(glpi_url: str, mode: Optional[str]):
+    """Sobe a API em processo apontando para o GLPI informado."""
+    context = build_app_context(GLPIConfig(glpi_url, "app", "user"))
+    # Mantém a saída padrão só com o JSON do resultado
+    with contextlib.redirect_stdout(sys.stderr):
+        context.warm_up()
+    httpd = create_server(("127.0.0.1", 0), partial(create_handler, context), mode=mode)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return context, httpd
+
+
+def main():
+    """Executa o teste de carga e compara com a linha de base, se houver."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="API já em execução (dispensa o GLPI falso)")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--dataset", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--mode", choices=("single", "threadpool"), default=None)
+    parser.add_argument("--output", help="Grava o resultado em JSON neste arquivo")
+    parser.add_argument("--baseline", help="Resultado anterior para comparação")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # Silencia o log de acesso para não distorcer a medição
+    APIHandler.log_message = lambda *args: None
+
+    if args.url:
+        result = run_load(
+            args.url, args.duration, args.clients, args.dataset, args.projects
+        )
+    else:
+        with FakeGLPIServer(latency=args.latency, dataset_size=args.dataset) as glpi:
+            context, httpd = _serve_api(glpi.base_url, args.mode)
+            base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+            try:
+                result = run_load(
+                    base_url, args.duration, args.clients, args.dataset, args.projects
+                )
+            finally:
+                httpd.shutdown()
+                httpd.server_close()
+                context.close()
+        result["config"]["glpi_latency_s"] = args.latency
+
+    report = json.dumps(result, indent=2, ensure_ascii=False)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(result, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSÃO {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,183 @@
-
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from src.core.glpi_entities import SUMMARY_FIELDS
+from src.infrastructure.app_context import get_app_context
+from src.interfaces.http.pagination import DEFAULT_LIMIT
+from src.interfaces.http.serializers import (
+    ticket_detail,
+    ticket_from_payload,
+    ticket_summary,
+)
+
+BASE_URL = os.environ.get(
+    "MCP_API_BASE_URL", "https://web-production-d3940.up.railway.app"
+)
+
+REMOTE = "remote"
+INPROCESS = "inprocess"
+
+
+class RemoteBackend:
+    """Calls the HTTP API over a pooled keep-alive session."""
+
+    def __init__(self, base_url=BASE_URL, timeout=30.0, pool_size=10, session=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def _call(self, method, path, payload=None):
+        response = self.session.request(
+            method, f"{self.base_url}{path}", json=payload, timeout=self.timeout
+        )
+        try:
+            return response.json()
+        except ValueError:
+            # Errors from the API come back as HTML pages
+            return {"error": response.reason, "status": response.status_code}
+
+    def list_tickets(self):
+        return self._call("GET", "/tickets")
+
+    def create_ticket(self, title, content):
+        return self._call("POST", "/tickets", {"name": title, "content": content})
+
+    def get_ticket(self, ticket_id):
+        return self._call("GET", f"/tickets/{ticket_id}")
+
+    def update_ticket(self, ticket_id, title, content):
+        return self._call(
+            "PUT", f"/tickets/{ticket_id}", {"name": title, "content": content}
+        )
+
+    def delete_ticket(self, ticket_id):
+        return self._call("DELETE", f"/tickets/{ticket_id}")
+
+    def get_project_progress(self, tag):
+        return self._call("GET", f"/projects/{tag}/progress")
+
+    def close(self):
+        self.session.close()
+
+
+class InProcessBackend:
+    """Calls GLPITicketUseCase directly, skipping the HTTP hop to the API."""
+
+    def __init__(self, ticket_use_case=None):
+        if ticket_use_case is None:
+            ticket_use_case = get_app_context().ticket_use_case
+        self.ticket_use_case = ticket_use_case
+
+    def list_tickets(self):
+        # Same first page GET /tickets returns without query parameters
+        tickets = self.ticket_use_case.iter_tickets(0, DEFAULT_LIMIT, SUMMARY_FIELDS)
+        return [ticket_summary(ticket) for ticket in tickets]
+
+    def create_ticket(self, title, content):
+        created = self.ticket_use_case.create_ticket(
+            ticket_from_payload({"name": title, "content": content})
+        )
+        if created and created.id:
+            return ticket_summary(created)
+        return {"error": "Dados de ticket inválidos", "status": 400}
+
+    def get_ticket(self, ticket_id):
+        ticket = self.ticket_use_case.get_ticket(int(ticket_id))
+        if ticket:
+            return ticket_detail(ticket)
+        return {"error": "Ticket não encontrado", "status": 404}
+
+    def update_ticket(self, ticket_id, title, content):
+        updated = self.ticket_use_case.update_ticket(
+            int(ticket_id), ticket_from_payload({"name": title, "content": content})
+        )
+        if updated:
+            return ticket_summary(updated)
+        return {"error": "Ticket não encontrado ou dados inválidos", "status": 404}
+
+    def delete_ticket(self, ticket_id):
+        if self.ticket_use_case.delete_ticket(int(ticket_id)):
+            return {"message": f"Ticket com ID {ticket_id} foi excluído"}
+        return {"error": "Ticket não encontrado", "status": 404}
+
+    def get_project_progress(self, tag):
+        return self.ticket_use_case.get_project_progress(tag)
+
+    def close(self):
+        pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(mode=None):
+    """Builds the backend selected by MCP_ADAPTER_MODE (remote or inprocess)."""
+    if mode is None:
+        mode = os.environ.get("MCP_ADAPTER_MODE", REMOTE)
+
+    if mode == INPROCESS:
+        return InProcessBackend()
+    if mode == REMOTE:
+        return RemoteBackend(
+            base_url=BASE_URL,
+            timeout=float(os.environ.get("MCP_API_TIMEOUT", 30)),
+            pool_size=int(os.environ.get("MCP_API_POOL_SIZE", 10)),
+        )
+    raise ValueError(f"Unknown adapter mode: {mode}")
+
+
+def get_backend():
+    """Returns the process-wide backend, creating it on first use."""
+    global _backend
+
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_backend()
+    return _backend
+
+
+def set_backend(backend):
+    """Replaces the process-wide backend and returns the previous one."""
+    global _backend
+
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    return previous
 
-BASE_URL = "https://web-production-d3940.up.railway.app"
 
 def list_tickets():
     """Lists all GLPI tickets."""
-    response = requests.get(f"{BASE_URL}/tickets")
-    return response.json()
+    return get_backend().list_tickets()
+
 
 def create_ticket(title: str, content: str):
     """Creates a new ticket in GLPI."""
-    response = requests.post(f"{BASE_URL}/tickets", json={"title": title, "content": content})
-    return response.json()
+    return get_backend().create_ticket(title, content)
+
 
 def get_ticket(ticket_id: int):
     """Retrieves a specific ticket by its ID."""
-    response = requests.get(f"{BASE_URL}/tickets/{ticket_id}")
-    return response.json()
+    return get_backend().get_ticket(ticket_id)
+
 
 def update_ticket(ticket_id: int, title: str, content: str):
     """Updates an existing ticket."""
-    response = requests.put(f"{BASE_URL}/tickets/{ticket_id}", json={"title": title, "content": content})
-    return response.json()
+    return get_backend().update_ticket(ticket_id, title, content)
+
 
 def delete_ticket(ticket_id: int):
     """Deletes a ticket from GLPI."""
-    response = requests.delete(f"{BASE_URL}/tickets/{ticket_id}")
-    return response.json()
+    return get_backend().delete_ticket(ticket_id)
+
 
 def get_project_progress(tag: str):
     """Calculates the progress of a project based on its related tickets."""
-    response = requests.get(f"{BASE_URL}/projects/{tag}/progress")
-    return response.json()
+    return get_backend().get_project_progress(tag)
@@ -1,52 +1,136 @@
 
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+import inspect
 import json
-from mcp_adapter import list_tickets, create_ticket, get_ticket, update_ticket, delete_ticket, get_project_progress
+from src.interfaces.http.pool_server import create_server
+from mcp_adapter import (
+    list_tickets,
+    create_ticket,
+    get_ticket,
+    update_ticket,
+    delete_ticket,
+    get_project_progress,
+)
+
+import os
+
+METHODS = {
+    "list_tickets": list_tickets,
+    "create_ticket": create_ticket,
+    "get_ticket": get_ticket,
+    "update_ticket": update_ticket,
+    "delete_ticket": delete_ticket,
+    "get_project_progress": get_project_progress,
+}
+
+# Códigos de erro definidos pela especificação JSON-RPC 2.0
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Pool compartilhado por todos os lotes; limita as chamadas simultâneas à API
+BATCH_WORKERS = int(os.environ.get("MCP_BATCH_WORKERS", 8))
+MAX_BATCH_SIZE = int(os.environ.get("MCP_MAX_BATCH_SIZE", 100))
+_executor = ThreadPoolExecutor(
+    max_workers=BATCH_WORKERS, thread_name_prefix="mcp-batch"
+)
+
+
+def _error(code, message, id=None):
+    return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": id}
+
+
+def handle_call(call):
+    """Executa uma chamada JSON-RPC; retorna None para notificações."""
+    if (
+        not isinstance(call, dict)
+        or call.get("jsonrpc") != "2.0"
+        or not isinstance(call.get("method"), str)
+    ):
+        id = call.get("id") if isinstance(call, dict) else None
+        return _error(INVALID_REQUEST, "Invalid Request", id)
+
+    is_notification = "id" not in call
+    id = call.get("id")
+    method = METHODS.get(call["method"])
+    if method is None:
+        response = _error(METHOD_NOT_FOUND, "Method not found", id)
+    else:
+        params = call.get("params", {})
+        if params is None:
+            params = {}
+        args, kwargs = (params, {}) if isinstance(params, list) else ([], params)
+        try:
+            if not isinstance(kwargs, dict):
+                raise TypeError("params deve ser um objeto ou uma lista")
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as e:
+            response = _error(INVALID_PARAMS, f"Invalid params: {e}", id)
+        else:
+            try:
+                result = method(*args, **kwargs)
+                response = {"jsonrpc": "2.0", "result": result, "id": id}
+            except Exception as e:
+                response = _error(INTERNAL_ERROR, f"Internal error: {e}", id)
+
+    return None if is_notification else response
+
+
+def handle_payload(payload):
+    """Processa um objeto ou um lote; retorna None se não houver resposta."""
+    if not isinstance(payload, list):
+        return handle_call(payload)
+
+    if not payload:
+        return _error(INVALID_REQUEST, "Invalid Request")
+    if len(payload) > MAX_BATCH_SIZE:
+        return _error(INVALID_REQUEST, f"Batch too large (max {MAX_BATCH_SIZE})")
+
+    # As chamadas de um lote são independentes: executa em paralelo e mantém a ordem
+    if len(payload) == 1:
+        responses = [handle_call(payload[0])]
+    else:
+        responses = list(_executor.map(handle_call, payload))
+    responses = [response for response in responses if response is not None]
+    return responses or None
+
 
 class MCPHandler(BaseHTTPRequestHandler):
     def do_POST(self):
-        content_length = int(self.headers['Content-Length'])
+        content_length = int(self.headers.get('Content-Length', 0))
         post_data = self.rfile.read(content_length)
-        request = json.loads(post_data)
-
-        method = request.get("method")
-        params = request.get("params")
-        id = request.get("id")
-
-        if method == "list_tickets":
-            result = list_tickets()
-        elif method == "create_ticket":
-            result = create_ticket(**params)
-        elif method == "get_ticket":
-            result = get_ticket(**params)
-        elif method == "update_ticket":
-            result = update_ticket(**params)
-        elif method == "delete_ticket":
-            result = delete_ticket(**params)
-        elif method == "get_project_progress":
-            result = get_project_progress(**params)
+
+        try:
+            payload = json.loads(post_data)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            response = _error(PARSE_ERROR, "Parse error")
         else:
-            result = {"error": "Method not found"}
+            response = handle_payload(payload)
 
-        response = {
-            "jsonrpc": "2.0",
-            "result": result,
-            "id": id
-        }
+        if response is None:
+            # Apenas notificações: nada a responder
+            self.send_response(204)
+            self.end_headers()
+            return
 
+        body = json.dumps(response).encode('utf-8')
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self.wfile.write(body)
 
-import os
 
-def run(server_class=HTTPServer, handler_class=MCPHandler):
+def run(server_factory=create_server, handler_class=MCPHandler):
     port = int(os.environ.get("PORT", 8080))
     server_address = ('', port)
-    httpd = server_class(server_address, handler_class)
+    httpd = server_factory(server_address, handler_class)
     print(f'Starting MCP server on port {port}...')
     httpd.serve_forever()
 
+
 if __name__ == "__main__":
     run()
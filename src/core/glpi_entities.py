@@ -1,8 +1,9 @@
 """
 Entidades do GLPI para gerenciamento de projetos de TI.
 """
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Type
 from enum import Enum
 from datetime import datetime
 
@@ -29,9 +30,12 @@ class TicketPriority(Enum):
     MAJOR = 6
 
 
-@dataclass
+@dataclass(slots=True)
 class GLPITicket:
-    """Representa um ticket do GLPI."""
+    """Representa um ticket do GLPI.
+
+    Com ``slots`` os tickets não carregam um ``__dict__`` por instância.
+    """
 
     id: Optional[int] = None
     name: str = ""
@@ -44,13 +48,176 @@ class GLPITicket:
     due_date: Optional[datetime] = None
     created_date: Optional[datetime] = None
     time_to_resolve: Optional[datetime] = None
+    # Última modificação no GLPI (``date_mod``); identifica a versão do ticket
+    modified_date: Optional[datetime] = None
 
     def is_valid(self) -> bool:
         """Verifica se o ticket tem dados válidos."""
         return bool(self.name and self.content)
 
 
-@dataclass
+class TicketBatch:
+    """Tickets em colunas compactas (``array``) para agregações.
+
+    Guarda só ID, status e prioridade de cada ticket, como códigos do GLPI,
+    sem um objeto por linha; ID 0 marca ticket sem ID. As contagens são uma
+    varredura em C da coluna por código.
+    """
+
+    __slots__ = ("ids", "statuses", "priorities")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.statuses = array("B")
+        self.priorities = array("B")
+
+    @classmethod
+    def from_tickets(cls, tickets: Iterable[GLPITicket]) -> "TicketBatch":
+        """Monta o lote a partir de tickets já carregados."""
+        batch = cls()
+        for ticket in tickets:
+            batch.append(ticket.id, ticket.status.value, ticket.priority.value)
+        return batch
+
+    def append(self, ticket_id: Optional[int], status: int, priority: int) -> None:
+        """Acrescenta um ticket pelos códigos de status e prioridade."""
+        self.ids.append(ticket_id or 0)
+        self.statuses.append(status)
+        self.priorities.append(priority)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def status_counts(self) -> Dict[TicketStatus, int]:
+        """Quantidade de tickets por status (só os presentes)."""
+        return self._counts(self.statuses, TicketStatus)
+
+    def priority_counts(self) -> Dict[TicketPriority, int]:
+        """Quantidade de tickets por prioridade (só as presentes)."""
+        return self._counts(self.priorities, TicketPriority)
+
+    @staticmethod
+    def _counts(column: array, codes: Type[Enum]) -> Dict[Any, int]:
+        data = column.tobytes()
+        counts = {member: data.count(member.value) for member in codes}
+        return {member: count for member, count in counts.items() if count}
+
+
+# Campos de ticket que podem ser selecionados nas buscas e respostas da API
+TICKET_FIELDS = (
+    "id",
+    "name",
+    "content",
+    "status",
+    "priority",
+    "category_id",
+    "assigned_user_id",
+    "assigned_group_id",
+    "modified_date",
+)
+# Campos da listagem resumida (``GET /tickets``)
+SUMMARY_FIELDS = ("id", "name", "status", "priority")
+# Campos pelos quais a listagem pode ser ordenada
+SORT_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "priority",
+    "category_id",
+    "assigned_user_id",
+    "assigned_group_id",
+    "modified_date",
+    "created_date",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TicketFilter:
+    """Filtros e ordenação da listagem de tickets.
+
+    Vários status ou prioridades valem como "qualquer um deles"; os demais
+    filtros se somam. Os limites de data são exclusivos, como na busca do
+    GLPI. Repositórios que buscam no GLPI traduzem o filtro em critérios da
+    busca; ``apply`` é a versão em memória para os demais.
+    """
+
+    statuses: Tuple[TicketStatus, ...] = ()
+    priorities: Tuple[TicketPriority, ...] = ()
+    assigned_user_id: Optional[int] = None
+    assigned_group_id: Optional[int] = None
+    category_id: Optional[int] = None
+    modified_after: Optional[datetime] = None
+    modified_before: Optional[datetime] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    sort: Optional[str] = None
+    descending: bool = False
+
+    def matches(self, ticket: GLPITicket) -> bool:
+        """Indica se o ticket passa pelos filtros."""
+        if self.statuses and ticket.status not in self.statuses:
+            return False
+        if self.priorities and ticket.priority not in self.priorities:
+            return False
+        for name in ("assigned_user_id", "assigned_group_id", "category_id"):
+            expected = getattr(self, name)
+            if expected is not None and getattr(ticket, name) != expected:
+                return False
+        return _in_range(
+            ticket.modified_date, self.modified_after, self.modified_before
+        ) and _in_range(ticket.created_date, self.created_after, self.created_before)
+
+    def apply(self, tickets: Iterable[GLPITicket]) -> List[GLPITicket]:
+        """Tickets que passam pelos filtros, na ordem pedida."""
+        selected = [ticket for ticket in tickets if self.matches(ticket)]
+        if self.sort is not None:
+            selected.sort(key=self._sort_key, reverse=self.descending)
+        return selected
+
+    def _sort_key(self, ticket: GLPITicket):
+        value = getattr(ticket, self.sort)
+        if isinstance(value, Enum):
+            value = value.value
+        # Valores ausentes vão para o fim na ordem crescente
+        return (value is None, value if value is not None else 0)
+
+
+def _in_range(
+    value: Optional[datetime], after: Optional[datetime], before: Optional[datetime]
+) -> bool:
+    if after is None and before is None:
+        return True
+    if value is None:
+        return False
+    return (after is None or value > after) and (before is None or value < before)
+
+
+@dataclass(slots=True)
+class TicketPage:
+    """Uma janela de resultados de uma busca paginada de tickets."""
+
+    tickets: List[GLPITicket]
+    offset: int
+    total: Optional[int] = None
+    next_offset: Optional[int] = None
+
+    def has_more(self) -> bool:
+        """Indica se existem resultados após esta página."""
+        return self.next_offset is not None
+
+
+@dataclass(slots=True)
+class BatchItemResult:
+    """Resultado de um item de uma operação em lote."""
+
+    index: int
+    success: bool
+    ticket_id: Optional[int] = None
+    ticket: Optional[GLPITicket] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
 class GLPIProject:
     """Representa um projeto de TI no GLPI."""
 
@@ -82,15 +249,27 @@ class GLPIConfig:
     app_token: str
     user_token: str
     timeout: int = 30
+    pool_size: int = 10
+    pool_idle_timeout: float = 15.0
+    # Segundos de ociosidade até tocar a sessão para ela não expirar (0 desliga)
+    session_refresh_interval: float = 600.0
+    # Retentativas de métodos idempotentes e backoff exponencial com jitter
+    max_retries: int = 2
+    retry_backoff: float = 0.2
+    retry_max_backoff: float = 2.0
+    # Falhas seguidas que abrem o circuito de um endpoint (0 desliga)
+    breaker_failure_threshold: int = 5
+    breaker_recovery_timeout: float = 30.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GLPIResponse:
     """Representa uma resposta da API do GLPI."""
 
     status_code: int
     data: Dict[str, Any]
     error: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
 
     def is_success(self) -> bool:
         """Verifica se a requisição foi bem sucedida."""
@@ -1,21 +1,54 @@
 """
 Casos de uso para gerenciamento de tickets do GLPI.
 """
-from typing import List, Optional
-from .glpi_entities import GLPITicket, TicketStatus, TicketPriority
-from .use_cases import TicketRepository
+import asyncio
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .glpi_entities import (
+    BatchItemResult,
+    GLPITicket,
+    TicketFilter,
+    TicketPriority,
+    TicketStatus,
+)
+from .project_progress import PROGRESS_FIELDS, ProjectProgressIndex
+from .use_cases import AsyncTicketRepository, TicketRepository
 
 
 class GLPITicketUseCase:
     """Caso de uso para gerenciamento de tickets do GLPI."""
 
-    def __init__(self, ticket_repository: TicketRepository):
+    def __init__(
+        self,
+        ticket_repository: TicketRepository,
+        progress_index: Optional[ProjectProgressIndex] = None,
+        async_repository: Optional[AsyncTicketRepository] = None,
+    ):
         self.ticket_repository = ticket_repository
+        self.progress_index = progress_index
+        self.async_repository = async_repository
 
     def list_tickets(self) -> List[GLPITicket]:
         """Lista todos os tickets."""
         return self.ticket_repository.get_all()
 
+    def iter_tickets(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        ticket_filter: Optional[TicketFilter] = None,
+    ) -> Iterator[GLPITicket]:
+        """Itera sobre os tickets sob demanda, sem materializar a lista.
+
+        Com ``fields``, só esses campos são buscados no GLPI; com
+        ``ticket_filter``, só os tickets que passam pelos filtros, na ordem
+        pedida.
+        """
+        return self.ticket_repository.iter_all(
+            offset=offset, limit=limit, fields=fields, ticket_filter=ticket_filter
+        )
+
     def get_ticket(self, ticket_id: int) -> Optional[GLPITicket]:
         """Obtém um ticket pelo ID."""
         return self.ticket_repository.get_by_id(ticket_id)
@@ -24,38 +57,118 @@ class GLPITicketUseCase:
         """Cria um novo ticket."""
         if not ticket.is_valid():
             return None
-        return self.ticket_repository.create(ticket)
+        created = self.ticket_repository.create(ticket)
+        if created and created.id and self.progress_index is not None:
+            self.progress_index.record_created(created)
+        return created
 
     def update_ticket(self, ticket_id: int, ticket: GLPITicket) -> Optional[GLPITicket]:
         """Atualiza um ticket existente."""
         if not ticket.is_valid():
             return None
-        return self.ticket_repository.update(ticket_id, ticket)
+        updated = self.ticket_repository.update(ticket_id, ticket)
+        if updated and self.progress_index is not None:
+            self.progress_index.record_updated(ticket_id, updated)
+        return updated
 
     def delete_ticket(self, ticket_id: int) -> bool:
         """Deleta um ticket."""
-        return self.ticket_repository.delete(ticket_id)
+        deleted = self.ticket_repository.delete(ticket_id)
+        if deleted and self.progress_index is not None:
+            self.progress_index.record_deleted(ticket_id)
+        return deleted
+
+    def create_many_tickets(self, tickets: List[GLPITicket]) -> List[BatchItemResult]:
+        """Cria vários tickets em lote, com um resultado por item."""
+        valid_indices = [i for i, ticket in enumerate(tickets) if ticket.is_valid()]
+        batch = self.ticket_repository.create_many([tickets[i] for i in valid_indices])
+        results = self._merge_batch_results(len(tickets), valid_indices, batch)
+
+        if self.progress_index is not None:
+            for result in results:
+                if result.success and result.ticket:
+                    self.progress_index.record_created(result.ticket)
+        return results
+
+    def update_many_tickets(
+        self, updates: List[Tuple[int, GLPITicket]]
+    ) -> List[BatchItemResult]:
+        """Atualiza vários tickets em lote, com um resultado por item."""
+        valid_indices = [
+            i for i, (_, ticket) in enumerate(updates) if ticket.is_valid()
+        ]
+        batch = self.ticket_repository.update_many([updates[i] for i in valid_indices])
+        results = self._merge_batch_results(
+            len(updates),
+            valid_indices,
+            batch,
+            ticket_ids=[ticket_id for ticket_id, _ in updates],
+        )
+
+        if self.progress_index is not None:
+            for result in results:
+                if result.success and result.ticket:
+                    self.progress_index.record_updated(result.ticket_id, result.ticket)
+        return results
+
+    def delete_many_tickets(self, ticket_ids: List[int]) -> List[BatchItemResult]:
+        """Deleta vários tickets em lote, com um resultado por item."""
+        results = self.ticket_repository.delete_many(ticket_ids)
+
+        if self.progress_index is not None:
+            for result in results:
+                if result.success:
+                    self.progress_index.record_deleted(result.ticket_id)
+        return results
 
-    def search_project_tickets(self, project_tag: str) -> List[GLPITicket]:
+    @staticmethod
+    def _merge_batch_results(
+        size: int,
+        valid_indices: List[int],
+        batch: List[BatchItemResult],
+        ticket_ids: Optional[List[int]] = None,
+    ) -> List[BatchItemResult]:
+        """Reposiciona os resultados do lote e marca os itens inválidos."""
+        results = [
+            BatchItemResult(
+                index,
+                False,
+                ticket_ids[index] if ticket_ids else None,
+                error="Dados de ticket inválidos",
+            )
+            for index in range(size)
+        ]
+        for index, result in zip(valid_indices, batch):
+            result.index = index
+            results[index] = result
+        return results
+
+    def search_project_tickets(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
         """Busca tickets relacionados a um projeto."""
-        return self.ticket_repository.search_by_project_tag(project_tag)
+        return self.ticket_repository.search_by_project_tag(project_tag, fields)
 
     def get_project_progress(self, project_tag: str) -> dict:
         """Calcula progresso de um projeto baseado nos tickets."""
-        tickets = self.search_project_tickets(project_tag)
-
-        total_tickets = len(tickets)
-        completed_tickets = sum(
-            1
-            for ticket in tickets
-            if ticket.status == TicketStatus.SOLVED
-            or ticket.status == TicketStatus.CLOSED
+        if self.progress_index is not None:
+            counts = self.progress_index.get_counts(project_tag)
+        else:
+            # Contagem sobre colunas, sem um ticket por linha
+            batch = self.ticket_repository.search_batch_by_project_tag(project_tag)
+            counts = batch.status_counts()
+
+        return self._build_progress(project_tag, counts)
+
+    @staticmethod
+    def _build_progress(project_tag: str, counts: Dict[TicketStatus, int]) -> dict:
+        """Monta o resumo de progresso a partir da contagem por status."""
+        total_tickets = sum(counts.values())
+        completed_tickets = counts.get(TicketStatus.SOLVED, 0) + counts.get(
+            TicketStatus.CLOSED, 0
         )
-        in_progress_tickets = sum(
-            1
-            for ticket in tickets
-            if ticket.status == TicketStatus.ASSIGNED
-            or ticket.status == TicketStatus.PLANNED
+        in_progress_tickets = counts.get(TicketStatus.ASSIGNED, 0) + counts.get(
+            TicketStatus.PLANNED, 0
         )
 
         progress_percentage = (
@@ -71,6 +184,95 @@ class GLPITicketUseCase:
             "remaining_tickets": total_tickets - completed_tickets,
         }
 
+    async def list_tickets_async(self) -> List[GLPITicket]:
+        """Lista todos os tickets, buscando as páginas em paralelo."""
+        return await self._async_repository().get_all()
+
+    async def get_ticket_async(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID."""
+        return await self._async_repository().get_by_id(ticket_id)
+
+    async def get_tickets_async(
+        self, ticket_ids: List[int]
+    ) -> List[Optional[GLPITicket]]:
+        """Obtém vários tickets em paralelo, na ordem dos IDs."""
+        return await self._async_repository().get_many(ticket_ids)
+
+    async def create_ticket_async(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um novo ticket."""
+        if not ticket.is_valid():
+            return None
+        try:
+            created = await self._async_repository().create(ticket)
+        finally:
+            self.ticket_repository.invalidate()
+        if created and created.id and self.progress_index is not None:
+            self.progress_index.record_created(created)
+        return created
+
+    async def update_ticket_async(
+        self, ticket_id: int, ticket: GLPITicket
+    ) -> Optional[GLPITicket]:
+        """Atualiza um ticket existente."""
+        if not ticket.is_valid():
+            return None
+        try:
+            updated = await self._async_repository().update(ticket_id, ticket)
+        finally:
+            self.ticket_repository.invalidate(ticket_id)
+        if updated and self.progress_index is not None:
+            self.progress_index.record_updated(ticket_id, updated)
+        return updated
+
+    async def delete_ticket_async(self, ticket_id: int) -> bool:
+        """Deleta um ticket."""
+        try:
+            deleted = await self._async_repository().delete(ticket_id)
+        finally:
+            self.ticket_repository.invalidate(ticket_id)
+        if deleted and self.progress_index is not None:
+            self.progress_index.record_deleted(ticket_id)
+        return deleted
+
+    async def search_project_tickets_async(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets relacionados a um projeto."""
+        return await self._async_repository().search_by_project_tag(project_tag, fields)
+
+    async def get_project_progress_async(self, project_tag: str) -> dict:
+        """Calcula progresso de um projeto baseado nos tickets."""
+        if self.progress_index is not None:
+            # O índice é síncrono e pode remontar a tag: roda fora do loop
+            counts = await asyncio.to_thread(
+                self.progress_index.get_counts, project_tag
+            )
+        else:
+            tickets = await self.search_project_tickets_async(
+                project_tag, PROGRESS_FIELDS
+            )
+            counts = Counter(ticket.status for ticket in tickets)
+
+        return self._build_progress(project_tag, counts)
+
+    async def get_projects_progress_async(self, project_tags: List[str]) -> List[dict]:
+        """Calcula o progresso de vários projetos em paralelo."""
+        return list(
+            await asyncio.gather(
+                *(self.get_project_progress_async(tag) for tag in project_tags)
+            )
+        )
+
+    def _async_repository(self) -> AsyncTicketRepository:
+        """Repositório assíncrono configurado.
+
+        As escritas feitas por ele invalidam o cache do repositório síncrono,
+        que não as vê passar.
+        """
+        if self.async_repository is None:
+            raise RuntimeError("Repositório assíncrono não configurado")
+        return self.async_repository
+
     def create_project_milestone(
         self, name: str, description: str, due_date
     ) -> Optional[GLPITicket]:
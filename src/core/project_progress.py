@@ -0,0 +1,174 @@
+"""
+Índice materializado de progresso por projeto.
+"""
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from .glpi_entities import GLPITicket, TicketStatus
+from .use_cases import TicketRepository
+
+# O progresso só depende do status; o ID permite ajustes incrementais
+PROGRESS_FIELDS = ("id", "status")
+
+
+def ticket_matches_tag(ticket: GLPITicket, project_tag: str) -> bool:
+    """Replica o critério ``contains`` da busca por projeto no nome do ticket."""
+    return project_tag.lower() in (ticket.name or "").lower()
+
+
+@dataclass
+class _TagAggregate:
+    """Contagem por status dos tickets de um projeto."""
+
+    counts: Counter = field(default_factory=Counter)
+    # Status atual de cada ticket conhecido, para ajustar as contagens em O(1)
+    members: Dict[int, TicketStatus] = field(default_factory=dict)
+    # Tickets vindos da busca sem ID: contados, mas impossíveis de rastrear
+    untracked: int = 0
+    built_at: float = 0.0
+
+
+class ProjectProgressIndex:
+    """Mantém, por tag de projeto, quantos tickets existem em cada status.
+
+    O agregado de uma tag é montado na primeira consulta com uma busca no
+    repositório e depois ajustado a cada criação, atualização ou exclusão
+    feita pela aplicação. A cada ``reconcile_interval`` segundos ele é
+    remontado a partir do GLPI, para absorver alterações feitas por fora.
+    """
+
+    def __init__(
+        self,
+        repository: TicketRepository,
+        reconcile_interval: float = 300.0,
+        max_tags: int = 256,
+    ):
+        self.repository = repository
+        self.reconcile_interval = reconcile_interval
+        self.max_tags = max_tags
+        self._tags: "OrderedDict[str, _TagAggregate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._stop = threading.Event()
+        self._reconciler: Optional[threading.Thread] = None
+
+    def get_counts(self, project_tag: str) -> Dict[TicketStatus, int]:
+        """Contagem por status da tag, montando o agregado se necessário."""
+        with self._lock:
+            aggregate = self._tags.get(project_tag)
+            fresh = (
+                aggregate is not None
+                and time.monotonic() - aggregate.built_at < self.reconcile_interval
+            )
+            if fresh:
+                self._tags.move_to_end(project_tag)
+                return dict(aggregate.counts)
+
+        return dict(self.rebuild(project_tag).counts)
+
+    def rebuild(self, project_tag: str) -> _TagAggregate:
+        """Remonta o agregado da tag a partir do repositório.
+
+        Se a busca falhar, a exceção sobe antes de qualquer gravação: o
+        agregado anterior (ou a ausência dele) continua valendo, nunca uma
+        contagem parcial.
+        """
+        version = self._version
+        tickets = self.repository.search_by_project_tag(project_tag, PROGRESS_FIELDS)
+        aggregate = self._aggregate(tickets)
+
+        with self._lock:
+            if self._version != version:
+                # Houve escrita durante a busca: o resultado pode não refleti-la,
+                # então a próxima consulta remonta de novo
+                aggregate.built_at = 0.0
+            self._tags[project_tag] = aggregate
+            self._tags.move_to_end(project_tag)
+            while len(self._tags) > self.max_tags:
+                self._tags.popitem(last=False)
+
+        return aggregate
+
+    def reconcile_all(self) -> None:
+        """Remonta todas as tags indexadas.
+
+        Uma tag que falha mantém o agregado anterior e não impede as demais.
+        """
+        with self._lock:
+            tags = list(self._tags)
+
+        for project_tag in tags:
+            try:
+                self.rebuild(project_tag)
+            except Exception as e:
+                print(f"Erro ao reconciliar progresso do projeto {project_tag}: {e}")
+
+    def record_created(self, ticket: GLPITicket) -> None:
+        """Contabiliza um ticket recém-criado."""
+        self.record_updated(ticket.id, ticket)
+
+    def record_updated(self, ticket_id: Optional[int], ticket: GLPITicket) -> None:
+        """Ajusta as contagens após a criação ou atualização de um ticket."""
+        with self._lock:
+            self._version += 1
+            for project_tag, aggregate in self._tags.items():
+                previous = aggregate.members.pop(ticket_id, None)
+                if previous is not None:
+                    aggregate.counts[previous] -= 1
+
+                if not ticket_matches_tag(ticket, project_tag):
+                    continue
+
+                if previous is None and aggregate.untracked:
+                    # Pode ser um dos tickets sem ID: sem como saber, remonta
+                    aggregate.built_at = 0.0
+                aggregate.members[ticket_id] = ticket.status
+                aggregate.counts[ticket.status] += 1
+
+    def record_deleted(self, ticket_id: int) -> None:
+        """Remove um ticket excluído das contagens."""
+        with self._lock:
+            self._version += 1
+            for aggregate in self._tags.values():
+                previous = aggregate.members.pop(ticket_id, None)
+                if previous is not None:
+                    aggregate.counts[previous] -= 1
+                elif aggregate.untracked:
+                    aggregate.built_at = 0.0
+
+    def start_reconciler(self) -> None:
+        """Inicia a thread que remonta periodicamente as tags indexadas."""
+        if self._reconciler is not None:
+            return
+
+        self._stop.clear()
+        self._reconciler = threading.Thread(
+            target=self._reconcile_loop, name="progress-reconciler", daemon=True
+        )
+        self._reconciler.start()
+
+    def stop_reconciler(self) -> None:
+        """Encerra a thread de reconciliação."""
+        self._stop.set()
+        if self._reconciler is not None:
+            self._reconciler.join(timeout=5)
+            self._reconciler = None
+
+    def _reconcile_loop(self) -> None:
+        """Reconcilia na metade do intervalo, antes de as tags vencerem."""
+        while not self._stop.wait(self.reconcile_interval / 2):
+            self.reconcile_all()
+
+    @staticmethod
+    def _aggregate(tickets: Iterable[GLPITicket]) -> _TagAggregate:
+        """Conta os tickets de uma busca por status."""
+        aggregate = _TagAggregate(built_at=time.monotonic())
+        for ticket in tickets:
+            aggregate.counts[ticket.status] += 1
+            if ticket.id is None:
+                aggregate.untracked += 1
+            else:
+                aggregate.members[ticket.id] = ticket.status
+        return aggregate
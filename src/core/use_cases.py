@@ -1,9 +1,14 @@
 """
 Casos de uso da aplicação.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from .glpi_entities import GLPITicket
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+from .glpi_entities import BatchItemResult, GLPITicket, TicketBatch, TicketFilter
+
+# Campos lidos para montar um ``TicketBatch``
+BATCH_FIELDS = ("id", "status", "priority")
 
 
 class TicketRepository(ABC):
@@ -14,11 +19,40 @@ class TicketRepository(ABC):
         """Obtém todos os tickets."""
         pass
 
+    def iter_all(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        ticket_filter: Optional[TicketFilter] = None,
+    ) -> Iterator[GLPITicket]:
+        """Itera sobre os tickets sob demanda, a partir de ``offset``.
+
+        ``fields`` indica os campos de que o chamador precisa; os demais podem
+        vir com valores padrão. ``ticket_filter`` restringe e ordena os
+        tickets antes da paginação. A implementação padrão filtra e fatia
+        ``get_all`` e ignora ``fields``; repositórios que conseguem paginar,
+        filtrar e projetar na origem devem sobrescrevê-la.
+        """
+        tickets = self.get_all()
+        if ticket_filter is not None:
+            tickets = ticket_filter.apply(tickets)
+        end = None if limit is None else offset + limit
+        return iter(tickets[offset:end])
+
     @abstractmethod
     def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
         """Obtém um ticket pelo ID."""
         pass
 
+    def get_modified_date(self, ticket_id: int) -> Optional[datetime]:
+        """Data da última modificação de um ticket, sem buscá-lo inteiro.
+
+        Retorna ``None`` quando a origem não consegue informá-la de forma
+        barata; nesse caso quem pergunta deve buscar o ticket completo.
+        """
+        return None
+
     @abstractmethod
     def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
         """Cria um novo ticket."""
@@ -34,7 +68,119 @@ class TicketRepository(ABC):
         """Deleta um ticket."""
         pass
 
+    def create_many(self, tickets: List[GLPITicket]) -> List[BatchItemResult]:
+        """Cria vários tickets, com um resultado por item.
+
+        A implementação padrão chama ``create`` item a item; repositórios com
+        suporte a lote na origem devem sobrescrevê-la.
+        """
+        results = []
+        for index, ticket in enumerate(tickets):
+            created = self.create(ticket)
+            results.append(
+                BatchItemResult(index, True, created.id, created)
+                if created
+                else BatchItemResult(index, False, error="Falha ao criar ticket")
+            )
+        return results
+
+    def update_many(
+        self, updates: List[Tuple[int, GLPITicket]]
+    ) -> List[BatchItemResult]:
+        """Atualiza vários tickets, com um resultado por item."""
+        results = []
+        for index, (ticket_id, ticket) in enumerate(updates):
+            updated = self.update(ticket_id, ticket)
+            results.append(
+                BatchItemResult(index, True, ticket_id, updated)
+                if updated
+                else BatchItemResult(
+                    index, False, ticket_id, error="Falha ao atualizar ticket"
+                )
+            )
+        return results
+
+    def delete_many(self, ticket_ids: List[int]) -> List[BatchItemResult]:
+        """Deleta vários tickets, com um resultado por item."""
+        return [
+            BatchItemResult(index, True, ticket_id)
+            if self.delete(ticket_id)
+            else BatchItemResult(
+                index, False, ticket_id, error="Falha ao excluir ticket"
+            )
+            for index, ticket_id in enumerate(ticket_ids)
+        ]
+
+    @abstractmethod
+    def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets relacionados a um projeto (só os ``fields``, se dados)."""
+        pass
+
+    def search_batch_by_project_tag(self, project_tag: str) -> TicketBatch:
+        """Tickets de um projeto em colunas, para contagens.
+
+        Implementação padrão sobre ``search_by_project_tag``; repositórios que
+        leem linhas cruas podem montar as colunas sem criar tickets.
+        """
+        return TicketBatch.from_tickets(
+            self.search_by_project_tag(project_tag, BATCH_FIELDS)
+        )
+
+    def invalidate(self, ticket_id: Optional[int] = None) -> None:
+        """Descarta o que foi guardado sobre ``ticket_id`` e as buscas.
+
+        Chamado quando o ticket é alterado por fora deste repositório (pelo
+        repositório assíncrono, por exemplo). Sem ``ticket_id``, só as buscas
+        são afetadas, como após uma criação. A implementação padrão não
+        guarda nada; decoradores com cache devem sobrescrevê-la.
+        """
+
+
+class AsyncTicketRepository(ABC):
+    """Interface assíncrona para o repositório de tickets.
+
+    Permite sobrepor várias chamadas ao GLPI (vários tickets, várias buscas)
+    em vez de executá-las uma após a outra.
+    """
+
+    @abstractmethod
+    async def get_all(self) -> List[GLPITicket]:
+        """Obtém todos os tickets."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID."""
+        pass
+
+    async def get_many(self, ticket_ids: List[int]) -> List[Optional[GLPITicket]]:
+        """Obtém vários tickets em paralelo, na ordem dos IDs."""
+        return list(
+            await asyncio.gather(
+                *(self.get_by_id(ticket_id) for ticket_id in ticket_ids)
+            )
+        )
+
+    @abstractmethod
+    async def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um novo ticket."""
+        pass
+
+    @abstractmethod
+    async def update(self, ticket_id: int, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Atualiza um ticket existente."""
+        pass
+
+    @abstractmethod
+    async def delete(self, ticket_id: int) -> bool:
+        """Deleta um ticket."""
+        pass
+
     @abstractmethod
-    def search_by_project_tag(self, project_tag: str) -> List[GLPITicket]:
-        """Busca tickets relacionados a um projeto."""
+    async def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets relacionados a um projeto (só os ``fields``, se dados)."""
         pass
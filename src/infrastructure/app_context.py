@@ -0,0 +1,157 @@
+"""
+Contexto da aplicação: monta as dependências do GLPI uma única vez por processo.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from src.core.glpi_entities import GLPIConfig
+from src.core.glpi_use_cases import GLPITicketUseCase
+from src.core.project_progress import ProjectProgressIndex
+from src.core.use_cases import TicketRepository
+from src.infrastructure.async_glpi_client import AsyncGLPIClient
+from src.infrastructure.async_glpi_ticket_repository import (
+    AsyncGLPITicketRepository,
+)
+from src.infrastructure.cached_ticket_repository import CachingTicketRepository
+from src.infrastructure.coalescing_ticket_repository import (
+    CoalescingTicketRepository,
+)
+from src.infrastructure.glpi_client import GLPIHTTPClient
+from src.infrastructure.glpi_ticket_repository import GLPITicketRepository
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Lê uma variável de ambiente booleana (``true``/``1``)."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def load_glpi_config() -> GLPIConfig:
+    """Lê a configuração do GLPI a partir das variáveis de ambiente."""
+    return GLPIConfig(
+        base_url=os.getenv("GLPI_BASE_URL", "http://localhost/glpi/apirest.php"),
+        app_token=os.getenv("GLPI_APP_TOKEN", ""),
+        user_token=os.getenv("GLPI_USER_TOKEN", ""),
+        timeout=int(os.getenv("GLPI_TIMEOUT", 30)),
+        pool_size=int(os.getenv("GLPI_POOL_SIZE", 10)),
+        pool_idle_timeout=float(os.getenv("GLPI_POOL_IDLE_TIMEOUT", 15)),
+        session_refresh_interval=float(os.getenv("GLPI_SESSION_REFRESH_SECONDS", 600)),
+        max_retries=int(os.getenv("GLPI_MAX_RETRIES", 2)),
+        retry_backoff=float(os.getenv("GLPI_RETRY_BACKOFF", 0.2)),
+        retry_max_backoff=float(os.getenv("GLPI_RETRY_MAX_BACKOFF", 2)),
+        breaker_failure_threshold=int(os.getenv("GLPI_BREAKER_THRESHOLD", 5)),
+        breaker_recovery_timeout=float(os.getenv("GLPI_BREAKER_RECOVERY_SECONDS", 30)),
+    )
+
+
+@dataclass
+class AppContext:
+    """Dependências compartilhadas por todos os handlers do processo."""
+
+    config: GLPIConfig
+    client: GLPIHTTPClient
+    ticket_repository: TicketRepository
+    ticket_use_case: GLPITicketUseCase
+    progress_index: Optional[ProjectProgressIndex] = None
+    async_client: Optional[AsyncGLPIClient] = None
+
+    def warm_up(self) -> bool:
+        """Autentica e abre conexões com o GLPI antes de aceitar tráfego.
+
+        A renovação da sessão e a reconciliação do progresso começam mesmo
+        se a autenticação falhar: sem token a renovação não faz nada, e a
+        reconciliação volta a funcionar quando o GLPI responder.
+        """
+        self.client.start_session_refresher()
+        if self.progress_index is not None:
+            self.progress_index.start_reconciler()
+        if not self.client.ensure_session():
+            print("Aviso: não foi possível autenticar no GLPI durante o warm-up")
+            return False
+
+        opened = self.client.prime_connections()
+        print(f"Sessão GLPI inicializada ({opened} conexões abertas)")
+        return True
+
+    def close(self) -> None:
+        """Libera os recursos do contexto (sessão e conexões com o GLPI)."""
+        if self.progress_index is not None:
+            self.progress_index.stop_reconciler()
+        if self.async_client is not None:
+            self.async_client.close()
+        self.client.close()
+
+
+def build_app_context(config: Optional[GLPIConfig] = None) -> AppContext:
+    """Cria o contexto da aplicação com as dependências do GLPI."""
+    if config is None:
+        config = load_glpi_config()
+
+    client = GLPIHTTPClient(config)
+    glpi_repository = GLPITicketRepository(
+        client,
+        page_size=int(os.getenv("GLPI_PAGE_SIZE", 50)),
+        prefetch=env_flag("GLPI_PREFETCH"),
+        batch_size=int(os.getenv("GLPI_BATCH_SIZE", 50)),
+    )
+
+    ticket_repository: TicketRepository = glpi_repository
+    if env_flag("TICKET_COALESCE_ENABLED"):
+        # Abaixo do cache: as faltas simultâneas viram uma única chamada
+        ticket_repository = CoalescingTicketRepository(ticket_repository)
+    if env_flag("TICKET_CACHE_ENABLED"):
+        ticket_repository = CachingTicketRepository(
+            ticket_repository,
+            ttl=float(os.getenv("TICKET_CACHE_TTL", 30)),
+            max_entries=int(os.getenv("TICKET_CACHE_MAX_ENTRIES", 1024)),
+        )
+
+    progress_index = None
+    if env_flag("PROJECT_PROGRESS_INDEX_ENABLED"):
+        # Reconcilia direto com o GLPI, sem passar pelo cache
+        progress_index = ProjectProgressIndex(
+            glpi_repository,
+            reconcile_interval=float(
+                os.getenv("PROJECT_PROGRESS_RECONCILE_SECONDS", 300)
+            ),
+        )
+
+    # Versão assíncrona compartilha sessão e conexões com o cliente síncrono
+    async_client = AsyncGLPIClient(
+        client, max_concurrency=int(os.getenv("GLPI_ASYNC_CONCURRENCY", 10))
+    )
+    async_repository = AsyncGLPITicketRepository(
+        async_client, page_size=glpi_repository.page_size
+    )
+
+    ticket_use_case = GLPITicketUseCase(
+        ticket_repository, progress_index, async_repository
+    )
+
+    return AppContext(
+        config=config,
+        client=client,
+        ticket_repository=ticket_repository,
+        ticket_use_case=ticket_use_case,
+        progress_index=progress_index,
+        async_client=async_client,
+    )
+
+
+_app_context: Optional[AppContext] = None
+_app_context_lock = threading.Lock()
+
+
+def get_app_context() -> AppContext:
+    """Retorna o contexto do processo, criando-o na primeira chamada."""
+    global _app_context
+
+    if _app_context is None:
+        with _app_context_lock:
+            if _app_context is None:
+                _app_context = build_app_context()
+
+    return _app_context
@@ -0,0 +1,61 @@
+"""
+Cliente assíncrono para a API do GLPI.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from src.core.glpi_entities import GLPIResponse
+from src.infrastructure.glpi_client import GLPIHTTPClient
+
+
+class AsyncGLPIClient:
+    """Interface ``asyncio`` sobre o cliente HTTP do GLPI.
+
+    As requisições rodam em um executor próprio, reaproveitando a sessão, a
+    configuração e o pool de conexões keep-alive do ``GLPIHTTPClient``. Um
+    semáforo limita quantas chamadas ao GLPI ficam em andamento ao mesmo tempo.
+    """
+
+    def __init__(self, client: GLPIHTTPClient, max_concurrency: int = 10):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser maior que zero")
+
+        self.client = client
+        self.config = client.config
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="glpi-async"
+        )
+        # Um semáforo por event loop: semáforos não podem ser compartilhados
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    async def make_request(
+        self, method: str, endpoint: str, data: Optional[Dict] = None
+    ) -> GLPIResponse:
+        """Faz uma requisição ao GLPI sem bloquear o event loop."""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            return await loop.run_in_executor(
+                self._executor, self.client.make_request, method, endpoint, data
+            )
+
+    async def ensure_session(self) -> bool:
+        """Garante uma sessão ativa com o GLPI."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.client.ensure_session)
+
+    def close(self) -> None:
+        """Encerra o executor (a sessão pertence ao cliente síncrono)."""
+        self._executor.shutdown(wait=False)
+        self._semaphores.clear()
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Semáforo de concorrência do event loop atual."""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Descarta semáforos de loops encerrados (ex.: asyncio.run repetido)
+            for closed in [known for known in self._semaphores if known.is_closed()]:
+                del self._semaphores[closed]
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
@@ -0,0 +1,148 @@
+"""
+Repositório assíncrono de tickets do GLPI.
+"""
+import asyncio
+from typing import List, Optional, Sequence
+from src.core.glpi_entities import GLPITicket, TicketPage
+from src.core.use_cases import AsyncTicketRepository
+from src.infrastructure.async_glpi_client import AsyncGLPIClient
+from src.infrastructure.glpi_ticket_repository import GLPITicketMapper
+
+
+class AsyncGLPITicketRepository(GLPITicketMapper, AsyncTicketRepository):
+    """Implementação assíncrona do repositório usando a API do GLPI.
+
+    Usa o mesmo mapeamento de campos do repositório síncrono. Nas buscas, a
+    primeira página informa o total e as demais são pedidas em paralelo.
+    """
+
+    def __init__(self, client: AsyncGLPIClient, page_size: int = 50):
+        self.client = client
+        self.page_size = page_size
+
+    async def get_all(self) -> List[GLPITicket]:
+        """Obtém todos os tickets, buscando as páginas em paralelo."""
+        return await self._search_all("")
+
+    async def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID."""
+        response = await self.client.make_request("GET", f"/Ticket/{ticket_id}")
+
+        if response.is_success() and response.data:
+            return self._parse_item_data(response.data)
+
+        return None
+
+    async def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um novo ticket."""
+        if not ticket.is_valid():
+            return None
+
+        payload = {"input": self._ticket_input(ticket)}
+        response = await self.client.make_request("POST", "/Ticket", payload)
+
+        if response.is_success() and "id" in response.data:
+            ticket.id = response.data["id"]
+            return ticket
+
+        return None
+
+    async def update(self, ticket_id: int, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Atualiza um ticket existente."""
+        if not ticket.is_valid():
+            return None
+
+        payload = {"input": self._ticket_input(ticket, ticket_id)}
+        response = await self.client.make_request(
+            "PUT", f"/Ticket/{ticket_id}", payload
+        )
+
+        if response.is_success():
+            ticket.id = ticket_id
+            return ticket
+
+        return None
+
+    async def delete(self, ticket_id: int) -> bool:
+        """Deleta um ticket."""
+        response = await self.client.make_request("DELETE", f"/Ticket/{ticket_id}")
+        return response.is_success()
+
+    async def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets relacionados a um projeto."""
+        return await self._search_all(self._project_tag_query(project_tag), fields)
+
+    async def _search_all(
+        self, query: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Percorre todas as janelas de uma busca.
+
+        Sem total conhecido, segue página a página como o repositório
+        síncrono. Com o total, as janelas são pedidas em paralelo; uma janela
+        que volta curta é completada a partir de onde parou e uma que falha
+        lança ``IncompleteSearchError``, em vez de devolver parte dos
+        tickets como se fossem todos.
+        """
+        page = await self._fetch_page(query, 0, self.page_size, fields)
+        tickets = list(page.tickets)
+        if not page.has_more():
+            return tickets
+
+        if page.total is None:
+            while page.has_more():
+                page = await self._fetch_page(
+                    query, page.next_offset, self.page_size, fields
+                )
+                tickets.extend(page.tickets)
+            return tickets
+
+        # O GLPI pode devolver menos linhas que o pedido: o tamanho real da
+        # primeira página define as janelas seguintes
+        step = page.next_offset
+        windows = await asyncio.gather(
+            *(
+                self._fetch_window(
+                    query, offset, min(offset + step, page.total), fields
+                )
+                for offset in range(step, page.total, step)
+            )
+        )
+        for window in windows:
+            tickets.extend(window)
+        return tickets
+
+    async def _fetch_window(
+        self,
+        query: str,
+        offset: int,
+        end: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[GLPITicket]:
+        """Tickets da janela ``[offset, end)``, completando respostas curtas."""
+        tickets: List[GLPITicket] = []
+        while offset < end:
+            response = await self.client.make_request(
+                "GET", self._search_endpoint(query, offset, end - offset, fields)
+            )
+            page = self._page_from_response(response, offset, fields)
+            tickets.extend(page.tickets)
+            if not page.has_more():
+                # Fim dos resultados (o total pode ter diminuído desde o início)
+                break
+            offset = page.next_offset
+        return tickets
+
+    async def _fetch_page(
+        self,
+        query: str,
+        offset: int,
+        size: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> TicketPage:
+        """Busca a janela ``[offset, offset + size)`` de uma busca de tickets."""
+        response = await self.client.make_request(
+            "GET", self._search_endpoint(query, offset, size, fields)
+        )
+        return self._page_from_response(response, offset, fields)
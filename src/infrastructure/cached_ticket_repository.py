@@ -0,0 +1,230 @@
+"""
+Cache de leitura com TTL e descarte LRU na frente de um repositório de tickets.
+"""
+import copy
+import threading
+import time
+from datetime import datetime
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from src.core.glpi_entities import BatchItemResult, GLPITicket, TicketFilter
+from src.core.use_cases import TicketRepository
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Cache LRU limitado em que cada entrada expira após ``ttl`` segundos."""
+
+    def __init__(
+        self, max_entries: int = 1024, ttl: float = 30.0, keep_stale: bool = False
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Mantém as entradas vencidas (até o descarte LRU) para revalidação
+        self.keep_stale = keep_stale
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Incrementada a cada invalidação; leituras iniciadas antes dela não
+        # podem repovoar o cache com dados antigos
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor ainda válido para a chave ou ``default``."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None and not self.keep_stale:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor da chave mesmo vencido, sem contar acerto ou falta."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return default if entry is None else entry[0]
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Armazena o valor, descartando as entradas menos usadas se preciso.
+
+        Com ``generation``, o valor só é gravado se nenhuma invalidação
+        ocorreu desde que ela foi lida.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a entrada da chave, se existir."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self.generation += 1
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class CachingTicketRepository(TicketRepository):
+    """Decorador de ``TicketRepository`` com cache de leitura.
+
+    ``get_by_id`` e ``search_by_project_tag`` são servidos do cache enquanto
+    as entradas forem válidas. Um ticket vencido que tenha data de
+    modificação é revalidado com ``get_modified_date``: se não mudou, volta a
+    valer sem buscar o ticket inteiro. Escritas invalidam o ticket afetado e
+    todas as buscas por projeto, já que qualquer alteração pode mudar seus
+    resultados.
+    Os objetos devolvidos são cópias, para que quem os altera não corrompa o
+    cache.
+    """
+
+    def __init__(
+        self, repository: TicketRepository, ttl: float = 30.0, max_entries: int = 1024
+    ):
+        self.repository = repository
+        self.tickets = TTLCache(max_entries=max_entries, ttl=ttl, keep_stale=True)
+        self.revalidations = 0
+        self.searches = TTLCache(max_entries=max_entries, ttl=ttl)
+
+    def get_all(self) -> List[GLPITicket]:
+        """Obtém todos os tickets (sem cache)."""
+        return self.repository.get_all()
+
+    def iter_all(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        ticket_filter: Optional[TicketFilter] = None,
+    ) -> Iterator[GLPITicket]:
+        """Itera sobre os tickets (sem cache)."""
+        return self.repository.iter_all(
+            offset=offset, limit=limit, fields=fields, ticket_filter=ticket_filter
+        )
+
+    def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID, consultando o cache primeiro."""
+        ticket = self.tickets.get(ticket_id, _MISSING)
+        if ticket is _MISSING:
+            generation = self.tickets.generation
+            ticket = self._revalidate(ticket_id)
+            if ticket is None:
+                ticket = self.repository.get_by_id(ticket_id)
+                if ticket is None:
+                    return None
+            self.tickets.set(ticket_id, ticket, generation)
+
+        return copy.copy(ticket)
+
+    def get_modified_date(self, ticket_id: int) -> Optional[datetime]:
+        """Data da última modificação (sem cache)."""
+        return self.repository.get_modified_date(ticket_id)
+
+    def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um ticket e invalida as buscas por projeto."""
+        created = self.repository.create(ticket)
+        self.searches.clear()
+        return created
+
+    def update(self, ticket_id: int, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Atualiza um ticket e invalida as entradas afetadas."""
+        updated = self.repository.update(ticket_id, ticket)
+        self._invalidate(ticket_id)
+        return updated
+
+    def delete(self, ticket_id: int) -> bool:
+        """Deleta um ticket e invalida as entradas afetadas."""
+        deleted = self.repository.delete(ticket_id)
+        self._invalidate(ticket_id)
+        return deleted
+
+    def create_many(self, tickets: List[GLPITicket]) -> List[BatchItemResult]:
+        """Cria vários tickets e invalida as buscas por projeto."""
+        results = self.repository.create_many(tickets)
+        self.searches.clear()
+        return results
+
+    def update_many(
+        self, updates: List[Tuple[int, GLPITicket]]
+    ) -> List[BatchItemResult]:
+        """Atualiza vários tickets e invalida as entradas afetadas."""
+        results = self.repository.update_many(updates)
+        for ticket_id, _ in updates:
+            self.tickets.pop(ticket_id)
+        self.searches.clear()
+        return results
+
+    def delete_many(self, ticket_ids: List[int]) -> List[BatchItemResult]:
+        """Deleta vários tickets e invalida as entradas afetadas."""
+        results = self.repository.delete_many(ticket_ids)
+        for ticket_id in ticket_ids:
+            self.tickets.pop(ticket_id)
+        self.searches.clear()
+        return results
+
+    def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets de um projeto, consultando o cache primeiro."""
+        key = (project_tag, tuple(fields) if fields is not None else None)
+        tickets = self.searches.get(key)
+        if tickets is None:
+            generation = self.searches.generation
+            tickets = self.repository.search_by_project_tag(project_tag, fields)
+            self.searches.set(key, tickets, generation)
+
+        return [copy.copy(ticket) for ticket in tickets]
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de acertos, faltas, descartes e tamanho do cache."""
+        return {
+            "hits": self.tickets.hits + self.searches.hits,
+            "misses": self.tickets.misses + self.searches.misses,
+            "evictions": self.tickets.evictions + self.searches.evictions,
+            "size": len(self.tickets) + len(self.searches),
+            "revalidations": self.revalidations,
+        }
+
+    def invalidate(self, ticket_id: Optional[int] = None) -> None:
+        """Descarta o ticket (se dado) e as buscas, aqui e no decorado."""
+        if ticket_id is not None:
+            self.tickets.pop(ticket_id)
+        self.searches.clear()
+        self.repository.invalidate(ticket_id)
+
+    def _invalidate(self, ticket_id: int) -> None:
+        """Descarta o ticket e todas as buscas por projeto."""
+        self.tickets.pop(ticket_id)
+        self.searches.clear()
+
+    def _revalidate(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Reaproveita o ticket vencido se sua data de modificação não mudou."""
+        stale = self.tickets.get_stale(ticket_id)
+        if stale is None or stale.modified_date is None:
+            return None
+
+        if self.repository.get_modified_date(ticket_id) != stale.modified_date:
+            return None
+
+        self.revalidations += 1
+        return stale
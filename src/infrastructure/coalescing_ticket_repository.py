@@ -0,0 +1,219 @@
+"""
+Coalescência de leituras simultâneas e idênticas ao repositório de tickets.
+"""
+import copy
+import threading
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from src.core.glpi_entities import (
+    BatchItemResult,
+    GLPITicket,
+    TicketBatch,
+    TicketFilter,
+)
+from src.core.use_cases import TicketRepository
+from src.infrastructure.metrics import REGISTRY
+
+TICKET_READS = REGISTRY.counter(
+    "ticket_repository_reads_total",
+    "Leituras de tickets: chamadas ao repositório (upstream) ou atendidas por "
+    "uma chamada idêntica em andamento (coalesced)",
+    ("operation", "result"),
+)
+
+
+class _Call:
+    """Chamada em andamento e o resultado compartilhado com quem espera."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Executa uma única chamada por chave entre threads concorrentes.
+
+    Quem chega enquanto a chamada da mesma chave está em andamento espera e
+    recebe o mesmo resultado (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.followers = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Executa ``func`` ou aguarda a chamada em andamento da mesma chave.
+
+        Devolve ``(resultado, compartilhado)``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def forget(self) -> None:
+        """Faz as próximas leituras iniciarem chamadas novas.
+
+        As chamadas em andamento terminam normalmente para quem já espera.
+        """
+        with self._lock:
+            self._calls.clear()
+
+
+class CoalescingTicketRepository(TicketRepository):
+    """Decorador de ``TicketRepository`` que agrupa leituras idênticas.
+
+    ``get_all``, ``get_by_id``, ``get_modified_date``,
+    ``search_by_project_tag`` e ``search_batch_by_project_tag`` chamados ao
+    mesmo tempo com os mesmos argumentos compartilham uma única chamada ao
+    repositório. Todos os chamadores, inclusive o que fez a chamada, recebem
+    cópias dos tickets: o resultado compartilhado nunca sai daqui.
+    Após uma escrita, as leituras seguintes não aproveitam chamadas iniciadas
+    antes dela.
+    """
+
+    def __init__(self, repository: TicketRepository):
+        self.repository = repository
+        self.flights = SingleFlight()
+
+    def get_all(self) -> List[GLPITicket]:
+        """Obtém todos os tickets."""
+        return self._coalesce("get_all", (), self.repository.get_all)
+
+    def iter_all(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        ticket_filter: Optional[TicketFilter] = None,
+    ) -> Iterator[GLPITicket]:
+        """Itera sobre os tickets (sem coalescência: o consumo é incremental)."""
+        return self.repository.iter_all(
+            offset=offset, limit=limit, fields=fields, ticket_filter=ticket_filter
+        )
+
+    def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID."""
+        return self._coalesce(
+            "get_by_id", (ticket_id,), lambda: self.repository.get_by_id(ticket_id)
+        )
+
+    def get_modified_date(self, ticket_id: int) -> Optional[datetime]:
+        """Data da última modificação de um ticket."""
+        return self._coalesce(
+            "get_modified_date",
+            (ticket_id,),
+            lambda: self.repository.get_modified_date(ticket_id),
+        )
+
+    def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
+        """Busca tickets relacionados a um projeto."""
+        key = (project_tag, tuple(fields) if fields is not None else None)
+        return self._coalesce(
+            "search_by_project_tag",
+            key,
+            lambda: self.repository.search_by_project_tag(project_tag, fields),
+        )
+
+    def search_batch_by_project_tag(self, project_tag: str) -> TicketBatch:
+        """Tickets de um projeto em colunas, para contagens."""
+        return self._coalesce(
+            "search_batch_by_project_tag",
+            (project_tag,),
+            lambda: self.repository.search_batch_by_project_tag(project_tag),
+        )
+
+    def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um novo ticket."""
+        return self._write(self.repository.create, ticket)
+
+    def update(self, ticket_id: int, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Atualiza um ticket existente."""
+        return self._write(self.repository.update, ticket_id, ticket)
+
+    def delete(self, ticket_id: int) -> bool:
+        """Deleta um ticket."""
+        return self._write(self.repository.delete, ticket_id)
+
+    def create_many(self, tickets: List[GLPITicket]) -> List[BatchItemResult]:
+        """Cria vários tickets."""
+        return self._write(self.repository.create_many, tickets)
+
+    def update_many(
+        self, updates: List[Tuple[int, GLPITicket]]
+    ) -> List[BatchItemResult]:
+        """Atualiza vários tickets."""
+        return self._write(self.repository.update_many, updates)
+
+    def delete_many(self, ticket_ids: List[int]) -> List[BatchItemResult]:
+        """Deleta vários tickets."""
+        return self._write(self.repository.delete_many, ticket_ids)
+
+    def invalidate(self, ticket_id: Optional[int] = None) -> None:
+        """Descarta as leituras em andamento, como após uma escrita."""
+        self.flights.forget()
+        self.repository.invalidate(ticket_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Leituras feitas ao repositório e leituras que aproveitaram outra."""
+        return {
+            "upstream": self.flights.leaders,
+            "coalesced": self.flights.followers,
+        }
+
+    def _coalesce(self, operation: str, args: Tuple, read: Callable[[], Any]):
+        """Executa a leitura ou aproveita a idêntica em andamento."""
+        result, shared = self.flights.do((operation,) + args, read)
+        TICKET_READS.inc(operation, "coalesced" if shared else "upstream")
+        # Cada chamador recebe os próprios objetos, como se tivesse lido
+        # sozinho; se o primeiro recebesse o original, poderia alterá-lo
+        # enquanto os demais ainda o copiam
+        if isinstance(result, list):
+            return [copy.copy(ticket) for ticket in result]
+        return copy.copy(result)
+
+    def _write(self, operation: Callable, *args):
+        """Executa uma escrita e descarta as leituras em andamento."""
+        try:
+            return operation(*args)
+        finally:
+            self.flights.forget()
@@ -1,12 +1,55 @@
 """
 Cliente HTTP para a API do GLPI.
 """
+import http.client
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
-from typing import Dict, Optional
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from src.core.glpi_entities import GLPIConfig, GLPIResponse
+from src.infrastructure.http_pool import HTTPConnectionPool
+from src.infrastructure.metrics import REGISTRY
+from src.infrastructure.resilience import (
+    GLPI_RETRIES,
+    CircuitBreakerRegistry,
+    RetryPolicy,
+)
+
+GLPI_REQUESTS = REGISTRY.counter(
+    "glpi_requests_total",
+    "Requisições à API do GLPI por endpoint e status (0 = falha de conexão)",
+    ("method", "endpoint", "status"),
+)
+GLPI_REQUEST_DURATION = REGISTRY.histogram(
+    "glpi_request_duration_seconds",
+    "Latência das requisições à API do GLPI",
+    ("method", "endpoint"),
+)
+GLPI_AUTHENTICATIONS = REGISTRY.counter(
+    "glpi_authentications_total",
+    "Autenticações (initSession) no GLPI por resultado",
+    ("result",),
+)
+
+GLPI_SESSION_RENEWALS = REGISTRY.counter(
+    "glpi_session_renewals_total",
+    "Sessões do GLPI renovadas por motivo (expired: recusada em uma "
+    "requisição; proactive: expirada durante a ociosidade) e resultado",
+    ("reason", "result"),
+)
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+# Status das respostas que não vieram do GLPI: falha de conexão ou timeout
+# (``0``) e resposta aceita com corpo que não é JSON (``-1``)
+STATUS_CONNECTION_ERROR = 0
+STATUS_INVALID_RESPONSE = -1
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Endpoint do GLPI sem query string e com IDs trocados por ``{id}``."""
+    return _NUMERIC_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
 
 
 class GLPIHTTPClient:
@@ -15,41 +58,181 @@ class GLPIHTTPClient:
     def __init__(self, config: GLPIConfig):
         self.config = config
         self.session_token = None
+        self._auth_lock = threading.Lock()
+        self._last_activity = time.monotonic()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresher = threading.Event()
+        self.retry_policy = RetryPolicy(
+            max_retries=config.max_retries,
+            base_delay=config.retry_backoff,
+            max_delay=config.retry_max_backoff,
+        )
+        self.breakers = None
+        if config.breaker_failure_threshold > 0:
+            self.breakers = CircuitBreakerRegistry(
+                failure_threshold=config.breaker_failure_threshold,
+                recovery_timeout=config.breaker_recovery_timeout,
+            )
+        self.pool = HTTPConnectionPool(
+            max_size=config.pool_size,
+            idle_timeout=config.pool_idle_timeout,
+            timeout=config.timeout,
+        )
 
     def authenticate(self) -> bool:
-        """Autentica na API do GLPI."""
-        try:
-            headers = {
-                "Content-Type": "application/json",
-                "App-Token": self.config.app_token,
-            }
+        """Autentica na API do GLPI.
+
+        Passa pelo circuit breaker de ``/initSession``: com o GLPI fora do
+        ar, o circuito abre e as threads que esperam a sessão falham na hora,
+        em vez de esperar cada uma o timeout completo.
+        """
+        breaker = self.breakers.get("/initSession") if self.breakers else None
+        if breaker is not None and not breaker.allow():
+            GLPI_AUTHENTICATIONS.inc("rejected")
+            return False
 
-            # Se tiver user_token, adiciona ao header
-            if self.config.user_token:
-                headers["Authorization"] = f"user_token {self.config.user_token}"
+        authenticated, overloaded = self._authenticate()
+        if breaker is not None:
+            if overloaded:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        GLPI_AUTHENTICATIONS.inc("success" if authenticated else "failure")
+        return authenticated
 
-            req = urllib.request.Request(
-                f"{self.config.base_url}/initSession", headers=headers, method="GET"
-            )
+    def _authenticate(self) -> Tuple[bool, bool]:
+        """Abre a sessão (``initSession``) e guarda o token.
 
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                data = json.loads(response.read().decode())
-                self.session_token = data.get("session_token")
+        Devolve ``(autenticou, sobrecarga)``; sobrecarga é falha de conexão,
+        timeout, 5xx ou 429, como em ``_is_overload``.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "App-Token": self.config.app_token,
+        }
 
-                return self.session_token is not None
+        # Se tiver user_token, adiciona ao header
+        if self.config.user_token:
+            headers["Authorization"] = f"user_token {self.config.user_token}"
 
-        except Exception as e:
+        try:
+            response = self.pool.request(
+                "GET", f"{self.config.base_url}/initSession", headers=headers
+            )
+        except (OSError, http.client.HTTPException) as e:
             print(f"Erro na autenticação: {e}")
-            return False
+            return False, True
+
+        if response.status >= 400:
+            print(f"Erro na autenticação: HTTP {response.status}: {response.reason}")
+            return False, response.status == 429 or response.status >= 500
+
+        try:
+            data = json.loads(response.body.decode())
+        except ValueError as e:
+            print(f"Erro na autenticação: {e}")
+            return False, False
+
+        self.session_token = data.get("session_token")
+        self._last_activity = time.monotonic()
+        return self.session_token is not None, False
+
+    def ensure_session(self) -> bool:
+        """Garante uma sessão ativa, autenticando uma única vez entre threads."""
+        if self.session_token:
+            return True
+
+        with self._auth_lock:
+            # Outra thread pode ter autenticado enquanto esperávamos o lock
+            if self.session_token:
+                return True
+            return self.authenticate()
 
     def make_request(
         self, method: str, endpoint: str, data: Optional[Dict] = None
     ) -> GLPIResponse:
-        """Faz uma requisição para a API do GLPI."""
-        if not self.session_token:
-            if not self.authenticate():
-                return GLPIResponse(401, {}, "Falha na autenticação")
+        """Faz uma requisição para a API do GLPI.
+
+        Se o GLPI recusar a sessão (401), reautentica uma única vez entre as
+        threads e repete a requisição. Falhas de conexão, 5xx e 429 em métodos
+        idempotentes são repetidas com backoff; com o circuito do endpoint
+        aberto, a chamada falha na hora com status 503.
+        """
+        if not self.ensure_session():
+            return GLPIResponse(401, {}, "Falha na autenticação")
+
+        template = endpoint_template(endpoint)
+        breaker = self.breakers.get(template) if self.breakers else None
+        delays = self.retry_policy.delays(method)
+        while True:
+            if breaker is not None and not breaker.allow():
+                return GLPIResponse(
+                    503, {}, f"GLPI indisponível: circuito aberto para {template}"
+                )
+
+            token = self.session_token
+            response = self._send(method, endpoint, data, token)
+            if self._session_rejected(response) and self.renew_session(
+                token, "expired"
+            ):
+                response = self._send(method, endpoint, data, self.session_token)
+
+            if not self._is_overload(response):
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+
+            if breaker is not None:
+                breaker.record_failure()
+            delay = next(delays, None)
+            if delay is None:
+                return response
+            GLPI_RETRIES.inc(method, template)
+            time.sleep(delay)
+
+    @staticmethod
+    def _is_overload(response: GLPIResponse) -> bool:
+        """Falha de conexão, timeout, 5xx ou 429: o GLPI não deu conta.
 
+        Um corpo ilegível (``STATUS_INVALID_RESPONSE``) não conta: o GLPI
+        respondeu, e um POST pode já ter sido aplicado.
+        """
+        status = response.status_code
+        return status == STATUS_CONNECTION_ERROR or status == 429 or status >= 500
+
+    def renew_session(self, stale_token: Optional[str], reason: str) -> bool:
+        """Troca a sessão recusada por uma nova, uma única vez entre threads.
+
+        Se outra thread já renovou a sessão ``stale_token``, só aproveita o
+        token novo.
+        """
+        with self._auth_lock:
+            if self.session_token and self.session_token != stale_token:
+                return True
+            self.session_token = None
+            renewed = self.authenticate()
+        GLPI_SESSION_RENEWALS.inc(reason, "success" if renewed else "failure")
+        return renewed
+
+    @staticmethod
+    def _session_rejected(response: GLPIResponse) -> bool:
+        """Indica se o GLPI recusou o token de sessão (expirado ou encerrado)."""
+        data = response.data
+        return (
+            response.status_code == 401
+            and isinstance(data, list)
+            and bool(data)
+            and str(data[0]).startswith("ERROR_SESSION_TOKEN")
+        )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        token: Optional[str],
+    ) -> GLPIResponse:
+        """Envia uma requisição com o token de sessão informado."""
         url = f"{self.config.base_url}{endpoint}"
         headers = {
             "Content-Type": "application/json",
@@ -57,78 +240,126 @@ class GLPIHTTPClient:
         }
 
         # Adiciona session token se disponível
-        if self.session_token:
-            headers["Session-Token"] = self.session_token
+        if token:
+            headers["Session-Token"] = token
+
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            return GLPIResponse(405, {}, "Método não suportado")
 
+        body = None
+        if method in ("POST", "PUT") or (method == "DELETE" and data is not None):
+            body = json.dumps(data).encode("utf-8")
+
+        template = endpoint_template(endpoint)
+        start = time.perf_counter()
         try:
-            if method == "GET":
-                req = urllib.request.Request(url, headers=headers, method="GET")
-                with urllib.request.urlopen(
-                    req, timeout=self.config.timeout
-                ) as response:
-                    data = json.loads(response.read().decode())
-                    return GLPIResponse(response.getcode(), data)
-
-            elif method == "POST":
-                json_data = json.dumps(data).encode("utf-8")
-                req = urllib.request.Request(
-                    url, data=json_data, headers=headers, method="POST"
-                )
-                with urllib.request.urlopen(
-                    req, timeout=self.config.timeout
-                ) as response:
-                    data = json.loads(response.read().decode())
-                    return GLPIResponse(response.getcode(), data)
-
-            elif method == "PUT":
-                json_data = json.dumps(data).encode("utf-8")
-                req = urllib.request.Request(
-                    url, data=json_data, headers=headers, method="PUT"
-                )
-                with urllib.request.urlopen(
-                    req, timeout=self.config.timeout
-                ) as response:
-                    data = json.loads(response.read().decode())
-                    return GLPIResponse(response.getcode(), data)
-
-            elif method == "DELETE":
-                req = urllib.request.Request(url, headers=headers, method="DELETE")
-                with urllib.request.urlopen(
-                    req, timeout=self.config.timeout
-                ) as response:
-                    data = json.loads(response.read().decode())
-                    return GLPIResponse(response.getcode(), data)
-
-        except urllib.error.HTTPError as e:
+            response = self.pool.request(method, url, body=body, headers=headers)
+        except (OSError, http.client.HTTPException) as e:
+            self._record(method, template, STATUS_CONNECTION_ERROR, start)
+            return GLPIResponse(
+                STATUS_CONNECTION_ERROR,
+                {},
+                f"Erro na conexão: {str(e)} - "
+                "Verifique se a URL do GLPI está correta e acessível",
+            )
+
+        self._record(method, template, response.status, start)
+        if response.status >= 400:
             error_data = {}
             try:
-                error_data = json.loads(e.read().decode())
+                error_data = json.loads(response.body.decode())
             except Exception:
                 pass
-            return GLPIResponse(e.code, error_data, f"Erro HTTP {e.code}: {e.reason}")
-
-        except urllib.error.URLError as e:
             return GLPIResponse(
-                0,
-                {},
-                f"Erro na conexão: {str(e.reason)} - "
-                "Verifique se a URL do GLPI está correta e acessível",
+                response.status,
+                error_data,
+                f"Erro HTTP {response.status}: {response.reason}",
             )
 
+        # Qualquer resposta aceita renova o prazo de ociosidade da sessão
+        self._last_activity = time.monotonic()
+        try:
+            response_data = json.loads(response.body.decode()) if response.body else {}
         except Exception as e:
-            return GLPIResponse(0, {}, f"Erro desconhecido: {str(e)}")
+            return GLPIResponse(
+                STATUS_INVALID_RESPONSE, {}, f"Resposta inválida do GLPI: {str(e)}"
+            )
+
+        return GLPIResponse(response.status, response_data, headers=response.headers)
+
+    @staticmethod
+    def _record(method: str, template: str, status: int, start: float) -> None:
+        """Registra a chamada ao GLPI nas métricas."""
+        GLPI_REQUEST_DURATION.observe(time.perf_counter() - start, method, template)
+        GLPI_REQUESTS.inc(method, template, status)
+
+    def prime_connections(self, count: Optional[int] = None) -> int:
+        """Abre conexões keep-alive com o GLPI antes do primeiro uso."""
+        if count is None:
+            count = self.config.pool_size
+        return self.pool.prime(self.config.base_url, count)
+
+    def start_session_refresher(self) -> None:
+        """Inicia a thread que mantém a sessão viva enquanto o processo fica ocioso.
+
+        Sem ``session_refresh_interval`` a sessão só é renovada quando o GLPI
+        a recusa.
+        """
+        if self._refresher is not None or self.config.session_refresh_interval <= 0:
+            return
+
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="glpi-session-refresher", daemon=True
+        )
+        self._refresher.start()
 
-        # Fallback se nenhum método corresponder
-        return GLPIResponse(405, {}, "Método não suportado")
+    def stop_session_refresher(self) -> None:
+        """Encerra a thread de renovação da sessão."""
+        self._stop_refresher.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def refresh_session(self) -> bool:
+        """Toca a sessão ociosa há ``session_refresh_interval`` segundos.
+
+        Uma chamada leve (``getActiveProfile``) renova o prazo de ociosidade;
+        se a sessão já tiver expirado, autentica de novo.
+        """
+        token = self.session_token
+        idle = time.monotonic() - self._last_activity
+        if not token or idle < self.config.session_refresh_interval:
+            return True
+
+        response = self._send("GET", "/getActiveProfile", None, token)
+        if self._session_rejected(response):
+            return self.renew_session(token, "proactive")
+        return response.is_success()
+
+    def _refresh_loop(self) -> None:
+        """Verifica a ociosidade da sessão a cada metade do intervalo."""
+        while not self._stop_refresher.wait(self.config.session_refresh_interval / 2):
+            try:
+                self.refresh_session()
+            except Exception as e:
+                print(f"Erro ao renovar a sessão do GLPI: {e}")
 
     def logout(self) -> bool:
         """Encerra sessão na API do GLPI."""
         try:
-            if self.session_token:
-                response = self.make_request("GET", "/killSession")
-                self.session_token = None
-                return response.is_success()
+            with self._auth_lock:
+                token, self.session_token = self.session_token, None
+            if token:
+                # Sem repetição: uma sessão recusada já está encerrada
+                return self._send("GET", "/killSession", None, token).is_success()
             return True
         except Exception as e:
             print(f"Erro ao encerrar sessão: {e}")
             return False
+
+    def close(self) -> None:
+        """Encerra a sessão e fecha as conexões do pool."""
+        self.stop_session_refresher()
+        self.logout()
+        self.pool.close()
@@ -2,52 +2,264 @@
 Repositório para gerenciar tickets do GLPI.
 """
 import urllib.parse
-from typing import List, Optional, Dict, Any
-from src.core.glpi_entities import GLPITicket, TicketStatus, TicketPriority
-from src.core.use_cases import TicketRepository
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from src.core.glpi_entities import (
+    BatchItemResult,
+    GLPIResponse,
+    GLPITicket,
+    TicketBatch,
+    TicketFilter,
+    TicketPage,
+    TicketPriority,
+    TicketStatus,
+)
+from src.core.use_cases import BATCH_FIELDS, TicketRepository
 from src.infrastructure.glpi_client import GLPIHTTPClient
 
+# Critério de busca pelo ID do ticket
+SEARCH_FIELD_ID = "2"
+SEARCH_FIELD_DATE_MOD = "19"
+SEARCH_FIELD_DATE_CREATION = "15"
+
+# Campo do ticket -> opção de busca do GLPI (os números são os IDs dos campos
+# no GLPI). O ``id`` vem sempre na chave ``id`` de cada linha.
+TICKET_COLUMNS: Dict[str, str] = {
+    "name": "1",
+    "content": "21",
+    "status": "12",
+    "priority": "3",
+    "category_id": "7",
+    "assigned_user_id": "5",
+    "assigned_group_id": "8",
+    "modified_date": SEARCH_FIELD_DATE_MOD,
+}
+
+# Campo do ticket -> campo do item em ``GET /Ticket/{id}``, que devolve os
+# nomes dos campos do GLPI em vez das opções de busca
+ITEM_FIELDS: Dict[str, str] = {
+    "name": "name",
+    "content": "content",
+    "status": "status",
+    "priority": "priority",
+    "category_id": "itilcategories_id",
+    "due_date": "time_to_resolve",
+    "created_date": "date_creation",
+    "modified_date": "date_mod",
+}
+
+# Campo de ordenação -> opção de busca do GLPI (parâmetro ``sort``)
+SORT_COLUMNS: Dict[str, str] = {
+    "id": SEARCH_FIELD_ID,
+    **TICKET_COLUMNS,
+    "created_date": SEARCH_FIELD_DATE_CREATION,
+}
+
+
+class IncompleteSearchError(RuntimeError):
+    """Uma página da busca falhou e o resultado ficaria incompleto."""
+
+    def __init__(self, offset: int, status_code: int):
+        super().__init__(
+            f"Falha ao buscar tickets a partir de {offset} (HTTP {status_code})"
+        )
+        self.offset = offset
+        self.status_code = status_code
 
-class GLPITicketRepository(TicketRepository):
-    """Implementação do repositório de tickets usando a API do GLPI."""
 
-    def __init__(self, glpi_client: GLPIHTTPClient):
-        self.client = glpi_client
+def _range_exceeded(response: GLPIResponse) -> bool:
+    """Indica se o GLPI recusou a janela por começar após o total."""
+    data = response.data
+    return (
+        response.status_code == 400
+        and isinstance(data, list)
+        and bool(data)
+        and data[0] == "ERROR_RANGE_EXCEED_TOTAL"
+    )
 
-    def get_all(self) -> List[GLPITicket]:
-        """Obtém todos os tickets."""
-        # Busca os últimos 50 tickets (limitado para evitar sobrecarga)
-        response = self.client.make_request("GET", "/search/Ticket?range=0-49")
 
-        if response.is_success():
-            tickets_data = response.data.get("data", [])
-            tickets = []
+def _identity(value: Any) -> Any:
+    return value
 
-            for ticket_data in tickets_data:
-                ticket = self._parse_ticket_data(ticket_data)
-                if ticket:
-                    tickets.append(ticket)
 
-            return tickets
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """Converte datas do GLPI (``AAAA-MM-DD HH:MM:SS``) para ``datetime``."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
 
-        return []
 
-    def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
-        """Obtém um ticket pelo ID."""
-        response = self.client.make_request("GET", f"/Ticket/{ticket_id}")
+def _format_datetime(value: datetime) -> str:
+    """Data no formato das buscas do GLPI (``AAAA-MM-DD HH:MM:SS``)."""
+    return value.strftime("%Y-%m-%d %H:%M:%S")
 
-        if response.is_success() and response.data:
-            return self._parse_ticket_data(response.data)
 
-        return None
+def _criterion(prefix: str, field: str, searchtype: str, value: Any) -> List[str]:
+    """Parâmetros de um critério de busca do GLPI."""
+    return [
+        f"{prefix}[field]={field}",
+        f"{prefix}[searchtype]={searchtype}",
+        f"{prefix}[value]={urllib.parse.quote(str(value))}",
+    ]
 
-    def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
-        """Cria um novo ticket."""
-        if not ticket.is_valid():
-            return None
 
-        payload = {
-            "input": {
+_STATUS_CODES = frozenset(status.value for status in TicketStatus)
+_PRIORITY_CODES = frozenset(priority.value for priority in TicketPriority)
+
+_COLUMN_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "name": lambda value: value or "",
+    "content": lambda value: value or "",
+    "status": lambda value: TicketStatus(int(value if value is not None else 1)),
+    "priority": lambda value: TicketPriority(int(value if value is not None else 3)),
+    "due_date": _parse_datetime,
+    "created_date": _parse_datetime,
+    "modified_date": _parse_datetime,
+}
+
+
+class GLPITicketMapper:
+    """Conversão entre tickets e os formatos da API do GLPI.
+
+    Compartilhada pelos repositórios síncrono e assíncrono.
+    """
+
+    @staticmethod
+    def _project_tag_query(project_tag: str) -> str:
+        """Critério de busca dos tickets de um projeto (nome contém a tag)."""
+        search_query = urllib.parse.quote(f"%{project_tag}%")
+        return (
+            f"criteria[0][field]=1&criteria[0][searchtype]=contains"
+            f"&criteria[0][value]={search_query}"
+        )
+
+    @staticmethod
+    def _filter_query(ticket_filter: Optional[TicketFilter]) -> str:
+        """Critérios de busca (``criteria[n]``) e ordenação de um filtro.
+
+        Cada filtro vira um critério ligado aos demais por ``AND``; vários
+        status ou prioridades viram um grupo de critérios ligados por ``OR``.
+        Assim o GLPI filtra e ordena antes de paginar.
+        """
+        if ticket_filter is None:
+            return ""
+
+        groups: List[List[Tuple[str, str, Any]]] = []
+        if ticket_filter.statuses:
+            column = TICKET_COLUMNS["status"]
+            groups.append([(column, "equals", s.value) for s in ticket_filter.statuses])
+        if ticket_filter.priorities:
+            column = TICKET_COLUMNS["priority"]
+            groups.append(
+                [(column, "equals", p.value) for p in ticket_filter.priorities]
+            )
+        for name in ("assigned_user_id", "assigned_group_id", "category_id"):
+            value = getattr(ticket_filter, name)
+            if value is not None:
+                groups.append([(TICKET_COLUMNS[name], "equals", value)])
+        for column, after, before in (
+            (
+                SEARCH_FIELD_DATE_MOD,
+                ticket_filter.modified_after,
+                ticket_filter.modified_before,
+            ),
+            (
+                SEARCH_FIELD_DATE_CREATION,
+                ticket_filter.created_after,
+                ticket_filter.created_before,
+            ),
+        ):
+            if after is not None:
+                groups.append([(column, "morethan", _format_datetime(after))])
+            if before is not None:
+                groups.append([(column, "lessthan", _format_datetime(before))])
+
+        params: List[str] = []
+        for index, group in enumerate(groups):
+            prefix = f"criteria[{index}]"
+            if index:
+                params.append(f"{prefix}[link]=AND")
+            if len(group) == 1:
+                params.extend(_criterion(prefix, *group[0]))
+                continue
+            for position, criterion in enumerate(group):
+                nested = f"{prefix}[criteria][{position}]"
+                if position:
+                    params.append(f"{nested}[link]=OR")
+                params.extend(_criterion(nested, *criterion))
+
+        if ticket_filter.sort is not None:
+            order = "DESC" if ticket_filter.descending else "ASC"
+            params.append(f"sort={SORT_COLUMNS[ticket_filter.sort]}&order={order}")
+        return "&".join(params)
+
+    @staticmethod
+    def _search_endpoint(
+        query: str, offset: int, size: int, fields: Optional[Sequence[str]] = None
+    ) -> str:
+        """Endpoint da janela ``[offset, offset + size)`` de uma busca.
+
+        Com ``fields``, pede ao GLPI só as colunas desses campos
+        (``forcedisplay``).
+        """
+        params = [query] if query else []
+        if fields is not None:
+            columns = [
+                TICKET_COLUMNS[name] for name in fields if name in TICKET_COLUMNS
+            ]
+            params.extend(
+                f"forcedisplay[{index}]={column}"
+                for index, column in enumerate(columns)
+            )
+        params.append(f"range={offset}-{offset + size - 1}")
+        return f"/search/Ticket?{'&'.join(params)}"
+
+    def _page_from_response(
+        self,
+        response: GLPIResponse,
+        offset: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> TicketPage:
+        """Monta a página de tickets a partir da resposta de uma busca.
+
+        Lança ``IncompleteSearchError`` se o GLPI não devolveu a página: parar
+        ali faria a busca parecer completa. Uma janela que começa após o
+        total é só o fim dos resultados.
+        """
+        if not response.is_success():
+            if _range_exceeded(response):
+                return TicketPage([], offset, None, None)
+            raise IncompleteSearchError(offset, response.status_code)
+
+        rows = response.data.get("data", [])
+        total = self._parse_total(response)
+        tickets = []
+
+        for ticket_data in rows:
+            ticket = self._parse_ticket_data(ticket_data, fields)
+            if ticket:
+                tickets.append(ticket)
+
+        # Avança pelo número de linhas devolvidas: o GLPI pode limitar a janela
+        next_offset = offset + len(rows)
+        has_more = bool(rows) and (total is None or next_offset < total)
+
+        return TicketPage(tickets, offset, total, next_offset if has_more else None)
+
+    @staticmethod
+    def _ticket_input(
+        ticket: GLPITicket, ticket_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Campos de entrada do GLPI para criar ou atualizar um ticket."""
+        ticket_input: Dict[str, Any] = {}
+        if ticket_id is not None:
+            ticket_input["id"] = ticket_id
+
+        ticket_input.update(
+            {
                 "name": ticket.name,
                 "content": ticket.content,
                 "status": ticket.status.value,
@@ -56,11 +268,150 @@ class GLPITicketRepository(TicketRepository):
                 "users_id_tech": ticket.assigned_user_id,
                 "groups_id_tech": ticket.assigned_group_id,
             }
-        }
+        )
 
         if ticket.due_date:
-            payload["input"]["time_to_resolve"] = ticket.due_date.isoformat()
+            ticket_input["time_to_resolve"] = ticket.due_date.isoformat()
+
+        return ticket_input
+
+    @staticmethod
+    def _parse_total(response: GLPIResponse) -> Optional[int]:
+        """Extrai o total de resultados de ``totalcount`` ou ``Content-Range``."""
+        total = response.data.get("totalcount")
+        if total is not None:
+            return int(total)
+
+        content_range = {
+            key.lower(): value for key, value in response.headers.items()
+        }.get("content-range", "")
+        if "/" in content_range:
+            try:
+                return int(content_range.rsplit("/", 1)[1])
+            except ValueError:
+                return None
+
+        return None
+
+    @staticmethod
+    def _add_rows(batch: TicketBatch, rows: List[Dict[str, Any]]) -> None:
+        """Acrescenta as linhas de uma busca ao lote, sem criar tickets.
+
+        Linhas com status ou prioridade desconhecidos são ignoradas, como em
+        ``_parse_ticket_data``.
+        """
+        status_column = TICKET_COLUMNS["status"]
+        priority_column = TICKET_COLUMNS["priority"]
+        for row in rows:
+            try:
+                status = int(row.get(status_column) or 1)
+                priority = int(row.get(priority_column) or 3)
+            except (TypeError, ValueError):
+                continue
+            if status in _STATUS_CODES and priority in _PRIORITY_CODES:
+                batch.append(row.get("id"), status, priority)
+
+    def _parse_item_data(self, item: Dict[str, Any]) -> Optional[GLPITicket]:
+        """Converte a resposta de ``GET /Ticket/{id}`` para GLPITicket."""
+        return self._parse_ticket_data(item, columns=ITEM_FIELDS)
+
+    def _parse_ticket_data(
+        self,
+        ticket_data: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        columns: Dict[str, str] = TICKET_COLUMNS,
+    ) -> Optional[GLPITicket]:
+        """Converte uma linha de busca do GLPI para objeto GLPITicket.
+
+        Com ``fields``, só essas colunas são decodificadas; as demais ficam
+        com o valor padrão do ticket. ``columns`` diz a chave de cada campo
+        (opções de busca por padrão).
+        """
+        try:
+            values: Dict[str, Any] = {"id": ticket_data.get("id")}
+            for field_name in fields or columns:
+                column = columns.get(field_name)
+                if column is None:
+                    continue
+                value = ticket_data.get(column)
+                decoded = _COLUMN_DECODERS.get(field_name, _identity)(value)
+                if decoded is not None:
+                    values[field_name] = decoded
+
+            return GLPITicket(**values)
+        except Exception as e:
+            print(f"Erro ao parsear ticket: {e}")
+            return None
+
+
+class GLPITicketRepository(GLPITicketMapper, TicketRepository):
+    """Implementação do repositório de tickets usando a API do GLPI."""
+
+    def __init__(
+        self,
+        glpi_client: GLPIHTTPClient,
+        page_size: int = 50,
+        prefetch: bool = False,
+        batch_size: int = 50,
+    ):
+        self.client = glpi_client
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.batch_size = batch_size
 
+    def get_all(self) -> List[GLPITicket]:
+        """Obtém todos os tickets, percorrendo todas as páginas da busca."""
+        return list(self.iter_all())
+
+    def iter_all(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+        ticket_filter: Optional[TicketFilter] = None,
+    ) -> Iterator[GLPITicket]:
+        """Itera sobre os tickets buscando uma página do GLPI por vez.
+
+        Com ``fields``, só as colunas desses campos são pedidas ao GLPI; com
+        ``ticket_filter``, a filtragem e a ordenação vão como critérios da
+        busca e só as linhas que passam trafegam.
+        """
+        query = self._filter_query(ticket_filter)
+        return self._iter_search(query, offset, limit, page_size, prefetch, fields)
+
+    def get_by_id(self, ticket_id: int) -> Optional[GLPITicket]:
+        """Obtém um ticket pelo ID."""
+        response = self.client.make_request("GET", f"/Ticket/{ticket_id}")
+
+        if response.is_success() and response.data:
+            return self._parse_item_data(response.data)
+
+        return None
+
+    def get_modified_date(self, ticket_id: int) -> Optional[datetime]:
+        """Consulta só o ``date_mod`` do ticket com uma busca de uma linha."""
+        query = (
+            f"criteria[0][field]={SEARCH_FIELD_ID}&criteria[0][searchtype]=equals"
+            f"&criteria[0][value]={int(ticket_id)}"
+            f"&forcedisplay[0]={SEARCH_FIELD_DATE_MOD}&range=0-0"
+        )
+        response = self.client.make_request("GET", f"/search/Ticket?{query}")
+        if not response.is_success():
+            return None
+
+        rows = response.data.get("data") or []
+        if not rows:
+            return None
+        return _parse_datetime(rows[0].get(SEARCH_FIELD_DATE_MOD))
+
+    def create(self, ticket: GLPITicket) -> Optional[GLPITicket]:
+        """Cria um novo ticket."""
+        if not ticket.is_valid():
+            return None
+
+        payload = {"input": self._ticket_input(ticket)}
         response = self.client.make_request("POST", "/Ticket", payload)
 
         if response.is_success() and "id" in response.data:
@@ -74,22 +425,7 @@ class GLPITicketRepository(TicketRepository):
         if not ticket.is_valid():
             return None
 
-        payload = {
-            "input": {
-                "id": ticket_id,
-                "name": ticket.name,
-                "content": ticket.content,
-                "status": ticket.status.value,
-                "priority": ticket.priority.value,
-                "itilcategories_id": ticket.category_id,
-                "users_id_tech": ticket.assigned_user_id,
-                "groups_id_tech": ticket.assigned_group_id,
-            }
-        }
-
-        if ticket.due_date:
-            payload["input"]["time_to_resolve"] = ticket.due_date.isoformat()
-
+        payload = {"input": self._ticket_input(ticket, ticket_id)}
         response = self.client.make_request("PUT", f"/Ticket/{ticket_id}", payload)
 
         if response.is_success():
@@ -103,47 +439,205 @@ class GLPITicketRepository(TicketRepository):
         response = self.client.make_request("DELETE", f"/Ticket/{ticket_id}")
         return response.is_success()
 
-    def search_by_project_tag(self, project_tag: str) -> List[GLPITicket]:
+    def create_many(self, tickets: List[GLPITicket]) -> List[BatchItemResult]:
+        """Cria vários tickets enviando lotes de ``batch_size`` ao GLPI."""
+        results: List[BatchItemResult] = []
+        for start, chunk in self._chunks(tickets):
+            payload = {"input": [self._ticket_input(ticket) for ticket in chunk]}
+            response = self.client.make_request("POST", "/Ticket", payload)
+            items = self._batch_items(response, len(chunk))
+
+            for offset, (ticket, item) in enumerate(zip(chunk, items)):
+                index = start + offset
+                if item.get("id"):
+                    ticket.id = item["id"]
+                    results.append(BatchItemResult(index, True, ticket.id, ticket))
+                else:
+                    error = item.get("message") or response.error
+                    results.append(
+                        BatchItemResult(
+                            index, False, error=error or "Falha ao criar ticket"
+                        )
+                    )
+
+        return results
+
+    def update_many(
+        self, updates: List[Tuple[int, GLPITicket]]
+    ) -> List[BatchItemResult]:
+        """Atualiza vários tickets enviando lotes de ``batch_size`` ao GLPI."""
+        results: List[BatchItemResult] = []
+        for start, chunk in self._chunks(updates):
+            payload = {
+                "input": [
+                    self._ticket_input(ticket, ticket_id) for ticket_id, ticket in chunk
+                ]
+            }
+            response = self.client.make_request("PUT", "/Ticket", payload)
+            items = self._batch_items(response, len(chunk))
+
+            for offset, ((ticket_id, ticket), item) in enumerate(zip(chunk, items)):
+                index = start + offset
+                if item.get(str(ticket_id)):
+                    ticket.id = ticket_id
+                    results.append(BatchItemResult(index, True, ticket_id, ticket))
+                else:
+                    error = item.get("message") or response.error
+                    results.append(
+                        BatchItemResult(
+                            index,
+                            False,
+                            ticket_id,
+                            error=error or "Falha ao atualizar ticket",
+                        )
+                    )
+
+        return results
+
+    def delete_many(self, ticket_ids: List[int]) -> List[BatchItemResult]:
+        """Deleta vários tickets enviando lotes de ``batch_size`` ao GLPI."""
+        results: List[BatchItemResult] = []
+        for start, chunk in self._chunks(ticket_ids):
+            payload = {"input": [{"id": ticket_id} for ticket_id in chunk]}
+            response = self.client.make_request("DELETE", "/Ticket", payload)
+            items = self._batch_items(response, len(chunk))
+
+            for offset, (ticket_id, item) in enumerate(zip(chunk, items)):
+                index = start + offset
+                if item.get(str(ticket_id)):
+                    results.append(BatchItemResult(index, True, ticket_id))
+                else:
+                    error = item.get("message") or response.error
+                    results.append(
+                        BatchItemResult(
+                            index,
+                            False,
+                            ticket_id,
+                            error=error or "Falha ao excluir ticket",
+                        )
+                    )
+
+        return results
+
+    def search_by_project_tag(
+        self, project_tag: str, fields: Optional[Sequence[str]] = None
+    ) -> List[GLPITicket]:
         """Busca tickets relacionados a um projeto."""
-        # Esta é uma implementação simplificada
-        # Na prática, você pode querer usar critérios de busca mais complexos
-        search_query = urllib.parse.quote(f"%{project_tag}%")
-        endpoint = (
-            f"/search/Ticket?criteria[0][field]=1&criteria[0][searchtype]=contains"
-            f"&criteria[0][value]={search_query}"
-        )
-
-        response = self.client.make_request("GET", endpoint)
-
-        if response.is_success():
-            tickets_data = response.data.get("data", [])
-            tickets = []
-
-            for ticket_data in tickets_data:
-                ticket = self._parse_ticket_data(ticket_data)
-                if ticket:
-                    tickets.append(ticket)
-
-            return tickets
-
-        return []
-
-    def _parse_ticket_data(self, ticket_data: Dict[str, Any]) -> Optional[GLPITicket]:
-        """Converte dados do ticket do GLPI para objeto GLPITicket."""
-        try:
-            # Mapeamento de campos do GLPI (os números são os IDs dos campos no GLPI)
-            ticket = GLPITicket(
-                id=ticket_data.get("id"),
-                name=ticket_data.get("1", ""),  # Nome do ticket
-                content=ticket_data.get("2", ""),  # Conteúdo do ticket
-                status=TicketStatus(int(ticket_data.get("12", 1))),  # Status
-                priority=TicketPriority(int(ticket_data.get("3", 3))),  # Prioridade
-                category_id=ticket_data.get("7"),  # Categoria
-                assigned_user_id=ticket_data.get("5"),  # Usuário atribuído
-                assigned_group_id=ticket_data.get("8"),  # Grupo atribuído
+        query = self._project_tag_query(project_tag)
+        return list(self._iter_search(query, fields=fields))
+
+    def search_batch_by_project_tag(self, project_tag: str) -> TicketBatch:
+        """Tickets de um projeto em colunas, lidos direto das linhas da busca.
+
+        Lança ``IncompleteSearchError`` se uma página falhar: contagens de
+        parte do projeto não podem sair como se fossem do projeto inteiro.
+        """
+        query = self._project_tag_query(project_tag)
+        batch = TicketBatch()
+        offset = 0
+        while True:
+            response = self.client.make_request(
+                "GET",
+                self._search_endpoint(query, offset, self.page_size, BATCH_FIELDS),
             )
-
-            return ticket
-        except Exception as e:
-            print(f"Erro ao parsear ticket: {e}")
-            return None
+            if not response.is_success():
+                if _range_exceeded(response):
+                    return batch
+                raise IncompleteSearchError(offset, response.status_code)
+
+            rows = response.data.get("data", [])
+            self._add_rows(batch, rows)
+            offset += len(rows)
+            total = self._parse_total(response)
+            if not rows or (total is not None and offset >= total):
+                return batch
+
+    def _iter_search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        prefetch: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[GLPITicket]:
+        """Percorre as janelas ``range`` de uma busca, página a página.
+
+        Com ``prefetch``, a próxima página é buscada em segundo plano enquanto
+        a atual é consumida.
+        """
+        page_size = page_size or self.page_size
+        if prefetch is None:
+            prefetch = self.prefetch
+
+        def window(remaining: Optional[int]) -> int:
+            return page_size if remaining is None else min(page_size, remaining)
+
+        remaining = limit
+        if remaining is not None and remaining <= 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self._fetch_page(query, offset, window(remaining), fields)
+
+            while True:
+                if remaining is not None:
+                    remaining -= len(page.tickets)
+                    if remaining <= 0:
+                        # Descarta o excedente de uma página maior que o limite
+                        yield from page.tickets[: len(page.tickets) + remaining]
+                        return
+
+                next_page = None
+                if page.has_more() and prefetch:
+                    next_page = executor.submit(
+                        self._fetch_page,
+                        query,
+                        page.next_offset,
+                        window(remaining),
+                        fields,
+                    )
+
+                yield from page.tickets
+
+                if not page.has_more():
+                    return
+
+                if next_page is not None:
+                    page = next_page.result()
+                else:
+                    page = self._fetch_page(
+                        query, page.next_offset, window(remaining), fields
+                    )
+
+    def _fetch_page(
+        self,
+        query: str,
+        offset: int,
+        size: int,
+        fields: Optional[Sequence[str]] = None,
+    ) -> TicketPage:
+        """Busca a janela ``[offset, offset + size)`` de uma busca de tickets."""
+        response = self.client.make_request(
+            "GET", self._search_endpoint(query, offset, size, fields)
+        )
+        return self._page_from_response(response, offset, fields)
+
+    def _chunks(self, items: list) -> Iterator[Tuple[int, list]]:
+        """Divide os itens em lotes de ``batch_size``, com o índice inicial."""
+        for start in range(0, len(items), self.batch_size):
+            end = start + self.batch_size
+            yield start, items[start:end]
+
+    @staticmethod
+    def _batch_items(response: GLPIResponse, size: int) -> List[Dict[str, Any]]:
+        """Resultados por item de uma resposta em lote do GLPI.
+
+        O GLPI responde com uma lista na mesma ordem da entrada; se a
+        requisição inteira falhou, todos os itens do lote recebem ``{}``.
+        """
+        items = response.data if isinstance(response.data, list) else []
+        if not response.is_success():
+            items = []
+        items = [item if isinstance(item, dict) else {} for item in items]
+        return items + [{}] * (size - len(items))
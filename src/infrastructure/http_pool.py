@@ -0,0 +1,203 @@
+"""
+Pool de conexões HTTP/1.1 persistentes para as chamadas ao GLPI.
+"""
+import http.client
+import select
+import threading
+import time
+import urllib.parse
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+
+PoolKey = Tuple[str, str, Optional[int]]
+
+# Falhas que indicam que o servidor fechou uma conexão reaproveitada
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Métodos que podem ser repetidos sem risco de efeito duplicado no servidor
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+@dataclass
+class PooledResponse:
+    """Resposta HTTP já lida por completo."""
+
+    status: int
+    reason: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class HTTPConnectionPool:
+    """Mantém conexões keep-alive ociosas por host para reaproveitamento.
+
+    Cada conexão é usada por uma thread por vez. Conexões ociosas além de
+    ``idle_timeout`` segundos ou fechadas pelo servidor são descartadas antes
+    de serem reutilizadas.
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 15.0, timeout=30):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Dict[PoolKey, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> PooledResponse:
+        """Executa uma requisição usando uma conexão do pool.
+
+        Se uma conexão reaproveitada tiver sido fechada pelo servidor, só
+        métodos idempotentes são repetidos em uma conexão nova: um POST pode
+        já ter sido processado e a falha é devolvida a quem chamou.
+        """
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        conn, reused = self._acquire(key)
+        try:
+            response, will_close = self._send(conn, method, path, body, headers)
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused or method not in IDEMPOTENT_METHODS:
+                raise
+            # O servidor fechou a conexão ociosa: repete uma vez em uma nova
+            conn = self._connect(key)
+            try:
+                response, will_close = self._send(conn, method, path, body, headers)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        if will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        return response
+
+    def prime(self, url: str, count: int) -> int:
+        """Abre conexões antecipadamente para o host da URL."""
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        opened = 0
+
+        for _ in range(count):
+            conn = self._connect(key)
+            try:
+                conn.connect()
+            except OSError:
+                conn.close()
+                break
+            if not self._release(key, conn):
+                break
+            opened += 1
+
+        return opened
+
+    def idle_connections(self) -> int:
+        """Número de conexões ociosas no pool."""
+        with self._lock:
+            return sum(len(connections) for connections in self._idle.values())
+
+    def close(self) -> None:
+        """Fecha todas as conexões ociosas."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+    def _acquire(self, key: PoolKey) -> Tuple[http.client.HTTPConnection, bool]:
+        """Retira uma conexão viva do pool ou cria uma nova."""
+        now = time.monotonic()
+        discarded = []
+        conn = None
+
+        with self._lock:
+            connections = self._idle.get(key)
+            while connections:
+                candidate, last_used = connections.pop()
+                if now - last_used > self.idle_timeout or self._is_dead(candidate):
+                    discarded.append(candidate)
+                    continue
+                conn = candidate
+                break
+
+        for dead in discarded:
+            dead.close()
+
+        if conn is not None:
+            return conn, True
+        return self._connect(key), False
+
+    def _release(self, key: PoolKey, conn: http.client.HTTPConnection) -> bool:
+        """Devolve a conexão ao pool; fecha se o pool do host estiver cheio."""
+        with self._lock:
+            connections = self._idle.setdefault(key, deque())
+            if len(connections) < self.max_size:
+                connections.append((conn, time.monotonic()))
+                return True
+
+        conn.close()
+        return False
+
+    def _connect(self, key: PoolKey) -> http.client.HTTPConnection:
+        """Cria uma nova conexão (ainda não aberta) para o host."""
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[PooledResponse, bool]:
+        """Envia a requisição e lê a resposta inteira."""
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        data = response.read()
+        pooled = PooledResponse(
+            status=response.status,
+            reason=response.reason,
+            body=data,
+            headers=dict(response.getheaders()),
+        )
+        return pooled, response.will_close
+
+    @staticmethod
+    def _is_dead(conn: http.client.HTTPConnection) -> bool:
+        """Detecta sockets fechados pelo servidor enquanto estavam ociosos.
+
+        Uma conexão ociosa saudável não tem nada para ler; se o socket está
+        legível, o servidor enviou EOF (ou dados inesperados) e ela é inútil.
+        """
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
@@ -0,0 +1,209 @@
+"""
+Métricas no formato de exposição do Prometheus.
+
+Cada thread grava em um shard próprio (``threading.local``), sem locks no
+caminho da requisição; a coleta soma os shards. Shards de threads encerradas
+são incorporados a um acumulado para não crescerem sem limite.
+"""
+import bisect
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+class _Metric:
+    """Métrica com rótulos e gravação por thread."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, dict]] = []
+        self._retired: dict = {}
+
+    def _shard(self) -> dict:
+        """Valores da thread atual, registrados na primeira gravação."""
+        try:
+            return self._local.values
+        except AttributeError:
+            values: dict = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), values))
+            self._local.values = values
+            return values
+
+    def collect(self) -> dict:
+        """Soma dos shards de todas as threads, por combinação de rótulos."""
+        merged: dict = {}
+        with self._lock:
+            alive = []
+            for thread, values in self._shards:
+                # ``dict.copy`` é atômico: não corre com a gravação da thread
+                snapshot = values.copy()
+                if thread.is_alive():
+                    alive.append((thread, values))
+                    self._merge(merged, snapshot)
+                else:
+                    self._merge(self._retired, snapshot)
+            self._shards = alive
+            self._merge(merged, self._retired)
+        return merged
+
+    @staticmethod
+    def _merge(target: dict, values: dict) -> None:
+        for labels, value in values.items():
+            target[labels] = target.get(labels, 0) + value
+
+    def render(self) -> Iterable[str]:
+        """Linhas do formato de texto do Prometheus."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labels, value in sorted(self.collect().items()):
+            yield from self._render_sample(labels, value)
+
+    def _render_sample(self, labels: Labels, value) -> Iterable[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, labels)} {float(value)}"
+
+
+class Counter(_Metric):
+    """Contador monotônico."""
+
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        """Incrementa o contador dos rótulos informados."""
+        values = self._shard()
+        key = tuple(map(str, labels))
+        values[key] = values.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    """Valor que sobe e desce (ex.: requisições em andamento)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1.0) -> None:
+        """Decrementa o valor dos rótulos informados."""
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Distribuição de valores em faixas cumulativas (``le``)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels) -> None:
+        """Registra uma observação para os rótulos informados."""
+        values = self._shard()
+        key = tuple(map(str, labels))
+        counts = values.get(key)
+        if counts is None:
+            # Uma posição por faixa, a faixa +Inf e a soma das observações
+            counts = values[key] = [0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    @staticmethod
+    def _merge(target: dict, values: dict) -> None:
+        for labels, counts in values.items():
+            merged = target.get(labels)
+            if merged is None:
+                target[labels] = list(counts)
+            else:
+                for index, count in enumerate(counts):
+                    merged[index] += count
+
+    def _render_sample(self, labels: Labels, counts) -> Iterable[str]:
+        cumulative = 0
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, counts):
+            cumulative += count
+            names = self.labelnames + ("le",)
+            yield (
+                f"{self.name}_bucket{_format_labels(names, labels + (bound,))} "
+                f"{cumulative}"
+            )
+        suffix = _format_labels(self.labelnames, labels)
+        yield f"{self.name}_sum{suffix} {float(counts[-1])}"
+        yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class MetricsRegistry:
+    """Conjunto de métricas expostas em ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        """Obtém (ou cria) um contador."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        """Obtém (ou cria) um gauge."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Obtém (ou cria) um histograma."""
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> _Metric:
+        """Métrica registrada com o nome informado."""
+        return self._metrics[name]
+
+    def render(self) -> str:
+        """Todas as métricas no formato de texto do Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric_class, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_class:
+                raise ValueError(f"Métrica {name} já registrada com outro tipo")
+            return metric
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Registro padrão do processo
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,145 @@
+"""
+Retentativas com backoff e circuit breaker para as chamadas ao GLPI.
+"""
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator
+from src.infrastructure.metrics import REGISTRY
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+BREAKER_STATE = REGISTRY.gauge(
+    "glpi_circuit_breaker_state",
+    "Estado do circuit breaker por endpoint do GLPI (1 no estado atual)",
+    ("endpoint", "state"),
+)
+BREAKER_REJECTIONS = REGISTRY.counter(
+    "glpi_circuit_breaker_rejections_total",
+    "Chamadas ao GLPI recusadas sem rede porque o circuito estava aberto",
+    ("endpoint",),
+)
+GLPI_RETRIES = REGISTRY.counter(
+    "glpi_retries_total",
+    "Retentativas de chamadas ao GLPI por método e endpoint",
+    ("method", "endpoint"),
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Quantas vezes e com que espera repetir uma chamada que falhou.
+
+    A espera é sorteada entre zero e ``base_delay * 2 ** tentativa``, limitada
+    a ``max_delay`` (backoff exponencial com jitter completo), para que as
+    threads não voltem ao GLPI todas ao mesmo tempo.
+    """
+
+    max_retries: int = 2
+    base_delay: float = 0.2
+    max_delay: float = 2.0
+    idempotent_methods: frozenset = frozenset(("GET", "PUT", "DELETE"))
+
+    def delays(self, method: str) -> Iterator[float]:
+        """Esperas antes de cada retentativa permitida para o método."""
+        if method not in self.idempotent_methods:
+            return
+        for attempt in range(self.max_retries):
+            yield random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Circuit breaker de um endpoint.
+
+    Após ``failure_threshold`` falhas seguidas o circuito abre e as chamadas
+    falham na hora. Passado ``recovery_timeout``, uma única chamada de teste
+    (meio-aberto) decide se ele fecha ou volta a abrir.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        BREAKER_STATE.inc(name, CLOSED)
+
+    def allow(self) -> bool:
+        """Indica se a chamada pode seguir para o GLPI."""
+        if self.state == CLOSED:
+            return True
+
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    BREAKER_REJECTIONS.inc(self.name)
+                    return False
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    BREAKER_REJECTIONS.inc(self.name)
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Registra uma resposta do GLPI que não indica sobrecarga."""
+        if self.state == CLOSED and self.failures == 0:
+            return
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Registra uma falha (conexão, timeout, 5xx ou 429)."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                self._probing = False
+                self._opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        BREAKER_STATE.dec(self.name, self.state)
+        BREAKER_STATE.inc(self.name, state)
+        self.state = state
+
+
+class CircuitBreakerRegistry:
+    """Um circuit breaker por endpoint, criado no primeiro uso."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Circuit breaker do endpoint."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        name, self.failure_threshold, self.recovery_timeout
+                    )
+                    self._breakers[name] = breaker
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Estado atual de cada circuito."""
+        with self._lock:
+            return {name: breaker.state for name, breaker in self._breakers.items()}
@@ -0,0 +1,77 @@
+"""
+Negociação e aplicação de compressão gzip nas respostas HTTP.
+"""
+import gzip
+import os
+import zlib
+from typing import Optional
+
+GZIP = "gzip"
+
+# Corpos menores que isso custam mais CPU do que economizam em bytes
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", 1024))
+# 1 (rápido) a 9 (menor); 0 desativa a compressão das respostas
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/yaml",
+    "text/",
+)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Indica se o cabeçalho ``Accept-Encoding`` aceita gzip.
+
+    Respeita ``q=0`` (recusa explícita) e o curinga ``*``.
+    """
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    if GZIP in accepted:
+        return accepted[GZIP] > 0
+    return accepted.get("*", 0) > 0
+
+
+def gzip_bytes(data: bytes, level: int = 6) -> bytes:
+    """Comprime ``data`` com saída determinística (sem data de modificação)."""
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Indica se vale a pena comprimir o tipo de conteúdo (texto e JSON)."""
+    return bool(content_type) and content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class GzipStream:
+    """Compressor gzip incremental para corpos enviados aos poucos.
+
+    Cada ``compress`` devolve um bloco decodificável pelo cliente assim que
+    chega (sync flush), para o streaming continuar progressivo.
+    """
+
+    def __init__(self, level: int = GZIP_LEVEL):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Comprime um bloco e o libera para envio imediato."""
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """Encerra o fluxo gzip (bloco final e trailer com CRC)."""
+        return self._compressor.flush(zlib.Z_FINISH)
@@ -0,0 +1,36 @@
+"""
+ETags e requisições condicionais (``If-None-Match``).
+"""
+import hashlib
+from typing import Optional
+from src.core.glpi_entities import GLPITicket
+
+
+def content_etag(body: bytes, weak: bool = False) -> str:
+    """ETag derivada do hash do corpo."""
+    tag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return f"W/{tag}" if weak else tag
+
+
+def ticket_etag(ticket: GLPITicket) -> Optional[str]:
+    """ETag fraca a partir do ``date_mod`` do GLPI, sem serializar o ticket.
+
+    Retorna ``None`` se o ticket não tem data de modificação; nesse caso a
+    ETag deve vir do conteúdo (``content_etag``).
+    """
+    if ticket.id is None or ticket.modified_date is None:
+        return None
+    return f'W/"{ticket.id}-{ticket.modified_date:%Y%m%d%H%M%S}"'
+
+
+def etag_matches(if_none_match: Optional[str], *etags: str) -> bool:
+    """Compara ``If-None-Match`` com as ETags (comparação fraca, RFC 9110)."""
+    if not if_none_match:
+        return False
+
+    candidates = {etag.removeprefix("W/") for etag in etags}
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") in candidates:
+            return True
+    return False
@@ -0,0 +1,110 @@
+"""
+Filtros e ordenação da listagem de tickets vindos da query string.
+"""
+import os
+import urllib.parse
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Type
+from zoneinfo import ZoneInfo
+from src.core.glpi_entities import (
+    SORT_FIELDS,
+    TicketFilter,
+    TicketPriority,
+    TicketStatus,
+)
+
+_ID_PARAMS = ("assigned_user_id", "assigned_group_id", "category_id")
+_DATE_PARAMS = (
+    "modified_after",
+    "modified_before",
+    "created_after",
+    "created_before",
+)
+
+# Fuso em que o GLPI grava as datas; sem ``GLPI_TIMEZONE``, o do host da API
+# (os dois precisam coincidir)
+_TIMEZONE_NAME = os.getenv("GLPI_TIMEZONE")
+GLPI_TIMEZONE = ZoneInfo(_TIMEZONE_NAME) if _TIMEZONE_NAME else None
+
+# Parâmetros de ``GET /tickets`` que formam o ``TicketFilter``
+FILTER_PARAMS = ("status", "priority") + _ID_PARAMS + _DATE_PARAMS + ("sort",)
+
+
+def parse_ticket_filter(
+    query_params: Dict[str, Sequence[str]]
+) -> Optional[TicketFilter]:
+    """Monta o filtro da listagem; ``None`` se nenhum parâmetro veio.
+
+    ``status`` e ``priority`` aceitam nomes separados por vírgula (ou o
+    parâmetro repetido); datas em ISO 8601, e as que trazem fuso são
+    convertidas para ``GLPI_TIMEZONE``, o fuso das datas do GLPI; ``sort``
+    é um campo, com ``-`` na frente para ordem decrescente. Lança
+    ``ValueError`` para valores inválidos.
+    """
+    if not any(name in query_params for name in FILTER_PARAMS):
+        return None
+
+    values = {
+        "statuses": _members(query_params, "status", TicketStatus),
+        "priorities": _members(query_params, "priority", TicketPriority),
+    }
+    for name in _ID_PARAMS:
+        if name in query_params:
+            try:
+                values[name] = int(query_params[name][0])
+            except ValueError:
+                raise ValueError(
+                    f"{name} deve ser um número inteiro",
+                ) from None
+    for name in _DATE_PARAMS:
+        if name in query_params:
+            try:
+                value = datetime.fromisoformat(query_params[name][0])
+            except ValueError:
+                raise ValueError(
+                    f"{name} deve ser uma data ISO 8601",
+                ) from None
+            if value.tzinfo is not None:
+                value = value.astimezone(GLPI_TIMEZONE).replace(tzinfo=None)
+            values[name] = value
+
+    if "sort" in query_params:
+        sort = query_params["sort"][0]
+        values["descending"] = sort.startswith("-")
+        values["sort"] = sort.removeprefix("-")
+        if values["sort"] not in SORT_FIELDS:
+            raise ValueError(f"Ordenação desconhecida: {values['sort']}")
+
+    return TicketFilter(**values)
+
+
+def filter_query(query_params: Dict[str, Sequence[str]]) -> str:
+    """Parâmetros de filtro da requisição, codificados, para o ``Link``."""
+    return urllib.parse.urlencode(
+        [
+            (name, value)
+            for name in FILTER_PARAMS
+            for value in query_params.get(name, ())
+        ]
+    )
+
+
+def _members(
+    query_params: Dict[str, Sequence[str]],
+    name: str,
+    enum: Type,
+) -> tuple:
+    """Membros do enum pedidos em ``name``, sem repetição."""
+    members: List = []
+    for value in query_params.get(name, ()):
+        for item in value.split(","):
+            item = item.strip().upper()
+            if not item:
+                continue
+            try:
+                member = enum[item]
+            except KeyError:
+                raise ValueError(f"{name} desconhecido: {item}") from None
+            if member not in members:
+                members.append(member)
+    return tuple(members)
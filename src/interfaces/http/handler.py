@@ -5,253 +5,523 @@ import json
 import urllib.parse
 import os
 from http.server import BaseHTTPRequestHandler
+from typing import Optional, Sequence
+from src.core.glpi_entities import SUMMARY_FIELDS, TicketFilter
 from src.core.glpi_use_cases import GLPITicketUseCase
-from src.interfaces.http.swagger import SwaggerGenerator
+from src.infrastructure.glpi_ticket_repository import IncompleteSearchError
+from src.infrastructure.metrics import REGISTRY
+from src.interfaces.http.compression import (
+    GZIP,
+    GZIP_LEVEL,
+    GZIP_MIN_SIZE,
+    GzipStream,
+    accepts_gzip,
+    gzip_bytes,
+    is_compressible,
+)
+from src.interfaces.http.conditional import content_etag, etag_matches, ticket_etag
+from src.interfaces.http.filters import filter_query, parse_ticket_filter
+from src.interfaces.http.metrics import METRICS_CONTENT_TYPE, instrumented
+from src.interfaces.http.pagination import next_page_headers, parse_pagination
+from src.interfaces.http.profiling import PROFILER, profiled
+from src.interfaces.http.routing import ROUTES, InvalidPathParameter, parse_query
+from src.interfaces.http.serializers import (
+    dumps,
+    parse_fields,
+    ticket_from_payload,
+    ticket_plan,
+)
+from src.interfaces.http.streaming import (
+    NDJSON,
+    ChunkedWriter,
+    write_json_array,
+    write_ndjson,
+)
+from src.interfaces.http.static_assets import (
+    CACHE_CONTROL,
+    OPENAPI_JSON,
+    OPENAPI_YAML,
+    SWAGGER_UI,
+    get_asset,
+)
+
+KEEPALIVE_TIMEOUT = float(os.getenv("SERVER_KEEPALIVE_TIMEOUT", 5))
+BATCH_MAX_ITEMS = int(os.getenv("TICKETS_BATCH_MAX_ITEMS", 1000))
 
 
 class APIHandler(BaseHTTPRequestHandler):
     """Handler principal para a API."""
 
+    # HTTP/1.1 mantém conexões abertas entre requisições e permite respostas
+    # chunked; toda resposta precisa declarar Content-Length ou ser chunked.
+    protocol_version = "HTTP/1.1"
+    # Tempo máximo que uma conexão keep-alive ociosa segura um worker
+    timeout = KEEPALIVE_TIMEOUT
+    # Cabeçalhos e corpo saem em escritas separadas; sem TCP_NODELAY o
+    # algoritmo de Nagle atrasa o corpo em conexões keep-alive
+    disable_nagle_algorithm = True
+
     def __init__(self, ticket_use_case: GLPITicketUseCase, *args, **kwargs):
         self.ticket_use_case = ticket_use_case
         super().__init__(*args, **kwargs)
 
-    def set_headers(self, content_type="application/json"):
-        """Configura os cabeçalhos da resposta."""
+    def send_response(self, code, message=None):
+        """Envia a linha de status e guarda o código para as métricas."""
+        self.status_code = code
+        super().send_response(code, message)
+
+    def set_headers(
+        self,
+        content_type="application/json",
+        extra_headers=None,
+        content_length=None,
+        chunked=False,
+    ):
+        """Configura os cabeçalhos da resposta.
+
+        Em HTTP/1.1 o corpo precisa de ``content_length`` ou de ``chunked``.
+        """
         self.send_response(200)
         self.send_header("Content-type", content_type)
+        if content_length is not None:
+            self.send_header("Content-Length", str(content_length))
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header(
             "Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS"
         )
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        if extra_headers:
+            for name, value in extra_headers.items():
+                self.send_header(name, value)
+            self.send_header("Access-Control-Expose-Headers", ", ".join(extra_headers))
         self.end_headers()
 
+    def write_body(
+        self, body: bytes, content_type="application/json", extra_headers=None
+    ):
+        """Envia uma resposta 200 completa com o corpo informado.
+
+        Corpos de texto a partir de ``GZIP_MIN_SIZE`` bytes saem comprimidos
+        quando o cliente aceita gzip.
+        """
+        extra_headers = dict(extra_headers or {})
+        if (
+            GZIP_LEVEL > 0
+            and "Content-Encoding" not in extra_headers
+            and is_compressible(content_type)
+            and len(body) >= GZIP_MIN_SIZE
+        ):
+            extra_headers["Vary"] = "Accept-Encoding"
+            if accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                body = gzip_bytes(body, GZIP_LEVEL)
+                extra_headers["Content-Encoding"] = GZIP
+
+        self.set_headers(content_type, extra_headers, content_length=len(body))
+        self.wfile.write(body)
+
+    def write_json(self, payload, extra_headers=None):
+        """Envia uma resposta 200 com o payload serializado em JSON."""
+        self.write_body(dumps(payload), extra_headers=extra_headers)
+
+    def send_not_modified(self, headers):
+        """Responde 304 (sem corpo) repetindo os cabeçalhos de validação."""
+        self.send_response(304)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    @instrumented
+    @profiled
     def do_OPTIONS(self):
         """Tratamento para requisições OPTIONS (preflight CORS)."""
-        self.set_headers()
+        self.set_headers(content_length=0)
 
+    @instrumented
+    @profiled
     def do_GET(self):
         """Tratamento para requisições GET."""
-        parsed_path = urllib.parse.urlparse(self.path)
-        path = parsed_path.path
-        # query_params = urllib.parse.parse_qs(parsed_path.query)  # Não usado
-
-        if path == "/tickets":
-            tickets = self.ticket_use_case.list_tickets()
-            self.set_headers()
-            self.wfile.write(
-                json.dumps(
-                    [
-                        {
-                            "id": ticket.id,
-                            "name": ticket.name,
-                            "status": ticket.status.name,
-                            "priority": ticket.priority.name,
-                        }
-                        for ticket in tickets
-                    ]
-                ).encode()
-            )
+        self._dispatch("GET")
 
-        elif path.startswith("/tickets/"):
-            try:
-                ticket_id = int(path.split("/")[-1])
-                ticket = self.ticket_use_case.get_ticket(ticket_id)
-                if ticket:
-                    self.set_headers()
-                    self.wfile.write(
-                        json.dumps(
-                            {
-                                "id": ticket.id,
-                                "name": ticket.name,
-                                "content": ticket.content,
-                                "status": ticket.status.name,
-                                "priority": ticket.priority.name,
-                                "assigned_user_id": ticket.assigned_user_id,
-                                "assigned_group_id": ticket.assigned_group_id,
-                            }
-                        ).encode()
-                    )
-                else:
-                    self.send_error(404, "Ticket não encontrado")
-            except (ValueError, IndexError):
-                self.send_error(400, "ID inválido")
+    @instrumented
+    @profiled
+    def do_POST(self):
+        """Tratamento para requisições POST."""
+        self._dispatch("POST")
 
-        elif path.startswith("/projects/") and path.endswith("/progress"):
-            try:
-                project_tag = path.split("/")[2]
-                progress = self.ticket_use_case.get_project_progress(project_tag)
-                self.set_headers()
-                self.wfile.write(json.dumps(progress).encode())
-            except Exception as e:
-                self.send_error(500, f"Erro ao calcular progresso: {str(e)}")
-
-        elif path == "/docs" or path == "/docs/":
-            # Serve a página do Swagger UI
-            self._serve_swagger_ui()
-
-        elif path == "/api/openapi.json":
-            # Serve a especificação OpenAPI
-            self._serve_openapi_spec()
-
-        elif path == "/":
-            self.set_headers()
-            response = {
-                "message": "API Python MCP - Clean Architecture com integração GLPI",
-                "documentation": "/docs",
-                "openapi_spec": "/api/openapi.json",
-            }
-            self.wfile.write(json.dumps(response).encode())
+    @instrumented
+    @profiled
+    def do_PUT(self):
+        """Tratamento para requisições PUT."""
+        self._dispatch("PUT")
 
-        else:
+    @instrumented
+    @profiled
+    def do_DELETE(self):
+        """Tratamento para requisições DELETE."""
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        """Encontra a rota na tabela ``ROUTES`` e chama o método dela.
+
+        O método recebe a query string já interpretada e os parâmetros de
+        caminho convertidos como argumentos nomeados.
+        """
+        path, _, query = self.path.partition("?")
+        try:
+            match = ROUTES.match(method, path)
+        except InvalidPathParameter as e:
+            self.send_error(400, "ID inválido" if e.name == "id" else str(e))
+            return
+        if match is None:
             self.send_error(404, "Endpoint não encontrado")
+            return
+        getattr(self, match.route.handler)(parse_query(query), **match.params)
 
-    def do_POST(self):
-        """Tratamento para requisições POST."""
-        if self.path == "/tickets":
-            content_length = int(self.headers["Content-Length"])
-            post_data = self.rfile.read(content_length)
+    def _get_root(self, query_params):
+        """Informações básicas da API."""
+        response = {
+            "message": "API Python MCP - Clean Architecture com integração GLPI",
+            "documentation": "/docs",
+            "openapi_spec": "/api/openapi.json",
+        }
+        self.write_json(response)
 
-            try:
-                ticket_data = json.loads(post_data.decode())
+    def _get_metrics(self, query_params):
+        """Métricas no formato de texto do Prometheus."""
+        self.write_body(REGISTRY.render().encode(), METRICS_CONTENT_TYPE)
 
-                # Importações locais para evitar dependências circulares
-                from src.core.glpi_entities import (
-                    GLPITicket,
-                    TicketStatus,
-                    TicketPriority,
-                )
+    def _get_docs(self, query_params):
+        """Página do Swagger UI."""
+        self._serve_asset(SWAGGER_UI)
+
+    def _get_openapi_json(self, query_params):
+        """Especificação OpenAPI em JSON."""
+        self._serve_asset(OPENAPI_JSON)
+
+    def _get_openapi_yaml(self, query_params):
+        """Especificação OpenAPI em YAML."""
+        self._serve_asset(OPENAPI_YAML)
 
-                ticket = GLPITicket(
-                    name=ticket_data.get("name", ""),
-                    content=ticket_data.get("content", ""),
-                    status=TicketStatus[ticket_data.get("status", "NEW")]
-                    if ticket_data.get("status")
-                    else TicketStatus.NEW,
-                    priority=TicketPriority[ticket_data.get("priority", "MEDIUM")]
-                    if ticket_data.get("priority")
-                    else TicketPriority.MEDIUM,
-                    category_id=ticket_data.get("category_id"),
-                    assigned_user_id=ticket_data.get("assigned_user_id"),
-                    assigned_group_id=ticket_data.get("assigned_group_id"),
+    def _list_tickets(self, query_params):
+        """Página de tickets, ou todos em streaming."""
+        stream_format = self._stream_format(query_params)
+        try:
+            if stream_format:
+                # Exportações em streaming não têm limite padrão nem máximo
+                offset, limit = parse_pagination(
+                    query_params, default_limit=None, max_limit=None
                 )
+            else:
+                offset, limit = parse_pagination(query_params)
+        except ValueError:
+            self.send_error(400, "Parâmetros de paginação inválidos")
+            return
 
-                created_ticket = self.ticket_use_case.create_ticket(ticket)
-                if created_ticket and created_ticket.id:
-                    self.set_headers()
-                    self.wfile.write(
-                        json.dumps(
-                            {
-                                "id": created_ticket.id,
-                                "name": created_ticket.name,
-                                "status": created_ticket.status.name,
-                                "priority": created_ticket.priority.name,
-                            }
-                        ).encode()
-                    )
-                else:
-                    self.send_error(400, "Dados de ticket inválidos")
-            except json.JSONDecodeError:
-                self.send_error(400, "JSON inválido")
-            except Exception as e:
-                self.send_error(500, f"Erro ao criar ticket: {str(e)}")
+        try:
+            fields = parse_fields(",".join(query_params.get("fields", [])))
+            ticket_filter = parse_ticket_filter(query_params)
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+
+        if stream_format:
+            self._stream_tickets(stream_format, offset, limit, fields, ticket_filter)
+            return
+
+        # Só as colunas pedidas e as linhas que passam no filtro saem do GLPI
+        try:
+            tickets = list(
+                self.ticket_use_case.iter_tickets(offset, limit, fields, ticket_filter)
+            )
+        except IncompleteSearchError as e:
+            # Uma página incompleta não pode sair como se fosse a lista toda
+            self.send_error(502, f"Erro ao buscar tickets no GLPI: {e}")
+            return
+        query = filter_query(query_params)
+        if "fields" in query_params:
+            fields_query = urllib.parse.urlencode({"fields": ",".join(fields)})
+            query = f"{fields_query}&{query}" if query else fields_query
+        self.write_body(
+            ticket_plan(fields).encode_many(tickets),
+            extra_headers=next_page_headers(
+                "/tickets", offset, limit, len(tickets), query
+            ),
+        )
+
+    def _get_ticket(self, query_params, id: int):
+        """Detalhe de um ticket."""
+        ticket = self.ticket_use_case.get_ticket(id)
+        if ticket:
+            self._write_ticket(ticket)
         else:
-            self.send_error(404, "Endpoint não encontrado")
+            self.send_error(404, "Ticket não encontrado")
 
-    def do_PUT(self):
-        """Tratamento para requisições PUT."""
-        if self.path.startswith("/tickets/"):
-            try:
-                ticket_id = int(self.path.split("/")[-1])
-                content_length = int(self.headers["Content-Length"])
-                put_data = self.rfile.read(content_length)
-                ticket_data = json.loads(put_data.decode())
-
-                # Importações locais para evitar dependências circulares
-                from src.core.glpi_entities import TicketStatus, TicketPriority
-
-                # Criar um ticket parcial com os dados fornecidos
-                from src.core.glpi_entities import GLPITicket
-
-                ticket = GLPITicket(
-                    name=ticket_data.get("name", ""),
-                    content=ticket_data.get("content", ""),
-                    status=TicketStatus[ticket_data.get("status", "NEW")]
-                    if ticket_data.get("status")
-                    else TicketStatus.NEW,
-                    priority=TicketPriority[ticket_data.get("priority", "MEDIUM")]
-                    if ticket_data.get("priority")
-                    else TicketPriority.MEDIUM,
-                    category_id=ticket_data.get("category_id"),
-                    assigned_user_id=ticket_data.get("assigned_user_id"),
-                    assigned_group_id=ticket_data.get("assigned_group_id"),
-                )
+    def _get_project_progress(self, query_params, tag: str):
+        """Progresso dos tickets de um projeto."""
+        try:
+            progress = self.ticket_use_case.get_project_progress(tag)
+            self.write_json(progress)
+        except Exception as e:
+            self.send_error(500, f"Erro ao calcular progresso: {str(e)}")
 
-                updated_ticket = self.ticket_use_case.update_ticket(ticket_id, ticket)
-                if updated_ticket:
-                    self.set_headers()
-                    self.wfile.write(
-                        json.dumps(
-                            {
-                                "id": updated_ticket.id,
-                                "name": updated_ticket.name,
-                                "status": updated_ticket.status.name,
-                                "priority": updated_ticket.priority.name,
-                            }
-                        ).encode()
-                    )
-                else:
-                    self.send_error(404, "Ticket não encontrado ou dados inválidos")
-            except (ValueError, IndexError):
-                self.send_error(400, "ID inválido")
-            except json.JSONDecodeError:
-                self.send_error(400, "JSON inválido")
-            except Exception as e:
-                self.send_error(500, f"Erro ao atualizar ticket: {str(e)}")
+    def _create_ticket(self, query_params):
+        """Cria um ticket."""
+        content_length = int(self.headers["Content-Length"])
+        post_data = self.rfile.read(content_length)
+
+        try:
+            ticket_data = json.loads(post_data.decode())
+            ticket = ticket_from_payload(ticket_data)
+
+            created_ticket = self.ticket_use_case.create_ticket(ticket)
+            if created_ticket and created_ticket.id:
+                self.write_body(ticket_plan("summary").encode(created_ticket))
+            else:
+                self.send_error(400, "Dados de ticket inválidos")
+        except json.JSONDecodeError:
+            self.send_error(400, "JSON inválido")
+        except Exception as e:
+            self.send_error(500, f"Erro ao criar ticket: {str(e)}")
+
+    def _update_ticket(self, query_params, id: int):
+        """Atualiza um ticket."""
+        try:
+            content_length = int(self.headers["Content-Length"])
+            put_data = self.rfile.read(content_length)
+            ticket_data = json.loads(put_data.decode())
+
+            # Criar um ticket parcial com os dados fornecidos
+            ticket = ticket_from_payload(ticket_data)
+
+            updated_ticket = self.ticket_use_case.update_ticket(id, ticket)
+            if updated_ticket:
+                self.write_body(ticket_plan("summary").encode(updated_ticket))
+            else:
+                self.send_error(404, "Ticket não encontrado ou dados inválidos")
+        except json.JSONDecodeError:
+            self.send_error(400, "JSON inválido")
+        except Exception as e:
+            self.send_error(500, f"Erro ao atualizar ticket: {str(e)}")
+
+    def _delete_ticket(self, query_params, id: int):
+        """Exclui um ticket."""
+        if self.ticket_use_case.delete_ticket(id):
+            response = {"message": f"Ticket com ID {id} foi excluído"}
+            self.write_json(response)
         else:
-            self.send_error(404, "Endpoint não encontrado")
+            self.send_error(404, "Ticket não encontrado")
 
-    def do_DELETE(self):
-        """Tratamento para requisições DELETE."""
-        if self.path.startswith("/tickets/"):
+    def _create_batch(self, query_params):
+        """Cria tickets em lote."""
+        self._handle_batch("create")
+
+    def _update_batch(self, query_params):
+        """Atualiza tickets em lote."""
+        self._handle_batch("update")
+
+    def _delete_batch(self, query_params):
+        """Exclui tickets em lote."""
+        self._handle_batch("delete")
+
+    def _handle_batch(self, operation: str):
+        """Executa uma operação em lote e responde com um resultado por item.
+
+        Corpo aceito: um array de itens ou um objeto com ``tickets`` (criação e
+        atualização) ou ``ids`` (exclusão). Na atualização cada item traz o
+        ``id`` junto dos campos do ticket.
+        """
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(content_length).decode())
+        except (ValueError, UnicodeDecodeError):
+            self.send_error(400, "JSON inválido")
+            return
+
+        if isinstance(payload, dict):
+            payload = payload.get("ids" if operation == "delete" else "tickets")
+        if not isinstance(payload, list) or not payload:
+            self.send_error(400, "O lote deve ser uma lista não vazia")
+            return
+        if len(payload) > BATCH_MAX_ITEMS:
+            self.send_error(413, f"O lote aceita no máximo {BATCH_MAX_ITEMS} itens")
+            return
+
+        # Itens malformados viram resultados de erro sem impedir os demais
+        parsed = []
+        errors = {}
+        for index, item in enumerate(payload):
             try:
-                ticket_id = int(self.path.split("/")[-1])
-                if self.ticket_use_case.delete_ticket(ticket_id):
-                    self.set_headers()
-                    response = {"message": f"Ticket com ID {ticket_id} foi excluído"}
-                    self.wfile.write(json.dumps(response).encode())
+                if operation == "create":
+                    parsed.append((index, ticket_from_payload(item)))
+                elif operation == "update":
+                    parsed.append((index, (int(item["id"]), ticket_from_payload(item))))
                 else:
-                    self.send_error(404, "Ticket não encontrado")
-            except (ValueError, IndexError):
-                self.send_error(400, "ID inválido")
-        else:
-            self.send_error(404, "Endpoint não encontrado")
+                    ticket_id = item["id"] if isinstance(item, dict) else item
+                    parsed.append((index, int(ticket_id)))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                errors[index] = "Item inválido"
 
-    def _serve_swagger_ui(self):
-        """Serve a página do Swagger UI."""
+        items = [item for _, item in parsed]
         try:
-            # Lê o arquivo HTML do Swagger UI
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            html_path = os.path.join(current_dir, "swagger_ui.html")
+            if operation == "create":
+                batch = self.ticket_use_case.create_many_tickets(items)
+            elif operation == "update":
+                batch = self.ticket_use_case.update_many_tickets(items)
+            else:
+                batch = self.ticket_use_case.delete_many_tickets(items)
+        except Exception as e:
+            self.send_error(500, f"Erro ao processar lote: {str(e)}")
+            return
 
-            with open(html_path, "r", encoding="utf-8") as f:
-                html_content = f.read()
+        results = [
+            {"index": index, "success": False, "id": None, "error": error}
+            for index, error in errors.items()
+        ]
+        for (index, _), result in zip(parsed, batch):
+            results.append(
+                {
+                    "index": index,
+                    "success": result.success,
+                    "id": result.ticket_id,
+                    "error": result.error,
+                }
+            )
+        results.sort(key=lambda result: result["index"])
 
-            self.set_headers("text/html; charset=utf-8")
-            self.wfile.write(html_content.encode("utf-8"))
+        succeeded = sum(1 for result in results if result["success"])
+        self.write_json(
+            {
+                "results": results,
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+            }
+        )
+
+    def _write_ticket(self, ticket):
+        """Envia o detalhe do ticket com ETag, ou 304 se o cliente já o tem.
+
+        Com ``date_mod`` a ETag sai sem serializar o ticket; sem ele, vem do
+        hash do corpo.
+        """
+        if_none_match = self.headers.get("If-None-Match")
+        etag = ticket_etag(ticket)
+        body = None
+        if etag is None:
+            body = ticket_plan("detail").encode(ticket)
+            etag = content_etag(body, weak=True)
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(if_none_match, etag):
+            self.send_not_modified(headers)
+            return
+
+        if body is None:
+            body = ticket_plan("detail").encode(ticket)
+        self.write_body(body, extra_headers=headers)
+
+    def _get_profile(self, query_params):
+        """Resumo das funções mais caras por rota, vindo do profiler."""
+        if not PROFILER.authorized(self.headers):
+            self.send_error(404, "Endpoint não encontrado")
+            return
+        try:
+            top = int(query_params.get("top", ["20"])[0])
+        except ValueError:
+            self.send_error(400, "Parâmetro top inválido")
+            return
+
+        try:
+            summary = PROFILER.summary(
+                query_params.get("route", [None])[0],
+                top=top,
+                sort=query_params.get("sort", ["cumulative"])[0],
+            )
+        except KeyError:
+            self.send_error(400, "Ordenação inválida")
+            return
+        self.write_body(summary.encode(), "text/plain; charset=utf-8")
+
+    def _serve_asset(self, name: str):
+        """Serve um recurso estático pré-computado, com gzip e cache HTTP."""
+        try:
+            asset = get_asset(name)
         except FileNotFoundError:
             self.send_error(500, "Arquivo de documentação não encontrado")
+            return
         except Exception as e:
-            self.send_error(500, f"Erro ao servir documentação: {str(e)}")
+            self.send_error(500, f"Erro ao gerar documentação: {str(e)}")
+            return
 
-    def _serve_openapi_spec(self):
-        """Serve a especificação OpenAPI em JSON."""
-        try:
-            swagger_gen = SwaggerGenerator()
-            spec_json = swagger_gen.get_json()
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        headers = {
+            "ETag": asset.gzip_etag if use_gzip else asset.etag,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        if asset.matches(self.headers.get("If-None-Match")):
+            self.send_not_modified(headers)
+            return
+
+        if use_gzip:
+            headers["Content-Encoding"] = GZIP
+            self.write_body(asset.gzipped, asset.content_type, headers)
+        else:
+            self.write_body(asset.body, asset.content_type, headers)
+
+    def _stream_format(self, query_params) -> Optional[str]:
+        """Formato de streaming pedido pelo cliente, se houver.
 
-            self.set_headers("application/json")
-            self.wfile.write(spec_json.encode("utf-8"))
+        ``Accept: application/x-ndjson`` (ou ``format=ndjson``) produz uma
+        linha JSON por ticket; ``stream=true`` produz um array JSON enviado
+        aos poucos.
+        """
+        if (
+            NDJSON in self.headers.get("Accept", "")
+            or query_params.get("format", [""])[0] == "ndjson"
+        ):
+            return NDJSON
+        if query_params.get("stream", [""])[0].lower() in ("1", "true"):
+            return "application/json"
+        return None
+
+    def _stream_tickets(
+        self,
+        content_type: str,
+        offset: int,
+        limit: Optional[int],
+        fields: Sequence[str] = SUMMARY_FIELDS,
+        ticket_filter: Optional[TicketFilter] = None,
+    ):
+        """Escreve os tickets à medida que o repositório os produz."""
+        tickets = self.ticket_use_case.iter_tickets(
+            offset, limit, fields, ticket_filter
+        )
+        chunked = self.request_version != "HTTP/1.0"
+        if not chunked:
+            # HTTP/1.0 não conhece chunked: o fim do corpo é o fim da conexão
+            self.close_connection = True
+
+        compressor = None
+        extra_headers = {"Vary": "Accept-Encoding"}
+        if GZIP_LEVEL > 0 and accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            compressor = GzipStream(GZIP_LEVEL)
+            extra_headers["Content-Encoding"] = GZIP
+
+        self.set_headers(content_type, extra_headers, chunked=chunked)
+
+        writer = ChunkedWriter(self.wfile, chunked=chunked, gzip=compressor)
+        try:
+            encode = ticket_plan(fields).encode
+            if content_type == NDJSON:
+                write_ndjson(writer, tickets, encode)
+            else:
+                write_json_array(writer, tickets, encode)
+            writer.close()
         except Exception as e:
-            self.send_error(500, f"Erro ao gerar especificação: {str(e)}")
+            # Os cabeçalhos já foram enviados: a única sinalização possível é
+            # encerrar a conexão sem o chunk final
+            self.close_connection = True
+            self.log_error("Erro durante o streaming de tickets: %s", str(e))
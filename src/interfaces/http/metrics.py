@@ -0,0 +1,61 @@
+"""
+Métricas das requisições HTTP atendidas pela API.
+"""
+import functools
+import time
+from src.infrastructure.metrics import REGISTRY
+from src.interfaces.http.routing import ROUTES
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Requisições atendidas por método, rota e status",
+    ("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "Requisições em andamento por método e rota",
+    ("method", "route"),
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições por método e rota",
+    ("method", "route"),
+)
+HTTP_REJECTED = REGISTRY.counter(
+    "http_rejected_connections_total",
+    "Conexões recusadas com 503 por fila de atendimento cheia",
+)
+
+
+def route_template(path: str) -> str:
+    """Rota da requisição com os parâmetros de caminho trocados por nomes.
+
+    Vem da tabela ``ROUTES``; caminhos desconhecidos viram ``other`` para não
+    criar séries sem limite.
+    """
+    return ROUTES.template(path)
+
+
+def instrumented(handler_method):
+    """Mede um ``do_<MÉTODO>`` do handler: contagem, em andamento e latência.
+
+    O status vem de ``status_code``, gravado pelo ``send_response`` do handler.
+    """
+    method = handler_method.__name__[len("do_") :]  # noqa: E203
+
+    @functools.wraps(handler_method)
+    def wrapper(self):
+        route = route_template(self.path)
+        self.status_code = None
+        HTTP_IN_FLIGHT.inc(method, route)
+        start = time.perf_counter()
+        try:
+            return handler_method(self)
+        finally:
+            HTTP_IN_FLIGHT.dec(method, route)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, method, route)
+            HTTP_REQUESTS.inc(method, route, self.status_code or 500)
+
+    return wrapper
@@ -0,0 +1,82 @@
+"""
+Parâmetros de paginação (limit/offset/cursor) da listagem de tickets.
+"""
+import base64
+import binascii
+import os
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_LIMIT = int(os.getenv("TICKETS_DEFAULT_LIMIT", 50))
+MAX_LIMIT = int(os.getenv("TICKETS_MAX_LIMIT", 1000))
+
+_CURSOR_PREFIX = "offset:"
+
+
+def encode_cursor(offset: int) -> str:
+    """Gera um cursor opaco que aponta para ``offset``."""
+    raw = f"{_CURSOR_PREFIX}{offset}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Recupera o offset de um cursor gerado por ``encode_cursor``."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Cursor inválido") from e
+
+    if not raw.startswith(_CURSOR_PREFIX):
+        raise ValueError("Cursor inválido")
+    return _non_negative(raw.removeprefix(_CURSOR_PREFIX))
+
+
+def parse_pagination(
+    query_params: Dict[str, List[str]],
+    default_limit: Optional[int] = DEFAULT_LIMIT,
+    max_limit: Optional[int] = MAX_LIMIT,
+) -> Tuple[int, Optional[int]]:
+    """Lê ``offset`` e ``limit`` da query string; ``cursor`` substitui ``offset``.
+
+    ``max_limit=None`` desativa o teto. Lança ``ValueError`` para valores
+    inválidos.
+    """
+    limit = default_limit
+    if "limit" in query_params:
+        limit = _non_negative(query_params["limit"][0])
+        if limit == 0 or (max_limit is not None and limit > max_limit):
+            raise ValueError(f"limit deve estar entre 1 e {max_limit}")
+
+    offset = 0
+    if "cursor" in query_params:
+        offset = decode_cursor(query_params["cursor"][0])
+    elif "offset" in query_params:
+        offset = _non_negative(query_params["offset"][0])
+
+    return offset, limit
+
+
+def next_page_headers(
+    path: str, offset: int, limit: int, count: int, query: str = ""
+) -> Dict[str, str]:
+    """Cabeçalhos que apontam para a próxima página quando ela pode existir.
+
+    ``query`` são parâmetros extras (já codificados) repetidos no ``Link``.
+    """
+    if count < limit:
+        return {}
+
+    cursor = encode_cursor(offset + limit)
+    extra = f"&{query}" if query else ""
+    return {
+        "X-Next-Cursor": cursor,
+        "Link": f'<{path}?limit={limit}&cursor={cursor}{extra}>; rel="next"',
+    }
+
+
+def _non_negative(value: str) -> int:
+    """Converte para inteiro não negativo."""
+    number = int(value)
+    if number < 0:
+        raise ValueError("Valor negativo")
+    return number
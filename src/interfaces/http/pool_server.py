@@ -0,0 +1,139 @@
+"""
+Servidores HTTP com modelo de concorrência configurável.
+"""
+import os
+import queue
+import threading
+from http.server import HTTPServer
+from typing import Optional
+from src.interfaces.http.metrics import HTTP_REJECTED
+
+SINGLE = "single"
+THREADPOOL = "threadpool"
+
+_REJECT_BODY = b'{"error": "Servidor sobrecarregado, tente novamente"}'
+REJECT_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n"
+    + f"Content-Length: {len(_REJECT_BODY)}\r\n\r\n".encode()
+    + _REJECT_BODY
+)
+
+
+class BoundedThreadPoolServer(HTTPServer):
+    """Servidor HTTP que atende conexões em um pool fixo de threads.
+
+    As conexões aceitas esperam em uma fila limitada; quando ela está cheia,
+    o servidor responde 503 imediatamente em vez de criar novas threads.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = 16,
+        max_queue: int = 64,
+        bind_and_activate: bool = True,
+    ):
+        if max_workers < 1 or max_queue < 1:
+            raise ValueError("max_workers e max_queue devem ser maiores que zero")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected_requests = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._workers = []
+
+        super().__init__(server_address, handler_class, bind_and_activate)
+
+        for index in range(max_workers):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"http-worker-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def process_request(self, request, client_address):
+        """Enfileira a conexão para um worker ou a rejeita se a fila estiver cheia."""
+        try:
+            self._queue.put_nowait((request, client_address))
+        except queue.Full:
+            self.rejected_requests += 1
+            HTTP_REJECTED.inc()
+            self._reject(request)
+            self.shutdown_request(request)
+
+    def queue_depth(self) -> int:
+        """Número de conexões aguardando um worker livre."""
+        return self._queue.qsize()
+
+    def server_close(self):
+        """Fecha o socket e encerra os workers."""
+        super().server_close()
+        for _ in self._workers:
+            self._queue.put((None, None))
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+
+    def _worker_loop(self):
+        """Consome conexões da fila até receber o sinal de parada."""
+        while True:
+            request, client_address = self._queue.get()
+            if request is None:
+                return
+
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def _reject(self, request):
+        """Responde 503 sem bloquear a thread que aceita conexões."""
+        try:
+            # Descarta o que já chegou para o close não virar um RST
+            request.setblocking(False)
+            try:
+                request.recv(65536)
+            except (BlockingIOError, OSError):
+                pass
+            request.setblocking(True)
+            request.sendall(REJECT_RESPONSE)
+        except OSError:
+            pass
+
+
+def create_server(
+    server_address,
+    handler_class,
+    mode: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    max_queue: Optional[int] = None,
+) -> HTTPServer:
+    """Cria o servidor HTTP conforme o modelo de concorrência configurado.
+
+    Os valores não informados são lidos de ``SERVER_CONCURRENCY``
+    (``threadpool`` ou ``single``), ``SERVER_MAX_WORKERS`` e
+    ``SERVER_MAX_QUEUE``.
+    """
+    if mode is None:
+        mode = os.getenv("SERVER_CONCURRENCY", THREADPOOL)
+
+    if mode == SINGLE:
+        return HTTPServer(server_address, handler_class)
+
+    if mode != THREADPOOL:
+        raise ValueError(f"Modelo de concorrência desconhecido: {mode}")
+
+    if max_workers is None:
+        max_workers = int(os.getenv("SERVER_MAX_WORKERS", 16))
+    if max_queue is None:
+        max_queue = int(os.getenv("SERVER_MAX_QUEUE", 64))
+
+    return BoundedThreadPoolServer(
+        server_address, handler_class, max_workers=max_workers, max_queue=max_queue
+    )
@@ -0,0 +1,170 @@
+"""
+Profiling sob demanda das requisições HTTP com ``cProfile``.
+
+Desligado por padrão. Com ``PROFILE_ENABLED=true`` uma fração
+(``PROFILE_SAMPLE_RATE``) das requisições roda sob o profiler; com
+``PROFILE_TOKEN`` definido, qualquer requisição com o cabeçalho
+``X-Profile-Token`` correspondente também é perfilada. As estatísticas são
+somadas por rota e gravadas em ``PROFILE_DIR/<método>_<rota>.pstats``.
+
+Resumo das funções mais caras: ``GET /debug/profile`` ou
+``python -m src.interfaces.http.profiling profiles/*.pstats``.
+"""
+import argparse
+import cProfile
+import functools
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import threading
+from typing import Dict, List, Optional
+from src.infrastructure.app_context import env_flag
+from src.interfaces.http.metrics import route_template
+
+PROFILE_HEADER = "X-Profile-Token"
+
+
+class RequestProfiler:
+    """Perfila requisições amostradas e agrega os ``pstats`` por rota."""
+
+    def __init__(
+        self,
+        directory: str = "profiles",
+        sample_rate: float = 0.01,
+        token: str = "",
+        enabled: bool = False,
+    ):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.token = token
+        self.enabled = enabled
+        self.samples: Dict[str, int] = {}
+        self._stats: Dict[str, pstats.Stats] = {}
+        self._stats_lock = threading.Lock()
+        # Um profiler ativo por vez: a partir do Python 3.12 o cProfile é
+        # global ao interpretador, e requisições concorrentes se misturariam
+        self._active = threading.Lock()
+
+    def should_profile(self, headers) -> bool:
+        """Indica se a requisição deve rodar sob o profiler."""
+        if self.token and self._has_token(headers):
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    def authorized(self, headers) -> bool:
+        """Permite ver os resultados: exige o token, se houver um configurado."""
+        if self.token:
+            return self._has_token(headers)
+        return self.enabled
+
+    def run(self, key: str, func, *args):
+        """Executa ``func`` sob o profiler e soma o resultado às stats de ``key``.
+
+        Se outra requisição já estiver sendo perfilada, executa sem profiler.
+        """
+        if not self._active.acquire(blocking=False):
+            return func(*args)
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+            try:
+                return func(*args)
+            finally:
+                profile.disable()
+        finally:
+            self._active.release()
+            self._record(key, profile)
+
+    def routes(self) -> List[str]:
+        """Rotas com amostras coletadas."""
+        with self._stats_lock:
+            return sorted(self._stats)
+
+    def summary(
+        self, key: Optional[str] = None, top: int = 20, sort: str = "cumulative"
+    ) -> str:
+        """Texto com as ``top`` funções de cada rota (ou só de ``key``)."""
+        output = io.StringIO()
+        with self._stats_lock:
+            for route in sorted(self._stats):
+                if key is not None and route != key:
+                    continue
+                output.write(f"== {route} ({self.samples[route]} amostra(s)) ==\n")
+                stats = self._stats[route]
+                stats.stream = output
+                stats.sort_stats(sort).print_stats(top)
+        return output.getvalue() or "Nenhuma amostra coletada\n"
+
+    def path_for(self, key: str) -> str:
+        """Arquivo ``.pstats`` de uma rota."""
+        name = re.sub(r"[^A-Za-z0-9]+", "_", key).strip("_") or "root"
+        return os.path.join(self.directory, f"{name}.pstats")
+
+    def _record(self, key: str, profile: cProfile.Profile) -> None:
+        with self._stats_lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+            self.samples[key] = self.samples.get(key, 0) + 1
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(self.path_for(key))
+            except OSError:
+                pass
+
+    def _has_token(self, headers) -> bool:
+        # Compara bytes: com ``str``, ``compare_digest`` recusa o que não é
+        # ASCII. O cabeçalho chega decodificado em latin-1, o que devolve os
+        # bytes enviados; o token é comparado com sua forma UTF-8
+        received = headers.get(PROFILE_HEADER, "").encode("latin-1")
+        return hmac.compare_digest(received, self.token.encode("utf-8"))
+
+
+PROFILER = RequestProfiler(
+    directory=os.getenv("PROFILE_DIR", "profiles"),
+    sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", 0.01)),
+    token=os.getenv("PROFILE_TOKEN", ""),
+    enabled=env_flag("PROFILE_ENABLED"),
+)
+
+
+def profiled(handler_method):
+    """Roda um ``do_<MÉTODO>`` do handler sob o profiler quando amostrado.
+
+    Desligado, o custo é a checagem de dois atributos por requisição.
+    """
+    method = handler_method.__name__[len("do_") :]  # noqa: E203
+
+    @functools.wraps(handler_method)
+    def wrapper(self):
+        if not PROFILER.should_profile(self.headers):
+            return handler_method(self)
+        key = f"{method} {route_template(self.path)}"
+        return PROFILER.run(key, handler_method, self)
+
+    return wrapper
+
+
+def main(argv=None):
+    """Resume arquivos ``.pstats`` gravados pelo profiler."""
+    parser = argparse.ArgumentParser(description="Resumo dos perfis por rota")
+    parser.add_argument("files", nargs="+", help="Arquivos .pstats")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--sort", default="cumulative", help="Ordenação do pstats (ex.: tottime)"
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        print(f"== {path} ==")
+        pstats.Stats(path).sort_stats(args.sort).print_stats(args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Tabela de rotas da API, compilada uma vez na carga do módulo.
+
+Cada rota liga um método HTTP e um padrão de caminho (``/tickets/{id:int}``)
+ao nome do método do ``APIHandler`` que a atende. Caminhos fixos são achados
+em um dicionário; os que têm parâmetros, em uma árvore de segmentos, em
+O(segmentos do caminho). A mesma tabela gera os ``paths`` do OpenAPI.
+"""
+import functools
+import re
+import types
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {"int": int, "str": str}
+
+_PARAM = re.compile(r"^\{(\w+)(?::(\w+))?\}$")
+
+
+@dataclass(frozen=True)
+class Route:
+    """Uma rota: método HTTP, padrão do caminho e método do handler.
+
+    Rotas com ``documented=False`` (documentação, depuração) ficam fora da
+    especificação OpenAPI.
+    """
+
+    method: str
+    pattern: str
+    handler: str
+    documented: bool = True
+    # Padrão sem os conversores (``/tickets/{id}``), como no OpenAPI
+    template: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "template", re.sub(r"\{(\w+):\w+\}", r"{\1}", self.pattern)
+        )
+
+
+class RouteMatch(NamedTuple):
+    """Rota encontrada e os parâmetros de caminho já convertidos."""
+
+    route: Route
+    params: Dict[str, Any]
+
+
+class InvalidPathParameter(ValueError):
+    """Parâmetro de caminho que o conversor da rota não aceita."""
+
+    def __init__(self, name: str, value: str):
+        super().__init__(f"Parâmetro {name} inválido: {value!r}")
+        self.name = name
+        self.value = value
+
+
+class _Node:
+    """Nó da árvore de segmentos."""
+
+    __slots__ = ("children", "param", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # (nome, tipo, conversor, próximo nó) do segmento variável, se houver
+        self.param: Optional[Tuple[str, str, Callable[[str], Any], "_Node"]] = None
+        self.routes: Dict[str, Route] = {}
+
+
+class Router:
+    """Encontra a rota de uma requisição pelo método e pelo caminho.
+
+    Segmentos fixos têm prioridade sobre parâmetros: ``/tickets/batch`` não
+    cai em ``/tickets/{id:int}``.
+    """
+
+    def __init__(self, routes: Iterable[Route]):
+        self.routes = tuple(routes)
+        self._static: Dict[str, Dict[str, Route]] = {}
+        self._root = _Node()
+        for route in self.routes:
+            self._add(route)
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        """Rota de ``method`` em ``path`` (sem query string), ou ``None``.
+
+        Lança ``InvalidPathParameter`` se o caminho casar com a rota, mas um
+        parâmetro não puder ser convertido.
+        """
+        static = self._static.get(path)
+        if static is not None and method in static:
+            return RouteMatch(static[method], {})
+
+        found = self._walk(path)
+        if found is None:
+            return None
+        node, values = found
+        route = node.routes.get(method)
+        if route is None:
+            return None
+
+        params = {}
+        for (name, convert), value in values:
+            try:
+                params[name] = convert(value)
+            except ValueError:
+                raise InvalidPathParameter(name, value) from None
+        return RouteMatch(route, params)
+
+    def template(self, path: str) -> str:
+        """Padrão da rota de ``path`` para qualquer método, ou ``other``.
+
+        Usado como rótulo das métricas; caminhos desconhecidos viram
+        ``other`` para não criar séries sem limite.
+        """
+        path = path.split("?", 1)[0]
+        if path in self._static:
+            return path
+        found = self._walk(path)
+        if found is None or not found[0].routes:
+            return "other"
+        return next(iter(found[0].routes.values())).template
+
+    def _walk(self, path: str):
+        """Nó de ``path`` na árvore e os valores crus dos parâmetros."""
+        node = self._root
+        values = []
+        for segment in path.split("/")[1:]:
+            child = node.children.get(segment)
+            if child is None:
+                if node.param is None:
+                    return None
+                name, _, convert, child = node.param
+                values.append(((name, convert), segment))
+            node = child
+        return node, values
+
+    def _add(self, route: Route) -> None:
+        segments = route.pattern.split("/")[1:]
+        if not any(_PARAM.match(segment) for segment in segments):
+            self._static.setdefault(route.pattern, {})[route.method] = route
+            return
+
+        node = self._root
+        for segment in segments:
+            param = _PARAM.match(segment)
+            if param is None:
+                node = node.children.setdefault(segment, _Node())
+                continue
+            name, kind = param.group(1), param.group(2) or "str"
+            if node.param is None:
+                node.param = (name, kind, CONVERTERS[kind], _Node())
+            elif node.param[:2] != (name, kind):
+                raise ValueError(
+                    f"Parâmetro {segment} de {route.pattern} conflita com "
+                    f"{{{node.param[0]}:{node.param[1]}}}"
+                )
+            node = node.param[3]
+        if route.method in node.routes:
+            raise ValueError(f"Rota duplicada: {route.method} {route.pattern}")
+        node.routes[route.method] = route
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_query(query: str) -> Mapping[str, Tuple[str, ...]]:
+    """``parse_qs`` com cache para as query strings que se repetem.
+
+    O resultado é compartilhado entre requisições, por isso é somente
+    leitura.
+    """
+    return types.MappingProxyType(
+        {name: tuple(values) for name, values in urllib.parse.parse_qs(query).items()}
+    )
+
+
+ROUTES = Router(
+    [
+        Route("GET", "/", "_get_root"),
+        Route("GET", "/metrics", "_get_metrics"),
+        Route("GET", "/tickets", "_list_tickets"),
+        Route("POST", "/tickets", "_create_ticket"),
+        Route("POST", "/tickets/batch", "_create_batch"),
+        Route("PUT", "/tickets/batch", "_update_batch"),
+        Route("DELETE", "/tickets/batch", "_delete_batch"),
+        Route("GET", "/tickets/{id:int}", "_get_ticket"),
+        Route("PUT", "/tickets/{id:int}", "_update_ticket"),
+        Route("DELETE", "/tickets/{id:int}", "_delete_ticket"),
+        Route("GET", "/projects/{tag}/progress", "_get_project_progress"),
+        Route("GET", "/docs", "_get_docs", documented=False),
+        Route("GET", "/docs/", "_get_docs", documented=False),
+        Route("GET", "/api/openapi.json", "_get_openapi_json", documented=False),
+        Route("GET", "/api/openapi.yaml", "_get_openapi_yaml", documented=False),
+        Route("GET", "/debug/profile", "_get_profile", documented=False),
+    ]
+)
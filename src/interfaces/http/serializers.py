@@ -0,0 +1,182 @@
+"""
+Conversão entre tickets e o JSON exposto pela API.
+
+As visões de cada entidade (``summary``, ``detail`` ou uma lista de campos)
+viram planos calculados uma vez: os atributos lidos de uma vez por um
+``attrgetter`` e o conversor de cada campo (nome do enum por dicionário,
+datas em ISO 8601). ``dumps`` gera os bytes da resposta com o ``orjson``,
+se instalado, ou com o ``json`` da biblioteca padrão (os dois compactos).
+"""
+import functools
+import json
+import typing
+from enum import Enum
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.core.glpi_entities import (
+    SUMMARY_FIELDS,
+    TICKET_FIELDS,
+    GLPITicket,
+    TicketPriority,
+    TicketStatus,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Campos da representação completa (``GET /tickets/{id}``)
+DETAIL_FIELDS = (
+    "id",
+    "name",
+    "content",
+    "status",
+    "priority",
+    "assigned_user_id",
+    "assigned_group_id",
+)
+
+
+def _stdlib_dumps(payload: Any) -> bytes:
+    """JSON compacto com o ``json`` da biblioteca padrão."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+dumps: Callable[[Any], bytes] = orjson.dumps if orjson is not None else _stdlib_dumps
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _converter(hint) -> Optional[Callable[[Any], Any]]:
+    """Conversor de um campo a partir da anotação, ou ``None`` se já é JSON."""
+    for kind in typing.get_args(hint) or (hint,):
+        if isinstance(kind, type) and issubclass(kind, Enum):
+            names: Dict[Any, Optional[str]] = {None: None}
+            names.update((member, member.name) for member in kind)
+            return names.__getitem__
+        if kind is datetime:
+            return _isoformat
+    return None
+
+
+class FieldPlan:
+    """Campos de uma visão de entidade e o conversor de cada um."""
+
+    __slots__ = ("fields", "_get", "_converters")
+
+    def __init__(self, entity: type, fields: Sequence[str]):
+        hints = typing.get_type_hints(entity)
+        self.fields = tuple(fields)
+        self._converters = tuple(_converter(hints[name]) for name in self.fields)
+        getter = attrgetter(*self.fields)
+        # Com um só nome o attrgetter devolve o valor, não uma tupla
+        self._get = getter if len(self.fields) > 1 else lambda obj: (getter(obj),)
+
+    def to_dict(self, obj: Any) -> dict:
+        """Representação da entidade só com os campos do plano."""
+        return {
+            name: value if convert is None else convert(value)
+            for name, convert, value in zip(
+                self.fields, self._converters, self._get(obj)
+            )
+        }
+
+    def encode(self, obj: Any) -> bytes:
+        """JSON da entidade."""
+        return dumps(self.to_dict(obj))
+
+    def encode_many(self, objs: Iterable[Any]) -> bytes:
+        """Array JSON das entidades."""
+        to_dict = self.to_dict
+        return dumps([to_dict(obj) for obj in objs])
+
+
+class SerializerRegistry:
+    """Planos de serialização por entidade e visão.
+
+    Visões nomeadas são registradas com ``register``; listas de campos
+    avulsas (``fields=``) geram planos guardados em um cache LRU de até
+    ``max_adhoc`` entradas, já que cada ordem de campos pedida pelo cliente
+    é uma lista diferente.
+    """
+
+    def __init__(self, max_adhoc: int = 256):
+        self._plans: Dict[Tuple[type, str], FieldPlan] = {}
+        self._adhoc = functools.lru_cache(maxsize=max_adhoc)(FieldPlan)
+
+    def register(self, entity: type, view: str, fields: Sequence[str]) -> None:
+        """Registra a visão ``view`` da entidade com os campos informados."""
+        self._plans[(entity, view)] = FieldPlan(entity, fields)
+
+    def plan(self, entity: type, view: Any) -> FieldPlan:
+        """Plano de uma visão registrada ou de uma sequência de campos."""
+        if not isinstance(view, str):
+            return self._adhoc(entity, tuple(view))
+        plan = self._plans.get((entity, view))
+        if plan is None:
+            raise KeyError(f"Visão não registrada: {entity.__name__}.{view}")
+        return plan
+
+
+SERIALIZERS = SerializerRegistry()
+SERIALIZERS.register(GLPITicket, "summary", SUMMARY_FIELDS)
+SERIALIZERS.register(GLPITicket, "detail", DETAIL_FIELDS)
+
+
+def parse_fields(
+    value: Optional[str], default: Sequence[str] = SUMMARY_FIELDS
+) -> List[str]:
+    """Lê a lista de campos de ``fields=`` (separados por vírgula).
+
+    Levanta ``ValueError`` se algum campo não existir.
+    """
+    if not value:
+        return list(default)
+
+    fields: List[str] = []
+    for name in value.split(","):
+        name = name.strip()
+        if not name or name in fields:
+            continue
+        if name not in TICKET_FIELDS:
+            raise ValueError(f"Campo desconhecido: {name}")
+        fields.append(name)
+
+    return fields or list(default)
+
+
+def ticket_plan(fields: Any) -> FieldPlan:
+    """Plano de tickets de uma visão (``summary``/``detail``) ou de campos."""
+    return SERIALIZERS.plan(GLPITicket, fields)
+
+
+def ticket_summary(ticket: GLPITicket) -> dict:
+    """Representação resumida de um ticket (listagens e respostas de escrita)."""
+    return ticket_plan("summary").to_dict(ticket)
+
+
+def ticket_detail(ticket: GLPITicket) -> dict:
+    """Representação completa de um ticket (``GET /tickets/{id}``)."""
+    return ticket_plan("detail").to_dict(ticket)
+
+
+def ticket_from_payload(ticket_data: dict) -> GLPITicket:
+    """Monta um ticket a partir do JSON recebido."""
+    return GLPITicket(
+        name=ticket_data.get("name", ""),
+        content=ticket_data.get("content", ""),
+        status=TicketStatus[ticket_data.get("status", "NEW")]
+        if ticket_data.get("status")
+        else TicketStatus.NEW,
+        priority=TicketPriority[ticket_data.get("priority", "MEDIUM")]
+        if ticket_data.get("priority")
+        else TicketPriority.MEDIUM,
+        category_id=ticket_data.get("category_id"),
+        assigned_user_id=ticket_data.get("assigned_user_id"),
+        assigned_group_id=ticket_data.get("assigned_group_id"),
+    )
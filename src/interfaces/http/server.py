@@ -1,42 +1,42 @@
 """
 Servidor HTTP principal.
 """
-import socketserver
 import os
 from functools import partial
-from src.core.glpi_use_cases import GLPITicketUseCase
-from src.infrastructure.glpi_client import GLPIHTTPClient
-from src.infrastructure.glpi_ticket_repository import GLPITicketRepository
+from typing import Optional
+from src.infrastructure.app_context import AppContext, get_app_context
 from src.interfaces.http.handler import APIHandler
-from src.core.glpi_entities import GLPIConfig
+from src.interfaces.http.pool_server import create_server
+from src.interfaces.http.static_assets import preload_assets
 
 
-def create_handler(*args, **kwargs):
-    """Factory para criar o handler com as dependências injetadas."""
-    # Inicializa as dependências do GLPI a partir das variáveis de ambiente
-    glpi_config = GLPIConfig(
-        base_url=os.getenv("GLPI_BASE_URL", "http://localhost/glpi/apirest.php"),
-        app_token=os.getenv("GLPI_APP_TOKEN", ""),
-        user_token=os.getenv("GLPI_USER_TOKEN", ""),
-        timeout=30,
-    )
-    glpi_client = GLPIHTTPClient(glpi_config)
-    ticket_repository = GLPITicketRepository(glpi_client)
-    ticket_use_case = GLPITicketUseCase(ticket_repository)
+def create_handler(app_context: AppContext, *args, **kwargs):
+    """Factory para criar o handler com as dependências compartilhadas."""
+    return APIHandler(app_context.ticket_use_case, *args, **kwargs)
 
-    # Cria o handler com as dependências
-    return APIHandler(ticket_use_case, *args, **kwargs)
 
+def run_server(
+    port=None, app_context: Optional[AppContext] = None, mode: Optional[str] = None
+):
+    """Executa o servidor HTTP.
 
-def run_server(port=None):
-    """Executa o servidor HTTP."""
+    ``mode`` escolhe o modelo de concorrência (``threadpool`` ou ``single``);
+    quando omitido, vem de ``SERVER_CONCURRENCY``.
+    """
     if port is None:
         # Railway usa PORT, outros podem usar SERVER_PORT
         port = int(os.getenv("PORT", os.getenv("SERVER_PORT", 8000)))
 
-    handler = partial(create_handler)
+    # Dependências montadas e autenticadas uma vez, antes de abrir a porta
+    if app_context is None:
+        app_context = get_app_context()
+    app_context.warm_up()
+    # Especificação OpenAPI e Swagger UI ficam prontas antes do primeiro acesso
+    preload_assets()
 
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    handler = partial(create_handler, app_context)
+
+    with create_server(("", port), handler, mode=mode) as httpd:
         print(f"Servidor rodando em http://localhost:{port}")
         print("Pressione Ctrl+C para parar o servidor")
         try:
@@ -44,6 +44,8 @@ def run_server(port=None):
         except KeyboardInterrupt:
             print("\nServidor encerrado")
             httpd.server_close()
+        finally:
+            app_context.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Respostas estáticas (especificação OpenAPI e Swagger UI) pré-computadas.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+from src.interfaces.http.compression import gzip_bytes
+from src.interfaces.http.conditional import content_etag, etag_matches
+from src.interfaces.http.swagger import SwaggerGenerator
+
+SWAGGER_UI = "swagger_ui"
+OPENAPI_JSON = "openapi.json"
+OPENAPI_YAML = "openapi.yaml"
+
+CACHE_CONTROL = f"public, max-age={int(os.getenv('STATIC_ASSETS_MAX_AGE', 300))}"
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """Corpo pronto para envio, com a variante gzip e as ETags de cada uma."""
+
+    body: bytes
+    content_type: str
+    etag: str
+    gzipped: bytes
+    gzip_etag: str
+
+    @classmethod
+    def from_bytes(cls, body: bytes, content_type: str) -> "StaticAsset":
+        """Calcula a ETag forte e a variante comprimida do corpo."""
+        etag = content_etag(body)
+        return cls(
+            body=body,
+            content_type=content_type,
+            etag=etag,
+            gzipped=gzip_bytes(body, level=9),
+            # Cada representação precisa de uma ETag forte própria
+            gzip_etag=f'{etag[:-1]}-gzip"',
+        )
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Indica se ``If-None-Match`` corresponde a alguma das representações."""
+        return etag_matches(if_none_match, self.etag, self.gzip_etag)
+
+
+def _swagger_ui() -> StaticAsset:
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(current_dir, "swagger_ui.html"), "rb") as f:
+        return StaticAsset.from_bytes(f.read(), "text/html; charset=utf-8")
+
+
+def _openapi_json() -> StaticAsset:
+    spec = SwaggerGenerator().get_json().encode("utf-8")
+    return StaticAsset.from_bytes(spec, "application/json")
+
+
+def _openapi_yaml() -> StaticAsset:
+    spec = SwaggerGenerator().get_yaml().encode("utf-8")
+    return StaticAsset.from_bytes(spec, "application/yaml; charset=utf-8")
+
+
+_BUILDERS: Dict[str, Callable[[], StaticAsset]] = {
+    SWAGGER_UI: _swagger_ui,
+    OPENAPI_JSON: _openapi_json,
+    OPENAPI_YAML: _openapi_yaml,
+}
+_assets: Dict[str, StaticAsset] = {}
+_assets_lock = threading.Lock()
+
+
+def get_asset(name: str) -> StaticAsset:
+    """Retorna o recurso, gerando-o na primeira chamada."""
+    asset = _assets.get(name)
+    if asset is None:
+        with _assets_lock:
+            asset = _assets.get(name)
+            if asset is None:
+                asset = _BUILDERS[name]()
+                _assets[name] = asset
+    return asset
+
+
+def preload_assets() -> None:
+    """Gera todos os recursos de uma vez (na subida do servidor)."""
+    for name in _BUILDERS:
+        get_asset(name)
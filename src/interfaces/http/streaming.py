@@ -0,0 +1,90 @@
+"""
+Escrita incremental do corpo de respostas HTTP.
+"""
+from typing import Any, Callable, Iterable, Optional
+from src.interfaces.http.compression import GzipStream
+
+NDJSON = "application/x-ndjson"
+
+
+class ChunkedWriter:
+    """Escreve o corpo aos poucos, em chunks HTTP/1.1 quando possível.
+
+    Pedaços pequenos são agrupados até ``buffer_size`` bytes para não gerar um
+    pacote por item. Sem ``chunked`` (clientes HTTP/1.0), o corpo é escrito
+    como está e delimitado pelo fechamento da conexão. Com ``gzip``, cada
+    pedaço é comprimido antes de sair.
+    """
+
+    def __init__(
+        self,
+        wfile,
+        chunked: bool = True,
+        buffer_size: int = 16384,
+        gzip: Optional[GzipStream] = None,
+    ):
+        self.wfile = wfile
+        self.chunked = chunked
+        self.buffer_size = buffer_size
+        self.gzip = gzip
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> None:
+        """Acrescenta dados ao corpo."""
+        self._buffer += data
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Envia o que estiver acumulado."""
+        if not self._buffer:
+            return
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if self.gzip is not None:
+            data = self.gzip.compress(data)
+        self._send(data)
+
+    def close(self) -> None:
+        """Envia o restante e, em modo chunked, o chunk final."""
+        self.flush()
+        if self.gzip is not None:
+            self._send(self.gzip.finish())
+        if self.chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def _send(self, data: bytes) -> None:
+        """Escreve um pedaço do corpo, como chunk quando em modo chunked."""
+        if not data:
+            return
+        if self.chunked:
+            self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+        else:
+            self.wfile.write(data)
+
+
+def write_ndjson(
+    writer: ChunkedWriter, items: Iterable[Any], encode: Callable[[Any], bytes]
+) -> int:
+    """Escreve um objeto JSON por linha; devolve quantos itens foram escritos."""
+    count = 0
+    for item in items:
+        writer.write(encode(item) + b"\n")
+        count += 1
+    return count
+
+
+def write_json_array(
+    writer: ChunkedWriter, items: Iterable[Any], encode: Callable[[Any], bytes]
+) -> int:
+    """Escreve um array JSON item a item; devolve quantos itens foram escritos."""
+    count = 0
+    writer.write(b"[")
+    for item in items:
+        if count:
+            writer.write(b",")
+        writer.write(encode(item))
+        count += 1
+    writer.write(b"]")
+    return count
@@ -3,6 +3,7 @@ Gerador de documentação OpenAPI/Swagger para a API.
 """
 import json
 from typing import Dict, Any
+from src.interfaces.http.routing import ROUTES
 
 
 class SwaggerGenerator:
@@ -51,7 +52,20 @@ class SwaggerGenerator:
         }
 
     def _generate_paths(self) -> Dict[str, Any]:
-        """Gera as definições dos endpoints."""
+        """Gera as definições dos endpoints a partir da tabela de rotas.
+
+        Toda rota documentada precisa de uma operação em ``_generate_operations``.
+        """
+        operations = self._generate_operations()
+        paths: Dict[str, Any] = {}
+        for route in ROUTES.routes:
+            if route.documented:
+                method = route.method.lower()
+                paths.setdefault(route.template, {})[method] = operations[route.template][method]
+        return paths
+
+    def _generate_operations(self) -> Dict[str, Any]:
+        """Documentação de cada operação, por caminho e método."""
         return {
             "/": {
                 "get": {
@@ -72,14 +86,151 @@ class SwaggerGenerator:
                     },
                 }
             },
+            "/metrics": {
+                "get": {
+                    "tags": ["health"],
+                    "summary": "Métricas no formato Prometheus",
+                    "description": "Contagens, requisições em andamento e histogramas de latência por rota e das chamadas ao GLPI",
+                    "responses": {
+                        "200": {
+                            "description": "Métricas no formato de texto do Prometheus",
+                            "content": {"text/plain": {"schema": {"type": "string"}}},
+                        }
+                    },
+                }
+            },
             "/tickets": {
                 "get": {
                     "tags": ["tickets"],
                     "summary": "Lista todos os tickets",
-                    "description": "Retorna uma lista de todos os tickets do GLPI",
+                    "description": "Retorna uma página de tickets do GLPI. Use o cursor do cabeçalho X-Next-Cursor para obter a próxima página",
+                    "parameters": [
+                        {
+                            "name": "limit",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer", "minimum": 1, "default": 50},
+                            "description": "Quantidade máxima de tickets na página",
+                        },
+                        {
+                            "name": "offset",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer", "minimum": 0, "default": 0},
+                            "description": "Posição do primeiro ticket",
+                        },
+                        {
+                            "name": "cursor",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string"},
+                            "description": "Cursor opaco da próxima página (substitui offset)",
+                        },
+                        {
+                            "name": "stream",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "boolean", "default": False},
+                            "description": "Envia o array JSON em chunks, sem limite padrão de tamanho",
+                        },
+                        {
+                            "name": "format",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "enum": ["ndjson"]},
+                            "description": "Equivale a Accept: application/x-ndjson (um ticket por linha, em chunks)",
+                        },
+                        {
+                            "name": "fields",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "example": "id,status"},
+                            "description": "Campos a retornar, separados por vírgula (id, name, content, status, priority, category_id, assigned_user_id, assigned_group_id, modified_date). Só essas colunas são buscadas no GLPI. Padrão: id,name,status,priority",
+                        },
+                        {
+                            "name": "status",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "example": "NEW,ASSIGNED"},
+                            "description": "Status aceitos, separados por vírgula (NEW, ASSIGNED, PLANNED, WAITING, SOLVED, CLOSED). A filtragem é feita pelo GLPI",
+                        },
+                        {
+                            "name": "priority",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "example": "HIGH,VERY_HIGH"},
+                            "description": "Prioridades aceitas, separadas por vírgula (VERY_LOW, LOW, MEDIUM, HIGH, VERY_HIGH, MAJOR)",
+                        },
+                        {
+                            "name": "assigned_user_id",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer"},
+                            "description": "Só tickets atribuídos a este técnico",
+                        },
+                        {
+                            "name": "assigned_group_id",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer"},
+                            "description": "Só tickets atribuídos a este grupo",
+                        },
+                        {
+                            "name": "category_id",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer"},
+                            "description": "Só tickets desta categoria",
+                        },
+                        {
+                            "name": "modified_after",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "format": "date-time"},
+                            "description": "Modificados depois desta data (ISO 8601, exclusivo)",
+                        },
+                        {
+                            "name": "modified_before",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "format": "date-time"},
+                            "description": "Modificados antes desta data (ISO 8601, exclusivo)",
+                        },
+                        {
+                            "name": "created_after",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "format": "date-time"},
+                            "description": "Abertos depois desta data (ISO 8601, exclusivo)",
+                        },
+                        {
+                            "name": "created_before",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "format": "date-time"},
+                            "description": "Abertos antes desta data (ISO 8601, exclusivo)",
+                        },
+                        {
+                            "name": "sort",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "example": "-priority"},
+                            "description": "Campo de ordenação, feita pelo GLPI (id, name, status, priority, category_id, assigned_user_id, assigned_group_id, modified_date, created_date); prefixo - para ordem decrescente",
+                        },
+                    ],
                     "responses": {
                         "200": {
                             "description": "Lista de tickets retornada com sucesso",
+                            "headers": {
+                                "X-Next-Cursor": {
+                                    "description": "Cursor da próxima página, ausente na última",
+                                    "schema": {"type": "string"},
+                                },
+                                "Link": {
+                                    "description": 'Link para a próxima página (rel="next")',
+                                    "schema": {"type": "string"},
+                                },
+                            },
                             "content": {
                                 "application/json": {
                                     "schema": {
@@ -93,9 +244,15 @@ class SwaggerGenerator:
                                             "$ref": "#/components/examples/TicketsList"
                                         }
                                     },
-                                }
+                                },
+                                "application/x-ndjson": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/TicketSummary"
+                                    }
+                                },
                             },
-                        }
+                        },
+                        "400": {"description": "Parâmetros de paginação inválidos"},
                     },
                 },
                 "post": {
@@ -139,6 +296,98 @@ class SwaggerGenerator:
                     },
                 },
             },
+            "/tickets/batch": {
+                "post": {
+                    "tags": ["tickets"],
+                    "summary": "Cria vários tickets",
+                    "description": "Cria tickets em lote; as chamadas ao GLPI são agrupadas e cada item recebe seu próprio resultado",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {"$ref": "#/components/schemas/TicketCreate"},
+                                }
+                            }
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Resultado por item",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/BatchResponse"}
+                                }
+                            },
+                        },
+                        "400": {"description": "Lote vazio ou JSON inválido"},
+                        "413": {"description": "Lote acima do limite de itens"},
+                    },
+                },
+                "put": {
+                    "tags": ["tickets"],
+                    "summary": "Atualiza vários tickets",
+                    "description": "Atualiza tickets em lote; cada item traz o id e os campos do ticket",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {
+                                        "allOf": [
+                                            {"$ref": "#/components/schemas/TicketUpdate"},
+                                            {
+                                                "type": "object",
+                                                "required": ["id"],
+                                                "properties": {"id": {"type": "integer"}},
+                                            },
+                                        ]
+                                    },
+                                }
+                            }
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Resultado por item",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/BatchResponse"}
+                                }
+                            },
+                        },
+                        "400": {"description": "Lote vazio ou JSON inválido"},
+                        "413": {"description": "Lote acima do limite de itens"},
+                    },
+                },
+                "delete": {
+                    "tags": ["tickets"],
+                    "summary": "Deleta vários tickets",
+                    "description": "Remove tickets em lote a partir de uma lista de IDs",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {"type": "array", "items": {"type": "integer"}}
+                            }
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Resultado por item",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/BatchResponse"}
+                                }
+                            },
+                        },
+                        "400": {"description": "Lote vazio ou JSON inválido"},
+                        "413": {"description": "Lote acima do limite de itens"},
+                    },
+                },
+            },
             "/tickets/{id}": {
                 "get": {
                     "tags": ["tickets"],
@@ -151,11 +400,24 @@ class SwaggerGenerator:
                             "required": True,
                             "schema": {"type": "integer"},
                             "description": "ID do ticket",
-                        }
+                        },
+                        {
+                            "name": "If-None-Match",
+                            "in": "header",
+                            "required": False,
+                            "schema": {"type": "string"},
+                            "description": "ETag já conhecida; se o ticket não mudou, a resposta é 304",
+                        },
                     ],
                     "responses": {
                         "200": {
                             "description": "Ticket encontrado",
+                            "headers": {
+                                "ETag": {
+                                    "description": "Versão do ticket (date_mod do GLPI ou hash do conteúdo)",
+                                    "schema": {"type": "string"},
+                                }
+                            },
                             "content": {
                                 "application/json": {
                                     "schema": {
@@ -164,6 +426,7 @@ class SwaggerGenerator:
                                 }
                             },
                         },
+                        "304": {"description": "Ticket não modificado desde a ETag informada"},
                         "404": {"description": "Ticket não encontrado"},
                     },
                 },
@@ -397,6 +660,25 @@ class SwaggerGenerator:
                     }
                 },
             },
+            "BatchResponse": {
+                "type": "object",
+                "properties": {
+                    "results": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "index": {"type": "integer", "example": 0},
+                                "success": {"type": "boolean", "example": True},
+                                "id": {"type": "integer", "nullable": True, "example": 123},
+                                "error": {"type": "string", "nullable": True},
+                            },
+                        },
+                    },
+                    "succeeded": {"type": "integer", "example": 2},
+                    "failed": {"type": "integer", "example": 0},
+                },
+            },
             "ErrorResponse": {
                 "type": "object",
                 "properties": {
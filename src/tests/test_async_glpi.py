@@ -0,0 +1,176 @@
+"""
+Testes para o cliente, o repositório e os casos de uso assíncronos do GLPI.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import GLPIResponse, GLPITicket, TicketStatus
+from src.core.glpi_use_cases import GLPITicketUseCase
+from src.infrastructure.async_glpi_client import AsyncGLPIClient
+from src.infrastructure.async_glpi_ticket_repository import (
+    AsyncGLPITicketRepository,
+)
+from src.infrastructure.cached_ticket_repository import CachingTicketRepository
+from src.infrastructure.coalescing_ticket_repository import (
+    CoalescingTicketRepository,
+)
+from src.infrastructure.glpi_ticket_repository import IncompleteSearchError
+
+
+def _slow_client(total=120, delay=0.02, max_rows=None, fail_at=None):
+    """Mock de cliente síncrono que mede quantas chamadas correm juntas.
+
+    ``max_rows`` limita as linhas das respostas após a primeira; a janela que começa em
+    ``fail_at`` responde com erro.
+    """
+    state = {"active": 0, "peak": 0, "calls": []}
+    lock = threading.Lock()
+
+    def make_request(method, endpoint, data=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["calls"].append(endpoint)
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+
+        match = re.search(r"range=(\d+)-(\d+)", endpoint)
+        if match is None:
+            ticket_id = int(endpoint.rsplit("/", 1)[1])
+            return GLPIResponse(200, {"id": ticket_id, "name": f"T{ticket_id}"})
+
+        start, end = map(int, match.groups())
+        if start == fail_at:
+            return GLPIResponse(500, {}, "Erro interno")
+        end = min(end, total - 1)
+        if max_rows is not None and start > 0:
+            end = min(end, start + max_rows - 1)
+        rows = [{"id": i, "1": f"T{i}", "12": 1} for i in range(start, end + 1)]
+        return GLPIResponse(206, {"totalcount": total, "data": rows})
+
+    client = Mock()
+    client.config = Mock()
+    client.make_request.side_effect = make_request
+    return client, state
+
+
+def test_client_bounds_concurrency():
+    """Testa que o semáforo limita as chamadas simultâneas ao GLPI."""
+    # Arrange
+    sync_client, state = _slow_client()
+    client = AsyncGLPIClient(sync_client, max_concurrency=3)
+    repository = AsyncGLPITicketRepository(client)
+
+    # Act
+    tickets = asyncio.run(repository.get_many(list(range(10))))
+    client.close()
+
+    # Assert
+    assert [ticket.id for ticket in tickets] == list(range(10))
+    assert 1 < state["peak"] <= 3
+
+
+def test_get_all_fetches_remaining_pages_in_parallel():
+    """Testa que as páginas após a primeira são pedidas em paralelo."""
+    # Arrange
+    sync_client, state = _slow_client(total=120)
+    client = AsyncGLPIClient(sync_client, max_concurrency=5)
+    repository = AsyncGLPITicketRepository(client, page_size=25)
+
+    # Act
+    tickets = asyncio.run(repository.get_all())
+    client.close()
+
+    # Assert
+    assert [ticket.id for ticket in tickets] == list(range(120))
+    assert len(state["calls"]) == 5
+    assert state["peak"] > 1
+
+
+def test_get_all_completes_short_windows():
+    """Testa que janelas devolvidas pela metade são completadas."""
+    # Arrange
+    sync_client, state = _slow_client(total=120, max_rows=20)
+    client = AsyncGLPIClient(sync_client, max_concurrency=5)
+    repository = AsyncGLPITicketRepository(client, page_size=50)
+
+    # Act
+    tickets = asyncio.run(repository.get_all())
+    client.close()
+
+    # Assert
+    assert [ticket.id for ticket in tickets] == list(range(120))
+    assert len(state["calls"]) == 5
+
+
+def test_get_all_raises_when_a_window_fails():
+    """Testa que uma janela com erro não vira uma lista incompleta."""
+    # Arrange
+    sync_client, _ = _slow_client(total=120, fail_at=50)
+    client = AsyncGLPIClient(sync_client, max_concurrency=5)
+    repository = AsyncGLPITicketRepository(client, page_size=25)
+
+    # Act / Assert
+    with pytest.raises(IncompleteSearchError) as error:
+        asyncio.run(repository.get_all())
+    client.close()
+    assert error.value.offset == 50
+
+
+def test_use_case_computes_progress_of_several_projects():
+    """Testa o progresso de vários projetos com buscas sobrepostas."""
+    # Arrange
+    async_repository = Mock()
+
+    async def search(project_tag, fields=None):
+        await asyncio.sleep(0.01)
+        status = TicketStatus.CLOSED if project_tag == "A" else TicketStatus.NEW
+        return [GLPITicket(id=1, name=project_tag, content="c", status=status)]
+
+    async_repository.search_by_project_tag.side_effect = search
+    use_case = GLPITicketUseCase(Mock(), async_repository=async_repository)
+
+    # Act
+    progress = asyncio.run(use_case.get_projects_progress_async(["A", "B"]))
+
+    # Assert
+    assert [item["project_tag"] for item in progress] == ["A", "B"]
+    assert [item["progress_percentage"] for item in progress] == [100.0, 0]
+
+
+def test_async_update_invalidates_sync_cache():
+    """Testa que uma escrita assíncrona não deixa o cache síncrono desatualizado."""
+    # Arrange
+    names = {1: "Antigo"}
+    inner_repository = Mock()
+    inner_repository.get_by_id.side_effect = lambda ticket_id: GLPITicket(
+        id=ticket_id, name=names[ticket_id], content="c"
+    )
+    async_repository = Mock()
+
+    async def update(ticket_id, ticket):
+        names[ticket_id] = ticket.name
+        return ticket
+
+    async_repository.update.side_effect = update
+    use_case = GLPITicketUseCase(
+        CachingTicketRepository(CoalescingTicketRepository(inner_repository), ttl=60),
+        async_repository=async_repository,
+    )
+    use_case.get_ticket(1)
+
+    # Act
+    asyncio.run(
+        use_case.update_ticket_async(1, GLPITicket(id=1, name="Novo", content="c"))
+    )
+
+    # Assert
+    assert use_case.get_ticket(1).name == "Novo"
+    inner_repository.invalidate.assert_called_once_with(1)
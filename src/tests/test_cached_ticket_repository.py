@@ -0,0 +1,156 @@
+"""
+Testes para o cache de leitura de tickets.
+"""
+
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import GLPITicket, TicketStatus
+from src.infrastructure.cached_ticket_repository import (
+    CachingTicketRepository,
+    TTLCache,
+)
+
+
+class TestCachingTicketRepository:
+    """Testes para o decorador de cache do repositório."""
+
+    @pytest.fixture
+    def inner_repository(self):
+        """Mock do repositório decorado."""
+        repository = Mock()
+        repository.get_by_id.side_effect = lambda ticket_id: GLPITicket(
+            id=ticket_id, name="Ticket", content="Content"
+        )
+        repository.search_by_project_tag.return_value = [
+            GLPITicket(id=1, name="PROJ Ticket", content="Content")
+        ]
+        return repository
+
+    def test_get_by_id_hits_cache(self, inner_repository):
+        """Testa que a segunda leitura não chega ao repositório."""
+        # Arrange
+        repository = CachingTicketRepository(inner_repository, ttl=60)
+
+        # Act
+        first = repository.get_by_id(1)
+        second = repository.get_by_id(1)
+
+        # Assert
+        assert first == second
+        inner_repository.get_by_id.assert_called_once_with(1)
+        assert repository.stats()["hits"] == 1
+        assert repository.stats()["misses"] == 1
+
+    def test_returns_copies(self, inner_repository):
+        """Testa que alterar o ticket devolvido não altera o cache."""
+        # Arrange
+        repository = CachingTicketRepository(inner_repository, ttl=60)
+
+        # Act
+        repository.get_by_id(1).status = TicketStatus.CLOSED
+
+        # Assert
+        assert repository.get_by_id(1).status == TicketStatus.NEW
+
+    def test_update_invalidates_ticket_and_searches(self, inner_repository):
+        """Testa que escritas invalidam o ticket e as buscas por projeto."""
+        # Arrange
+        repository = CachingTicketRepository(inner_repository, ttl=60)
+        repository.get_by_id(1)
+        repository.search_by_project_tag("PROJ")
+
+        # Act
+        repository.update(1, GLPITicket(name="Novo", content="Content"))
+        repository.get_by_id(1)
+        repository.search_by_project_tag("PROJ")
+
+        # Assert
+        assert inner_repository.get_by_id.call_count == 2
+        assert inner_repository.search_by_project_tag.call_count == 2
+
+    def test_does_not_cache_missing_ticket(self, inner_repository):
+        """Testa que tickets inexistentes não ficam em cache."""
+        # Arrange
+        inner_repository.get_by_id.side_effect = None
+        inner_repository.get_by_id.return_value = None
+        repository = CachingTicketRepository(inner_repository, ttl=60)
+
+        # Act
+        repository.get_by_id(1)
+        repository.get_by_id(1)
+
+        # Assert
+        assert inner_repository.get_by_id.call_count == 2
+
+    def test_revalidates_expired_ticket_by_modified_date(self, inner_repository):
+        """Testa que um ticket vencido e inalterado não é buscado de novo."""
+        # Arrange
+        modified = datetime(2024, 5, 1, 10, 0, 0)
+        inner_repository.get_by_id.side_effect = lambda ticket_id: GLPITicket(
+            id=ticket_id, name="Ticket", content="Content", modified_date=modified
+        )
+        inner_repository.get_modified_date.return_value = modified
+        repository = CachingTicketRepository(inner_repository, ttl=0.05)
+        repository.get_by_id(1)
+        time.sleep(0.1)
+
+        # Act
+        unchanged = repository.get_by_id(1)
+        time.sleep(0.1)
+        inner_repository.get_modified_date.return_value = datetime(2024, 5, 2)
+        changed = repository.get_by_id(1)
+
+        # Assert
+        assert unchanged.modified_date == modified
+        assert changed is not None
+        assert inner_repository.get_by_id.call_count == 2
+        assert repository.stats()["revalidations"] == 1
+
+
+class TestTTLCache:
+    """Testes para o cache com TTL e descarte LRU."""
+
+    def test_entries_expire(self):
+        """Testa que entradas vencidas deixam de ser retornadas."""
+        # Arrange
+        cache = TTLCache(ttl=0.05)
+        cache.set("a", 1)
+
+        # Act
+        time.sleep(0.1)
+
+        # Assert
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        """Testa o descarte da entrada menos usada ao atingir o limite."""
+        # Arrange
+        cache = TTLCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.set("c", 3)
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.evictions == 1
+
+    def test_stale_generation_is_not_stored(self):
+        """Testa que uma leitura anterior à invalidação não repovoa o cache."""
+        # Arrange
+        cache = TTLCache(ttl=60)
+        generation = cache.generation
+
+        # Act
+        cache.pop("a")
+        cache.set("a", "antigo", generation)
+
+        # Assert
+        assert cache.get("a") is None
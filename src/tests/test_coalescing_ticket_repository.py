@@ -0,0 +1,145 @@
+"""
+Testes para a coalescência de leituras de tickets.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import GLPITicket
+from src.infrastructure.coalescing_ticket_repository import (
+    CoalescingTicketRepository,
+    SingleFlight,
+)
+
+
+def _run_concurrently(func, count=10):
+    """Executa ``func`` em várias threads ao mesmo tempo e devolve os retornos."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index):
+        barrier.wait()
+        results[index] = func()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestCoalescingTicketRepository:
+    """Testes para o decorador que agrupa leituras idênticas."""
+
+    @pytest.fixture
+    def inner_repository(self):
+        """Mock de repositório lento, para as leituras se sobreporem."""
+        repository = Mock()
+
+        def search(project_tag, fields=None):
+            time.sleep(0.1)
+            return [GLPITicket(id=1, name=f"[{project_tag}] T", content="c")]
+
+        def get_by_id(ticket_id):
+            time.sleep(0.1)
+            return GLPITicket(id=ticket_id, name="T", content="c")
+
+        repository.search_by_project_tag.side_effect = search
+        repository.get_by_id.side_effect = get_by_id
+        return repository
+
+    def test_concurrent_searches_share_one_call(self, inner_repository):
+        """Testa que buscas simultâneas do mesmo projeto viram uma chamada."""
+        # Arrange
+        repository = CoalescingTicketRepository(inner_repository)
+
+        # Act
+        results = _run_concurrently(
+            lambda: repository.search_by_project_tag("PROJ", ["id", "status"])
+        )
+
+        # Assert
+        assert inner_repository.search_by_project_tag.call_count == 1
+        assert all(result[0].name == "[PROJ] T" for result in results)
+        # Cada chamador recebe objetos próprios
+        assert len({id(result[0]) for result in results}) == 10
+        assert repository.stats() == {"upstream": 1, "coalesced": 9}
+
+    def test_caller_that_reads_also_gets_a_copy(self):
+        """Testa que quem faz a chamada não recebe o objeto compartilhado."""
+        # Arrange
+        ticket = GLPITicket(id=1, name="T", content="c")
+        inner_repository = Mock()
+        inner_repository.get_by_id.return_value = ticket
+        repository = CoalescingTicketRepository(inner_repository)
+
+        # Act
+        result = repository.get_by_id(1)
+
+        # Assert
+        assert result == ticket
+        assert result is not ticket
+
+    def test_different_keys_are_not_shared(self, inner_repository):
+        """Testa que IDs diferentes geram chamadas separadas."""
+        # Arrange
+        repository = CoalescingTicketRepository(inner_repository)
+        ids = iter(range(4))
+        lock = threading.Lock()
+
+        def read():
+            with lock:
+                ticket_id = next(ids)
+            return repository.get_by_id(ticket_id)
+
+        # Act
+        results = _run_concurrently(read, count=4)
+
+        # Assert
+        assert inner_repository.get_by_id.call_count == 4
+        assert sorted(ticket.id for ticket in results) == [0, 1, 2, 3]
+
+    def test_write_starts_new_reads(self, inner_repository):
+        """Testa que leituras após uma escrita não aproveitam a anterior."""
+        # Arrange
+        repository = CoalescingTicketRepository(inner_repository)
+        reader = threading.Thread(target=repository.get_by_id, args=(1,))
+        reader.start()
+        time.sleep(0.02)
+
+        # Act
+        repository.update(1, GLPITicket(id=1, name="Novo", content="c"))
+        repository.get_by_id(1)
+        reader.join()
+
+        # Assert
+        assert inner_repository.get_by_id.call_count == 2
+        inner_repository.update.assert_called_once()
+
+
+def test_single_flight_shares_exception():
+    """Testa que a exceção da chamada chega a todos que esperavam."""
+    # Arrange
+    flights = SingleFlight()
+
+    def failing():
+        time.sleep(0.1)
+        raise ConnectionError("GLPI fora do ar")
+
+    def call():
+        try:
+            flights.do("key", failing)
+        except ConnectionError as e:
+            return str(e)
+
+    # Act
+    results = _run_concurrently(call, count=5)
+
+    # Assert
+    assert results == ["GLPI fora do ar"] * 5
+    assert flights.leaders == 1
+    assert flights.followers == 4
@@ -0,0 +1,343 @@
+"""
+Testes para o cliente HTTP do GLPI.
+"""
+
+import http.client
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import GLPIConfig
+from src.infrastructure.app_context import build_app_context, load_glpi_config
+from src.infrastructure.glpi_client import GLPIHTTPClient
+from src.infrastructure.http_pool import HTTPConnectionPool
+
+
+class TestGLPIHTTPClientSession:
+    """Testes para o ciclo de autenticação do cliente."""
+
+    def test_ensure_session_authenticates_once_across_threads(self, monkeypatch):
+        """Testa que várias threads compartilham uma única autenticação."""
+        # Arrange
+        client = GLPIHTTPClient(GLPIConfig("http://glpi", "app", "user"))
+        calls = []
+
+        def fake_authenticate():
+            calls.append(1)
+            time.sleep(0.05)
+            client.session_token = "token"
+            return True
+
+        monkeypatch.setattr(client, "authenticate", fake_authenticate)
+
+        # Act
+        threads = [threading.Thread(target=client.ensure_session) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(calls) == 1
+        assert client.session_token == "token"
+
+    def test_app_context_shares_client(self):
+        """Testa que o contexto liga repositório e caso de uso ao mesmo cliente."""
+        # Act
+        context = build_app_context(GLPIConfig("http://glpi", "app", "user"))
+
+        # Assert
+        assert context.ticket_repository.client is context.client
+        assert context.ticket_use_case.ticket_repository is context.ticket_repository
+
+    def test_warm_up_starts_background_threads_when_auth_fails(self, monkeypatch):
+        """Testa que falhar a autenticação no boot não desliga as threads de fundo."""
+        # Arrange
+        context = build_app_context(GLPIConfig("http://glpi", "app", "user"))
+        context.progress_index = Mock()
+        monkeypatch.setattr(context.client, "ensure_session", lambda: False)
+        monkeypatch.setattr(context.client, "start_session_refresher", Mock())
+        monkeypatch.setattr(context.client, "prime_connections", Mock())
+
+        # Act
+        warmed = context.warm_up()
+
+        # Assert
+        assert not warmed
+        context.client.start_session_refresher.assert_called_once_with()
+        context.progress_index.start_reconciler.assert_called_once_with()
+        context.client.prime_connections.assert_not_called()
+
+    def test_load_config_reads_resilience_settings(self, monkeypatch):
+        """Testa que retentativas e circuit breaker vêm das variáveis de ambiente."""
+        # Arrange
+        monkeypatch.setenv("GLPI_MAX_RETRIES", "0")
+        monkeypatch.setenv("GLPI_RETRY_BACKOFF", "0.5")
+        monkeypatch.setenv("GLPI_BREAKER_THRESHOLD", "0")
+        monkeypatch.setenv("GLPI_BREAKER_RECOVERY_SECONDS", "10")
+
+        # Act
+        config = load_glpi_config()
+        client = GLPIHTTPClient(config)
+
+        # Assert
+        assert config.max_retries == 0
+        assert config.retry_backoff == 0.5
+        assert config.retry_max_backoff == 2.0
+        assert config.breaker_recovery_timeout == 10.0
+        assert client.breakers is None
+        assert list(client.retry_policy.delays("GET")) == []
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Handler HTTP/1.1 que registra as conexões recebidas."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == "/close":
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    """Servidor HTTP/1.1 local que conta conexões abertas."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHTTPConnectionPool:
+    """Testes para o pool de conexões keep-alive."""
+
+    def test_reuses_connection_between_requests(self, keep_alive_server):
+        """Testa que requisições sequenciais usam a mesma conexão."""
+        # Arrange
+        pool = HTTPConnectionPool(max_size=2)
+        url = f"http://127.0.0.1:{keep_alive_server.server_address[1]}/ticket"
+
+        # Act
+        responses = [pool.request("GET", url) for _ in range(3)]
+
+        # Assert
+        assert all(response.status == 200 for response in responses)
+        assert keep_alive_server.connections == 1
+        assert pool.idle_connections() == 1
+        pool.close()
+
+    def test_discards_connection_closed_by_server(self, keep_alive_server):
+        """Testa que um socket fechado pelo servidor não é reutilizado."""
+        # Arrange
+        pool = HTTPConnectionPool(max_size=2)
+        base = f"http://127.0.0.1:{keep_alive_server.server_address[1]}"
+        pool.request("GET", f"{base}/close")
+        time.sleep(0.1)
+
+        # Act
+        response = pool.request("GET", f"{base}/ticket")
+
+        # Assert
+        assert response.status == 200
+        assert keep_alive_server.connections == 2
+        pool.close()
+
+    def test_evicts_idle_connections(self, keep_alive_server):
+        """Testa que conexões ociosas além do limite são descartadas."""
+        # Arrange
+        pool = HTTPConnectionPool(max_size=2, idle_timeout=0.05)
+        url = f"http://127.0.0.1:{keep_alive_server.server_address[1]}/ticket"
+        pool.request("GET", url)
+        time.sleep(0.1)
+
+        # Act
+        pool.request("GET", url)
+
+        # Assert
+        assert keep_alive_server.connections == 2
+        pool.close()
+
+    @pytest.mark.parametrize("method, replayed", [("GET", True), ("POST", False)])
+    def test_replays_stale_connection_only_for_idempotent_methods(
+        self, monkeypatch, method, replayed
+    ):
+        """Testa que um POST em conexão fechada pelo servidor não é repetido."""
+        # Arrange
+        pool = HTTPConnectionPool()
+        sent = []
+
+        def send(conn, *args):
+            sent.append(conn)
+            if len(sent) == 1:
+                raise http.client.RemoteDisconnected("fechada")
+            return "resposta", True
+
+        monkeypatch.setattr(pool, "_acquire", lambda key: (Mock(), True))
+        monkeypatch.setattr(pool, "_send", send)
+
+        # Act / Assert
+        if replayed:
+            assert pool.request(method, "http://glpi/Ticket") == "resposta"
+            assert len(sent) == 2
+        else:
+            with pytest.raises(http.client.RemoteDisconnected):
+                pool.request(method, "http://glpi/Ticket")
+            assert len(sent) == 1
+
+
+class SessionHandler(BaseHTTPRequestHandler):
+    """GLPI mínimo que emite tokens e recusa os que foram expirados."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?")[0]
+        with server.lock:
+            server.calls.append(path)
+            if path == "/initSession":
+                server.issued += 1
+                token = f"token-{server.issued}"
+                server.valid.add(token)
+                self._reply(200, {"session_token": token})
+                return
+
+        token = self.headers.get("Session-Token")
+        if path == "/forbidden":
+            self._reply(401, ["ERROR_RIGHT_MISSING", "Sem permissão"])
+        elif token not in server.valid:
+            self._reply(401, ["ERROR_SESSION_TOKEN_INVALID", "Sessão inválida"])
+        else:
+            if path == "/killSession":
+                server.valid.discard(token)
+            time.sleep(0.01)
+            self._reply(200, {"ok": True})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def session_server():
+    """GLPI local com controle das sessões válidas."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SessionHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.calls = []
+    httpd.issued = 0
+    httpd.valid = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _session_client(server, **config):
+    """Cliente apontando para o servidor de sessões."""
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    return GLPIHTTPClient(GLPIConfig(url, "app", "user", **config))
+
+
+class TestGLPISessionLifecycle:
+    """Testes para a renovação e o encerramento da sessão."""
+
+    def test_expired_session_renews_once_and_replays(self, session_server):
+        """Testa que várias threads com sessão expirada reautenticam uma vez."""
+        # Arrange
+        client = _session_client(session_server)
+        client.ensure_session()
+        session_server.valid.clear()
+        results = []
+
+        def call():
+            results.append(client.make_request("GET", "/Ticket/1"))
+
+        # Act
+        threads = [threading.Thread(target=call) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert all(response.is_success() for response in results)
+        assert session_server.calls.count("/initSession") == 2
+        assert client.session_token == "token-2"
+        client.close()
+
+    def test_permission_error_does_not_reauthenticate(self, session_server):
+        """Testa que um 401 que não é de sessão volta sem nova autenticação."""
+        # Arrange
+        client = _session_client(session_server)
+
+        # Act
+        response = client.make_request("GET", "/forbidden")
+
+        # Assert
+        assert response.status_code == 401
+        assert session_server.calls.count("/initSession") == 1
+        client.close()
+
+    def test_refresh_touches_idle_session(self, session_server):
+        """Testa que a sessão ociosa é tocada e, se expirada, renovada."""
+        # Arrange
+        client = _session_client(session_server, session_refresh_interval=0.05)
+        client.ensure_session()
+        time.sleep(0.06)
+
+        # Act
+        touched = client.refresh_session()
+        session_server.valid.clear()
+        time.sleep(0.06)
+        renewed = client.refresh_session()
+
+        # Assert
+        assert touched and renewed
+        assert session_server.calls.count("/getActiveProfile") == 2
+        assert client.session_token == "token-2"
+        client.close()
+
+    def test_close_kills_session(self, session_server):
+        """Testa que o encerramento chama killSession com o token atual."""
+        # Arrange
+        client = _session_client(session_server, session_refresh_interval=0.05)
+        client.ensure_session()
+        client.start_session_refresher()
+
+        # Act
+        client.close()
+
+        # Assert
+        assert session_server.calls[-1] == "/killSession"
+        assert session_server.valid == set()
+        assert client.session_token is None
@@ -0,0 +1,386 @@
+"""
+Testes para o repositório de tickets do GLPI.
+"""
+
+import re
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import (
+    GLPIResponse,
+    GLPITicket,
+    TicketBatch,
+    TicketFilter,
+    TicketPriority,
+    TicketStatus,
+)
+from src.core.use_cases import TicketRepository
+from src.infrastructure.glpi_ticket_repository import (
+    GLPITicketRepository,
+    IncompleteSearchError,
+)
+
+
+def _search_client(total, with_totalcount=True, fail_at=None):
+    """Mock de cliente que responde buscas paginadas sobre ``total`` tickets.
+
+    A janela que começa em ``fail_at`` responde 503.
+    """
+
+    def make_request(method, endpoint, data=None):
+        start, end = map(int, re.search(r"range=(\d+)-(\d+)", endpoint).groups())
+        if start == fail_at:
+            return GLPIResponse(503, {}, "Erro HTTP 503: Service Unavailable")
+        end = min(end, total - 1)
+        rows = [{"id": i, "1": f"Ticket {i}", "12": 1} for i in range(start, end + 1)]
+        body = {"count": len(rows), "data": rows}
+        if with_totalcount:
+            body["totalcount"] = total
+        headers = {"Content-Range": f"{start}-{end}/{total}"}
+        return GLPIResponse(206, body, headers=headers)
+
+    client = Mock()
+    client.make_request.side_effect = make_request
+    return client
+
+
+class TestGLPITicketRepositoryPagination:
+    """Testes para a listagem paginada de tickets."""
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_all_walks_every_page(self, prefetch):
+        """Testa que a iteração percorre todas as janelas do GLPI."""
+        # Arrange
+        client = _search_client(total=125)
+        repository = GLPITicketRepository(client, page_size=50, prefetch=prefetch)
+
+        # Act
+        ids = [ticket.id for ticket in repository.iter_all()]
+
+        # Assert
+        assert ids == list(range(125))
+        assert client.make_request.call_count == 3
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_failed_page_raises_instead_of_truncating(self, prefetch):
+        """Testa que uma página com erro no meio da busca não encerra a lista."""
+        # Arrange
+        client = _search_client(total=4, fail_at=2)
+        repository = GLPITicketRepository(client, page_size=2, prefetch=prefetch)
+
+        # Act / Assert
+        with pytest.raises(IncompleteSearchError) as error:
+            list(repository.iter_all())
+        assert error.value.offset == 2
+        assert error.value.status_code == 503
+        with pytest.raises(IncompleteSearchError):
+            repository.search_by_project_tag("PROJ")
+
+    def test_range_after_total_ends_the_walk(self):
+        """Testa que a janela recusada por passar do total é o fim da busca."""
+        # Arrange
+        client = Mock()
+        client.make_request.return_value = GLPIResponse(
+            400, ["ERROR_RANGE_EXCEED_TOTAL", "Intervalo maior que o total"]
+        )
+        repository = GLPITicketRepository(client)
+
+        # Act
+        tickets = list(repository.iter_all(offset=500))
+
+        # Assert
+        assert tickets == []
+
+    def test_iter_all_respects_offset_and_limit(self):
+        """Testa que offset e limit definem a janela pedida ao GLPI."""
+        # Arrange
+        client = _search_client(total=200)
+        repository = GLPITicketRepository(client, page_size=50)
+
+        # Act
+        ids = [ticket.id for ticket in repository.iter_all(offset=40, limit=30)]
+
+        # Assert
+        assert ids == list(range(40, 70))
+        endpoint = client.make_request.call_args_list[0].args[1]
+        assert "range=40-69" in endpoint
+
+    def test_iter_all_uses_content_range_without_totalcount(self):
+        """Testa o uso do cabeçalho Content-Range como fonte do total."""
+        # Arrange
+        client = _search_client(total=60, with_totalcount=False)
+        repository = GLPITicketRepository(client, page_size=50)
+
+        # Act
+        tickets = repository.get_all()
+
+        # Assert
+        assert len(tickets) == 60
+        assert client.make_request.call_count == 2
+
+    def test_iter_all_is_lazy(self):
+        """Testa que nenhuma página extra é buscada antes de ser consumida."""
+        # Arrange
+        client = _search_client(total=500)
+        repository = GLPITicketRepository(client, page_size=50)
+
+        # Act
+        iterator = repository.iter_all()
+        next(iterator)
+
+        # Assert
+        assert client.make_request.call_count == 1
+
+    def test_iter_all_requests_only_selected_columns(self):
+        """Testa que ``fields`` vira ``forcedisplay`` e limita a decodificação."""
+        # Arrange
+        client = _search_client(total=3)
+        repository = GLPITicketRepository(client, page_size=10)
+
+        # Act
+        tickets = list(repository.iter_all(fields=["id", "status"]))
+
+        # Assert
+        endpoint = client.make_request.call_args[0][1]
+        assert "forcedisplay[0]=12" in endpoint
+        assert "forcedisplay[1]" not in endpoint
+        assert [ticket.id for ticket in tickets] == [0, 1, 2]
+        assert tickets[0].name == ""
+
+    def test_content_uses_its_own_search_option(self):
+        """Testa que ``content`` é a opção 21, não a 2 (ID do ticket)."""
+        # Arrange
+        client = Mock()
+        client.make_request.return_value = GLPIResponse(
+            200, {"totalcount": 1, "data": [{"id": 9, "2": 9, "21": "Texto"}]}
+        )
+        repository = GLPITicketRepository(client, page_size=10)
+
+        # Act
+        tickets = list(repository.iter_all(fields=["id", "content"]))
+
+        # Assert
+        endpoint = client.make_request.call_args[0][1]
+        assert "forcedisplay[0]=21" in endpoint
+        assert tickets[0].content == "Texto"
+
+
+class TestGLPITicketRepositoryBatch:
+    """Testes para as operações em lote."""
+
+    def test_create_many_chunks_upstream_calls(self):
+        """Testa que a criação em lote respeita o batch_size."""
+        # Arrange
+        client = Mock()
+        client.make_request.side_effect = lambda method, endpoint, data: GLPIResponse(
+            201,
+            [
+                {"id": 100 + i, "message": ""} if item["name"] != "falha" else {}
+                for i, item in enumerate(data["input"])
+            ],
+        )
+        repository = GLPITicketRepository(client, batch_size=2)
+        tickets = [
+            GLPITicket(name=name, content="c") for name in ("a", "b", "falha", "d", "e")
+        ]
+
+        # Act
+        results = repository.create_many(tickets)
+
+        # Assert
+        assert client.make_request.call_count == 3
+        assert [result.success for result in results] == [
+            True,
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+
+    def test_delete_many_reports_failed_chunk(self):
+        """Testa que uma chamada em lote com erro falha todos os seus itens."""
+        # Arrange
+        client = Mock()
+        client.make_request.return_value = GLPIResponse(500, {}, "Erro HTTP 500")
+        repository = GLPITicketRepository(client, batch_size=10)
+
+        # Act
+        results = repository.delete_many([1, 2])
+
+        # Assert
+        assert [result.success for result in results] == [False, False]
+        assert results[0].error == "Erro HTTP 500"
+        method, endpoint, payload = client.make_request.call_args.args
+        assert (method, endpoint) == ("DELETE", "/Ticket")
+        assert payload == {"input": [{"id": 1}, {"id": 2}]}
+
+
+class TestGLPITicketRepositoryModifiedDate:
+    """Testes para a consulta barata da data de modificação."""
+
+    def test_get_modified_date_searches_only_date_mod(self):
+        """Testa que só o campo ``date_mod`` é pedido ao GLPI."""
+        # Arrange
+        client = Mock()
+        client.make_request.return_value = GLPIResponse(
+            200, {"totalcount": 1, "data": [{"19": "2024-05-01 10:00:00"}]}
+        )
+        repository = GLPITicketRepository(client)
+
+        # Act
+        modified = repository.get_modified_date(42)
+
+        # Assert
+        endpoint = client.make_request.call_args[0][1]
+        assert "criteria[0][value]=42" in endpoint
+        assert "forcedisplay[0]=19" in endpoint
+        assert modified == datetime(2024, 5, 1, 10, 0, 0)
+
+    def test_get_by_id_parses_item_fields(self):
+        """Testa que o item de ``/Ticket/{id}`` é lido pelos nomes dos campos."""
+        # Arrange
+        client = Mock()
+        client.make_request.return_value = GLPIResponse(
+            200,
+            {
+                "id": 42,
+                "name": "Ticket",
+                "content": "Conteúdo",
+                "status": 5,
+                "priority": 4,
+                "itilcategories_id": 7,
+                "date_creation": "2024-04-01 09:00:00",
+                "date_mod": "2024-05-01 10:00:00",
+            },
+        )
+
+        # Act
+        ticket = GLPITicketRepository(client).get_by_id(42)
+
+        # Assert
+        assert ticket == GLPITicket(
+            id=42,
+            name="Ticket",
+            content="Conteúdo",
+            status=TicketStatus.SOLVED,
+            priority=TicketPriority.HIGH,
+            category_id=7,
+            created_date=datetime(2024, 4, 1, 9, 0, 0),
+            modified_date=datetime(2024, 5, 1, 10, 0, 0),
+        )
+
+
+class TestGLPITicketRepositoryColumnar:
+    """Testes para a leitura colunar dos tickets de um projeto."""
+
+    def test_search_batch_reads_columns_from_rows(self):
+        """Testa o lote montado direto das linhas, página a página."""
+        # Arrange
+        client = _search_client(total=120)
+        repository = GLPITicketRepository(client, page_size=50)
+
+        # Act
+        batch = repository.search_batch_by_project_tag("PROJ")
+
+        # Assert
+        assert len(batch) == 120
+        assert list(batch.ids) == list(range(120))
+        assert batch.status_counts() == {TicketStatus.NEW: 120}
+        assert batch.priority_counts() == {TicketPriority.MEDIUM: 120}
+        assert client.make_request.call_count == 3
+        endpoint = client.make_request.call_args[0][1]
+        assert "forcedisplay[0]=12&forcedisplay[1]=3" in endpoint
+
+    def test_search_batch_raises_on_failed_page(self):
+        """Testa que uma falha na página 2 não vira um lote parcial."""
+        # Arrange
+        client = _search_client(total=120, fail_at=50)
+        repository = GLPITicketRepository(client, page_size=50)
+
+        # Act / Assert
+        with pytest.raises(IncompleteSearchError) as error:
+            repository.search_batch_by_project_tag("PROJ")
+        assert error.value.offset == 50
+
+
+def test_ticket_batch_counts_match_tickets():
+    """Testa que as contagens do lote batem com as dos tickets."""
+    # Arrange
+    tickets = [
+        GLPITicket(id=i, status=status, priority=priority)
+        for i, (status, priority) in enumerate(
+            [
+                (TicketStatus.NEW, TicketPriority.HIGH),
+                (TicketStatus.CLOSED, TicketPriority.HIGH),
+                (TicketStatus.CLOSED, TicketPriority.LOW),
+            ]
+        )
+    ]
+
+    # Act
+    batch = TicketBatch.from_tickets(tickets)
+
+    # Assert
+    assert batch.status_counts() == {TicketStatus.NEW: 1, TicketStatus.CLOSED: 2}
+    assert batch.priority_counts() == {TicketPriority.HIGH: 2, TicketPriority.LOW: 1}
+    assert not hasattr(tickets[0], "__dict__")
+
+
+class TestGLPITicketRepositoryFilters:
+    """Testes para a filtragem e a ordenação feitas pelo GLPI."""
+
+    def test_iter_all_pushes_filter_down_as_criteria(self):
+        """Testa que o filtro vira critérios, grupo OR e ordenação da busca."""
+        # Arrange
+        client = _search_client(total=3)
+        repository = GLPITicketRepository(client, page_size=10)
+        ticket_filter = TicketFilter(
+            statuses=(TicketStatus.NEW, TicketStatus.ASSIGNED),
+            assigned_group_id=4,
+            modified_after=datetime(2024, 5, 1),
+            sort="priority",
+            descending=True,
+        )
+
+        # Act
+        list(repository.iter_all(ticket_filter=ticket_filter))
+
+        # Assert
+        endpoint = client.make_request.call_args[0][1]
+        assert "criteria[0][criteria][0][field]=12" in endpoint
+        assert "criteria[0][criteria][1][link]=OR" in endpoint
+        assert "criteria[0][criteria][1][value]=2" in endpoint
+        assert "criteria[1][link]=AND&criteria[1][field]=8" in endpoint
+        assert "criteria[1][value]=4" in endpoint
+        assert "criteria[2][searchtype]=morethan" in endpoint
+        assert "criteria[2][value]=2024-05-01%2000%3A00%3A00" in endpoint
+        assert "sort=3&order=DESC" in endpoint
+        assert endpoint.endswith("range=0-9")
+
+    def test_default_iter_all_filters_in_memory(self):
+        """Testa a implementação padrão do repositório com filtro."""
+
+        # Arrange
+        class InMemoryRepository(TicketRepository):
+            get_by_id = create = update = delete = search_by_project_tag = None
+
+            def get_all(self):
+                return [
+                    GLPITicket(id=1, priority=TicketPriority.LOW),
+                    GLPITicket(id=2, status=TicketStatus.CLOSED),
+                    GLPITicket(id=3, priority=TicketPriority.HIGH),
+                    GLPITicket(id=4, priority=TicketPriority.VERY_HIGH),
+                ]
+
+        ticket_filter = TicketFilter(
+            statuses=(TicketStatus.NEW,), sort="priority", descending=True
+        )
+
+        # Act
+        tickets = InMemoryRepository().iter_all(limit=2, ticket_filter=ticket_filter)
+
+        # Assert
+        assert [ticket.id for ticket in tickets] == [4, 3]
@@ -6,7 +6,12 @@ from unittest.mock import Mock
 
 import pytest
 
-from src.core.glpi_entities import GLPITicket, TicketStatus
+from src.core.glpi_entities import (
+    BatchItemResult,
+    GLPITicket,
+    TicketBatch,
+    TicketStatus,
+)
 from src.core.glpi_use_cases import GLPITicketUseCase
 
 
@@ -39,6 +44,21 @@ class TestGLPITicketUseCase:
         assert result == tickets
         mock_ticket_repository.get_all.assert_called_once()
 
+    def test_iter_tickets(self, ticket_use_case, mock_ticket_repository):
+        """Testa iteração paginada de tickets."""
+        # Arrange
+        tickets = [GLPITicket(name="Ticket 1", content="Content 1")]
+        mock_ticket_repository.iter_all.return_value = iter(tickets)
+
+        # Act
+        result = list(ticket_use_case.iter_tickets(offset=10, limit=5))
+
+        # Assert
+        assert result == tickets
+        mock_ticket_repository.iter_all.assert_called_once_with(
+            offset=10, limit=5, fields=None, ticket_filter=None
+        )
+
     def test_get_ticket(self, ticket_use_case, mock_ticket_repository):
         """Testa obtenção de ticket por ID."""
         # Arrange
@@ -120,6 +140,27 @@ class TestGLPITicketUseCase:
         assert result is True
         mock_ticket_repository.delete.assert_called_once_with(1)
 
+    def test_create_many_tickets_skips_invalid(
+        self, ticket_use_case, mock_ticket_repository
+    ):
+        """Testa que itens inválidos não vão ao repositório no lote."""
+        # Arrange
+        valid = GLPITicket(name="Ticket", content="Content")
+        mock_ticket_repository.create_many.return_value = [
+            BatchItemResult(0, True, 10, valid)
+        ]
+
+        # Act
+        results = ticket_use_case.create_many_tickets(
+            [GLPITicket(name="", content=""), valid]
+        )
+
+        # Assert
+        mock_ticket_repository.create_many.assert_called_once_with([valid])
+        assert [result.success for result in results] == [False, True]
+        assert results[1].index == 1
+        assert results[1].ticket_id == 10
+
     def test_search_project_tickets(self, ticket_use_case, mock_ticket_repository):
         """Testa busca de tickets por tag de projeto."""
         # Arrange
@@ -135,7 +176,7 @@ class TestGLPITicketUseCase:
         # Assert
         assert result == tickets
         mock_ticket_repository.search_by_project_tag.assert_called_once_with(
-            "PROJECT-123"
+            "PROJECT-123", None
         )
 
     def test_get_project_progress(self, ticket_use_case, mock_ticket_repository):
@@ -153,7 +194,9 @@ class TestGLPITicketUseCase:
                 name="Ticket 4", content="Content 4", status=TicketStatus.CLOSED
             ),
         ]
-        mock_ticket_repository.search_by_project_tag.return_value = tickets
+        mock_ticket_repository.search_batch_by_project_tag.return_value = (
+            TicketBatch.from_tickets(tickets)
+        )
 
         # Act
         result = ticket_use_case.get_project_progress("PROJECT-123")
@@ -164,6 +207,9 @@ class TestGLPITicketUseCase:
         assert result["completed_tickets"] == 2
         assert result["in_progress_tickets"] == 1
         assert result["progress_percentage"] == 50.0
+        mock_ticket_repository.search_batch_by_project_tag.assert_called_once_with(
+            "PROJECT-123"
+        )
         assert result["remaining_tickets"] == 2
 
     def test_create_project_milestone(self, ticket_use_case, mock_ticket_repository):
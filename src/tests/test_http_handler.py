@@ -0,0 +1,444 @@
+"""
+Testes para o handler HTTP da API.
+"""
+
+import gzip
+import http.client
+import json
+import threading
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.core.glpi_entities import (
+    BatchItemResult,
+    GLPITicket,
+    TicketFilter,
+    TicketStatus,
+)
+from src.infrastructure.glpi_ticket_repository import IncompleteSearchError
+from src.interfaces.http import filters
+from src.interfaces.http.handler import APIHandler
+from src.interfaces.http.pool_server import create_server
+
+
+def _iter_tickets(offset, limit, fields=None, ticket_filter=None, total=120):
+    """Simula a iteração paginada do caso de uso."""
+    end = total if limit is None else min(offset + limit, total)
+    return iter(
+        [GLPITicket(id=i, name=f"Ticket {i}", content="c") for i in range(offset, end)]
+    )
+
+
+@pytest.fixture
+def ticket_use_case():
+    """Mock do caso de uso de tickets."""
+    use_case = Mock()
+    use_case.iter_tickets.side_effect = _iter_tickets
+    return use_case
+
+
+@pytest.fixture
+def api_connection(ticket_use_case, monkeypatch):
+    """Conexão keep-alive com uma instância local da API."""
+    monkeypatch.setattr(APIHandler, "log_message", lambda *args: None)
+    httpd = create_server(
+        ("127.0.0.1", 0), partial(APIHandler, ticket_use_case), mode="threadpool"
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    connection = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1])
+    yield connection
+    connection.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(connection, path, headers=None):
+    """Faz um GET e devolve a resposta já lida."""
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read()
+
+
+class TestTicketListing:
+    """Testes para GET /tickets."""
+
+    def test_returns_page_with_next_cursor(self, api_connection):
+        """Testa a página padrão e o cursor da próxima página."""
+        # Act
+        response, body = _get(api_connection, "/tickets?limit=50")
+
+        # Assert
+        assert response.status == 200
+        assert len(json.loads(body)) == 50
+        assert response.getheader("Content-Length") == str(len(body))
+        cursor = response.getheader("X-Next-Cursor")
+
+        response, body = _get(api_connection, f"/tickets?limit=50&cursor={cursor}")
+        assert json.loads(body)[0]["id"] == 50
+
+    def test_rejects_invalid_limit(self, api_connection):
+        """Testa que um limit inválido gera 400."""
+        # Act
+        response, _ = _get(api_connection, "/tickets?limit=abc")
+
+        # Assert
+        assert response.status == 400
+
+    def test_projects_requested_fields(self, api_connection, ticket_use_case):
+        """Testa a seleção de campos com ``fields=``."""
+        # Act
+        response, body = _get(api_connection, "/tickets?limit=5&fields=id,status")
+        invalid, _ = _get(api_connection, "/tickets?fields=id,senha")
+
+        # Assert
+        assert json.loads(body)[0] == {"id": 0, "status": "NEW"}
+        ticket_use_case.iter_tickets.assert_called_once_with(
+            0, 5, ["id", "status"], None
+        )
+        assert "fields=id%2Cstatus" in response.getheader("Link")
+        assert invalid.status == 400
+
+    def test_streams_ndjson(self, api_connection, ticket_use_case):
+        """Testa a listagem em NDJSON enviada em chunks."""
+        # Act
+        response, body = _get(
+            api_connection, "/tickets", {"Accept": "application/x-ndjson"}
+        )
+
+        # Assert
+        lines = body.decode().splitlines()
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        assert len(lines) == 120
+        assert json.loads(lines[-1])["id"] == 119
+        ticket_use_case.iter_tickets.assert_called_once_with(
+            0, None, ["id", "name", "status", "priority"], None
+        )
+
+    def test_incomplete_search_is_not_sent_as_complete(
+        self, api_connection, ticket_use_case
+    ):
+        """Testa 502 na página e o stream cortado sem o chunk final."""
+
+        # Arrange
+        def failing(*args):
+            yield GLPITicket(id=1, name="Ticket 1", content="c")
+            raise IncompleteSearchError(50, 503)
+
+        ticket_use_case.iter_tickets.side_effect = failing
+
+        # Act
+        response, _ = _get(api_connection, "/tickets")
+        api_connection.request("GET", "/tickets?stream=true")
+        stream = api_connection.getresponse()
+
+        # Assert
+        assert response.status == 502
+        assert stream.status == 200
+        with pytest.raises(http.client.IncompleteRead):
+            stream.read()
+
+    def test_streams_json_array(self, api_connection):
+        """Testa a listagem como array JSON enviado em chunks."""
+        # Act
+        response, body = _get(api_connection, "/tickets?stream=true&offset=100")
+
+        # Assert
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        assert [item["id"] for item in json.loads(body)] == list(range(100, 120))
+
+    def test_compresses_large_pages_when_accepted(self, api_connection):
+        """Testa a negociação gzip na listagem paginada."""
+        # Act
+        plain, plain_body = _get(api_connection, "/tickets?limit=100")
+        packed, packed_body = _get(
+            api_connection, "/tickets?limit=100", {"Accept-Encoding": "gzip, br"}
+        )
+        small, _ = _get(api_connection, "/tickets?limit=1", {"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert plain.getheader("Content-Encoding") is None
+        assert packed.getheader("Content-Encoding") == "gzip"
+        assert packed.getheader("Vary") == "Accept-Encoding"
+        assert gzip.decompress(packed_body) == plain_body
+        assert len(packed_body) < len(plain_body)
+        assert small.getheader("Content-Encoding") is None
+
+    def test_streams_gzip_chunks(self, api_connection):
+        """Testa o streaming NDJSON comprimido incrementalmente."""
+        # Act
+        response, body = _get(
+            api_connection,
+            "/tickets?format=ndjson",
+            {"Accept-Encoding": "gzip"},
+        )
+
+        # Assert
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        assert response.getheader("Content-Encoding") == "gzip"
+        assert len(gzip.decompress(body).decode().splitlines()) == 120
+
+    def test_filters_and_sorts_listing(self, api_connection, ticket_use_case):
+        """Testa os parâmetros de filtro, o Link e os valores inválidos."""
+        # Act
+        response, _ = _get(
+            api_connection,
+            "/tickets?limit=5&status=new,ASSIGNED&assigned_user_id=3&sort=-priority",
+        )
+        invalid_status, _ = _get(api_connection, "/tickets?status=aberto")
+        invalid_sort, _ = _get(api_connection, "/tickets?sort=content")
+
+        # Assert
+        assert response.status == 200
+        ticket_filter = ticket_use_case.iter_tickets.call_args[0][3]
+        assert ticket_filter == TicketFilter(
+            statuses=(TicketStatus.NEW, TicketStatus.ASSIGNED),
+            assigned_user_id=3,
+            sort="priority",
+            descending=True,
+        )
+        link = response.getheader("Link")
+        assert "status=new%2CASSIGNED&assigned_user_id=3&sort=-priority" in link
+        assert invalid_status.status == 400
+        assert invalid_sort.status == 400
+
+    def test_converts_dates_with_offset_to_local_time(
+        self, api_connection, ticket_use_case
+    ):
+        """Testa que datas com fuso viram hora local, comparável às do GLPI."""
+        # Arrange
+        expected = (
+            datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+            .astimezone()
+            .replace(tzinfo=None)
+        )
+
+        # Act
+        response, _ = _get(
+            api_connection, "/tickets?modified_after=2024-05-01T12:00:00%2B00:00"
+        )
+
+        # Assert
+        assert response.status == 200
+        ticket_filter = ticket_use_case.iter_tickets.call_args[0][3]
+        assert ticket_filter.modified_after == expected
+        assert ticket_filter.matches(
+            GLPITicket(name="T", content="c", modified_date=datetime(2030, 1, 1))
+        )
+
+    def test_converts_dates_to_configured_glpi_timezone(
+        self, api_connection, ticket_use_case, monkeypatch
+    ):
+        """Testa a conversão para ``GLPI_TIMEZONE`` em vez do fuso do host."""
+        # Arrange
+        monkeypatch.setattr(filters, "GLPI_TIMEZONE", ZoneInfo("America/Sao_Paulo"))
+
+        # Act
+        _get(api_connection, "/tickets?created_before=2024-05-01T12:00:00Z")
+
+        # Assert
+        ticket_filter = ticket_use_case.iter_tickets.call_args[0][3]
+        assert ticket_filter.created_before == datetime(2024, 5, 1, 9, 0)
+
+
+class TestTicketConditionalGet:
+    """Testes para ETag e If-None-Match em GET /tickets/{id}."""
+
+    def test_etag_from_modified_date(self, api_connection, ticket_use_case):
+        """Testa a ETag derivada do date_mod e a resposta 304."""
+        # Arrange
+        ticket_use_case.get_ticket.return_value = GLPITicket(
+            id=7,
+            name="Ticket 7",
+            content="c",
+            modified_date=datetime(2024, 5, 1, 10, 0, 0),
+        )
+
+        # Act
+        first, _ = _get(api_connection, "/tickets/7")
+        etag = first.getheader("ETag")
+        second, body = _get(api_connection, "/tickets/7", {"If-None-Match": etag})
+
+        # Assert
+        assert etag == 'W/"7-20240501100000"'
+        assert second.status == 304
+        assert body == b""
+
+    def test_etag_from_content_hash(self, api_connection, ticket_use_case):
+        """Testa a ETag por hash quando não há date_mod."""
+        # Arrange
+        ticket_use_case.get_ticket.return_value = GLPITicket(
+            id=7, name="Ticket 7", content="c"
+        )
+        first, _ = _get(api_connection, "/tickets/7")
+        etag = first.getheader("ETag")
+
+        # Act
+        ticket_use_case.get_ticket.return_value.content = "alterado"
+        changed, body = _get(api_connection, "/tickets/7", {"If-None-Match": etag})
+
+        # Assert
+        assert etag.startswith('W/"')
+        assert changed.status == 200
+        assert json.loads(body)["content"] == "alterado"
+        assert changed.getheader("ETag") != etag
+
+
+class TestTicketBatch:
+    """Testes para /tickets/batch."""
+
+    def test_create_batch_reports_each_item(self, api_connection, ticket_use_case):
+        """Testa que itens malformados não impedem os demais."""
+        # Arrange
+        ticket_use_case.create_many_tickets.side_effect = lambda tickets: [
+            BatchItemResult(index, True, 100 + index, ticket)
+            for index, ticket in enumerate(tickets)
+        ]
+        body = json.dumps(
+            [
+                {"name": "A", "content": "a"},
+                {"name": "B", "content": "b", "status": "INEXISTENTE"},
+                {"name": "C", "content": "c"},
+            ]
+        )
+
+        # Act
+        api_connection.request("POST", "/tickets/batch", body=body)
+        response = api_connection.getresponse()
+        payload = json.loads(response.read())
+
+        # Assert
+        assert response.status == 200
+        assert payload["succeeded"] == 2
+        assert payload["failed"] == 1
+        assert [item["id"] for item in payload["results"]] == [100, None, 101]
+
+    def test_delete_batch_accepts_ids(self, api_connection, ticket_use_case):
+        """Testa a exclusão em lote a partir de uma lista de IDs."""
+        # Arrange
+        ticket_use_case.delete_many_tickets.side_effect = lambda ids: [
+            BatchItemResult(index, True, ticket_id)
+            for index, ticket_id in enumerate(ids)
+        ]
+
+        # Act
+        api_connection.request(
+            "DELETE", "/tickets/batch", body=json.dumps({"ids": [1, 2]})
+        )
+        payload = json.loads(api_connection.getresponse().read())
+
+        # Assert
+        ticket_use_case.delete_many_tickets.assert_called_once_with([1, 2])
+        assert payload["succeeded"] == 2
+
+
+class TestStaticAssets:
+    """Testes para a especificação OpenAPI e o Swagger UI pré-computados."""
+
+    def test_serves_gzip_variant_with_etag(self, api_connection):
+        """Testa a variante gzip e os cabeçalhos de cache."""
+        # Act
+        plain, plain_body = _get(api_connection, "/api/openapi.json")
+        packed, packed_body = _get(
+            api_connection, "/api/openapi.json", {"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        assert json.loads(plain_body)["openapi"]
+        assert packed.getheader("Content-Encoding") == "gzip"
+        assert gzip.decompress(packed_body) == plain_body
+        assert packed.getheader("Content-Length") == str(len(packed_body))
+        assert plain.getheader("ETag") != packed.getheader("ETag")
+        assert "max-age" in plain.getheader("Cache-Control")
+
+    def test_if_none_match_returns_304(self, api_connection):
+        """Testa a revalidação condicional da página de documentação."""
+        # Arrange
+        response, _ = _get(api_connection, "/docs")
+        etag = response.getheader("ETag")
+
+        # Act
+        revalidated, body = _get(api_connection, "/docs", {"If-None-Match": etag})
+        yaml_response, yaml_body = _get(api_connection, "/api/openapi.yaml")
+
+        # Assert
+        assert revalidated.status == 304
+        assert body == b""
+        assert revalidated.getheader("ETag") == etag
+        assert yaml_response.status == 200
+        assert b"openapi:" in yaml_body
+
+
+class TestRouting:
+    """Testes para o despacho pela tabela de rotas."""
+
+    def test_dispatches_path_parameters(self, api_connection, ticket_use_case):
+        """Testa parâmetros convertidos, ID inválido e rota desconhecida."""
+        # Arrange
+        ticket_use_case.get_project_progress.return_value = {"total": 0}
+
+        # Act
+        progress, _ = _get(api_connection, "/projects/ABC-1/progress?x=1")
+        invalid, _ = _get(api_connection, "/tickets/abc")
+        unknown, _ = _get(api_connection, "/projects/ABC-1")
+
+        # Assert
+        assert progress.status == 200
+        ticket_use_case.get_project_progress.assert_called_once_with("ABC-1")
+        assert invalid.status == 400
+        assert unknown.status == 404
+
+
+class TestMetricsEndpoint:
+    """Testes para GET /metrics."""
+
+    def test_exposes_requests_by_route_template(self, api_connection, ticket_use_case):
+        """Testa que as requisições aparecem por rota, método e status."""
+        # Arrange
+        ticket_use_case.get_ticket.return_value = None
+        _get(api_connection, "/tickets/987654")
+
+        # Act
+        response, body = _get(api_connection, "/metrics")
+
+        # Assert
+        text = body.decode()
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("text/plain")
+        assert (
+            'http_requests_total{method="GET",route="/tickets/{id}",status="404"}'
+            in text
+        )
+        assert "987654" not in text
+        assert 'http_requests_in_flight{method="GET",route="/metrics"} 1.0' in text
+        assert "# TYPE http_request_duration_seconds histogram" in text
+
+
+class TestProfileEndpoint:
+    """Testes para o profiling por cabeçalho e GET /debug/profile."""
+
+    def test_profiles_request_with_token(self, api_connection, monkeypatch, tmp_path):
+        """Testa que a requisição com token é perfilada e resumida por rota."""
+        # Arrange
+        from src.interfaces.http.profiling import PROFILE_HEADER, PROFILER
+
+        monkeypatch.setattr(PROFILER, "token", "segredo")
+        monkeypatch.setattr(PROFILER, "directory", str(tmp_path))
+        monkeypatch.setattr(PROFILER, "_stats", {})
+        monkeypatch.setattr(PROFILER, "samples", {})
+        token = {PROFILE_HEADER: "segredo"}
+
+        # Act
+        _get(api_connection, "/tickets?limit=10", token)
+        denied, _ = _get(api_connection, "/debug/profile")
+        response, body = _get(api_connection, "/debug/profile?top=5", token)
+
+        # Assert
+        assert denied.status == 404
+        assert response.status == 200
+        assert "GET /tickets (1 amostra(s))" in body.decode()
+        assert (tmp_path / "GET_tickets.pstats").exists()
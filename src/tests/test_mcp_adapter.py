@@ -0,0 +1,75 @@
+"""
+Testes para os backends do adaptador MCP.
+"""
+
+import threading
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_adapter import InProcessBackend, RemoteBackend
+from src.core.glpi_entities import GLPITicket
+from src.interfaces.http.handler import APIHandler
+from src.interfaces.http.pool_server import create_server
+
+
+@pytest.fixture
+def ticket_use_case():
+    """Mock do caso de uso com um único ticket existente."""
+    use_case = Mock()
+    ticket = GLPITicket(id=7, name="Ticket 7", content="c")
+    use_case.get_ticket.side_effect = lambda ticket_id: (
+        ticket if ticket_id == 7 else None
+    )
+    use_case.create_ticket.side_effect = lambda t: GLPITicket(
+        id=8, name=t.name, content=t.content
+    )
+    return use_case
+
+
+@pytest.fixture
+def api_url(ticket_use_case, monkeypatch):
+    """URL de uma instância local da API."""
+    monkeypatch.setattr(APIHandler, "log_message", lambda *args: None)
+    httpd = create_server(
+        ("127.0.0.1", 0), partial(APIHandler, ticket_use_case), mode="threadpool"
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_backends_return_the_same_payloads(ticket_use_case, api_url):
+    """Testa que os modos remoto e em processo produzem o mesmo JSON."""
+    # Arrange
+    remote = RemoteBackend(base_url=api_url, timeout=5)
+    local = InProcessBackend(ticket_use_case)
+
+    # Act
+    remote_ticket = remote.get_ticket(7)
+    local_ticket = local.get_ticket(7)
+    remote_created = remote.create_ticket("Novo", "conteúdo")
+    local_created = local.create_ticket("Novo", "conteúdo")
+    remote.close()
+
+    # Assert
+    assert remote_ticket == local_ticket
+    assert remote_ticket["name"] == "Ticket 7"
+    assert remote_created == local_created
+    assert ticket_use_case.create_ticket.call_args[0][0].name == "Novo"
+
+
+def test_remote_backend_reports_non_json_errors(api_url):
+    """Testa que erros HTML da API viram um dicionário de erro."""
+    # Arrange
+    backend = RemoteBackend(base_url=api_url, timeout=5)
+
+    # Act
+    result = backend.get_ticket(99)
+    backend.close()
+
+    # Assert
+    assert result["status"] == 404
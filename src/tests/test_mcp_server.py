@@ -0,0 +1,85 @@
+"""
+Testes para o despacho JSON-RPC do servidor MCP.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import mcp_server
+
+
+def _fake_methods():
+    """Métodos que registram a thread e demoram um pouco."""
+    threads = set()
+
+    def get_ticket(ticket_id: int):
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return {"id": ticket_id}
+
+    def fail():
+        raise RuntimeError("boom")
+
+    return {"get_ticket": get_ticket, "fail": fail}, threads
+
+
+def test_batch_preserves_order_and_runs_concurrently():
+    """Testa que um lote retorna as respostas na ordem e em paralelo."""
+    # Arrange
+    methods, threads = _fake_methods()
+    batch = [
+        {"jsonrpc": "2.0", "method": "get_ticket", "params": {"ticket_id": i}, "id": i}
+        for i in range(8)
+    ]
+
+    # Act
+    with patch.dict(mcp_server.METHODS, methods, clear=True):
+        responses = mcp_server.handle_payload(batch)
+
+    # Assert
+    assert [response["result"]["id"] for response in responses] == list(range(8))
+    assert [response["id"] for response in responses] == list(range(8))
+    assert len(threads) > 1
+
+
+def test_batch_reports_errors_per_call_and_skips_notifications():
+    """Testa os códigos de erro por chamada e a omissão de notificações."""
+    # Arrange
+    methods, _ = _fake_methods()
+    batch = [
+        {"jsonrpc": "2.0", "method": "get_ticket", "params": {"ticket_id": 1}},
+        {"jsonrpc": "2.0", "method": "missing", "id": "a"},
+        {"jsonrpc": "2.0", "method": "get_ticket", "params": {"x": 1}, "id": "b"},
+        {"jsonrpc": "2.0", "method": "fail", "id": "c"},
+        42,
+    ]
+
+    # Act
+    with patch.dict(mcp_server.METHODS, methods, clear=True):
+        responses = mcp_server.handle_payload(batch)
+
+    # Assert
+    codes = [(response["id"], response["error"]["code"]) for response in responses]
+    assert codes == [
+        ("a", mcp_server.METHOD_NOT_FOUND),
+        ("b", mcp_server.INVALID_PARAMS),
+        ("c", mcp_server.INTERNAL_ERROR),
+        (None, mcp_server.INVALID_REQUEST),
+    ]
+
+
+def test_only_notifications_and_empty_batch():
+    """Testa lote só de notificações (sem resposta) e lote vazio (inválido)."""
+    # Arrange
+    methods, _ = _fake_methods()
+    notification = {"jsonrpc": "2.0", "method": "get_ticket", "params": [1]}
+
+    # Act
+    with patch.dict(mcp_server.METHODS, methods, clear=True):
+        notified = mcp_server.handle_payload([notification, notification])
+        empty = mcp_server.handle_payload([])
+
+    # Assert
+    assert notified is None
+    assert empty["error"]["code"] == mcp_server.INVALID_REQUEST
@@ -0,0 +1,95 @@
+"""
+Testes para as métricas no formato Prometheus.
+"""
+
+import threading
+
+from src.infrastructure.glpi_client import endpoint_template
+from src.infrastructure.metrics import MetricsRegistry
+from src.interfaces.http.metrics import route_template
+
+
+def test_counter_sums_shards_of_all_threads():
+    """Testa que a coleta soma as gravações de threads vivas e encerradas."""
+    # Arrange
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Chamadas", ("route",))
+
+    def record():
+        for _ in range(1000):
+            counter.inc("/tickets")
+
+    # Act
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc("/tickets")
+
+    # Assert
+    assert counter.collect() == {("/tickets",): 8001}
+    # Os shards das threads encerradas foram incorporados ao acumulado
+    assert counter.collect() == {("/tickets",): 8001}
+    assert len(counter._shards) == 1
+
+
+def test_gauge_goes_up_and_down():
+    """Testa incremento e decremento de um gauge."""
+    # Arrange
+    registry = MetricsRegistry()
+    gauge = registry.gauge("in_flight", "Em andamento", ("route",))
+
+    # Act
+    gauge.inc("/a")
+    gauge.inc("/a")
+    gauge.dec("/a")
+
+    # Assert
+    assert gauge.collect() == {("/a",): 1}
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Testa as faixas cumulativas, a soma e a contagem do histograma."""
+    # Arrange
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "latency_seconds", "Latência", ("route",), buckets=(0.1, 1.0)
+    )
+
+    # Act
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/x")
+    text = registry.render()
+
+    # Assert
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/x",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/x",le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'latency_seconds_sum{route="/x"} 3.65' in text
+    assert 'latency_seconds_count{route="/x"} 4' in text
+
+
+def test_registry_returns_existing_metric():
+    """Testa que registrar o mesmo nome devolve a métrica existente."""
+    # Arrange
+    registry = MetricsRegistry()
+
+    # Act
+    first = registry.counter("calls_total", "Chamadas")
+    second = registry.counter("calls_total", "Chamadas")
+
+    # Assert
+    assert first is second
+
+
+def test_templates_limit_label_cardinality():
+    """Testa que IDs e tags viram parâmetros nomeados nos rótulos."""
+    # Assert
+    assert route_template("/tickets/42?x=1") == "/tickets/{id}"
+    assert route_template("/tickets/batch") == "/tickets/batch"
+    assert route_template("/projects/ABC/progress") == "/projects/{tag}/progress"
+    assert route_template("/wp-admin") == "other"
+    assert endpoint_template("/Ticket/42") == "/Ticket/{id}"
+    assert endpoint_template("/search/Ticket?range=0-49") == "/search/Ticket"
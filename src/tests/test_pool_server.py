@@ -0,0 +1,64 @@
+"""
+Testes para o servidor HTTP com pool de threads.
+"""
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from src.interfaces.http.pool_server import BoundedThreadPoolServer
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Handler que segura o worker por um tempo fixo."""
+
+    def do_GET(self):
+        time.sleep(0.3)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _send_get(port):
+    """Abre uma conexão e envia um GET simples."""
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.sendall(b"GET / HTTP/1.0\r\n\r\n")
+    return sock
+
+
+class TestBoundedThreadPoolServer:
+    """Testes para o limite de fila do servidor."""
+
+    def test_rejects_with_503_when_queue_is_full(self):
+        """Testa que o excedente recebe 503 em vez de uma nova thread."""
+        # Arrange
+        httpd = BoundedThreadPoolServer(
+            ("127.0.0.1", 0), SlowHandler, max_workers=1, max_queue=1
+        )
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        port = httpd.server_address[1]
+
+        try:
+            # Act: um em atendimento, um na fila e um excedente
+            busy = _send_get(port)
+            time.sleep(0.1)
+            queued = _send_get(port)
+            time.sleep(0.1)
+            rejected = _send_get(port)
+            rejected_response = rejected.recv(1024)
+
+            # Assert
+            assert rejected_response.startswith(b"HTTP/1.1 503")
+            assert httpd.rejected_requests == 1
+            assert busy.recv(1024).startswith(b"HTTP/1.0 200")
+            assert queued.recv(1024).startswith(b"HTTP/1.0 200")
+        finally:
+            for sock in (busy, queued, rejected):
+                sock.close()
+            httpd.shutdown()
+            httpd.server_close()
@@ -0,0 +1,91 @@
+"""
+Testes para o profiling sob demanda das requisições.
+"""
+
+import threading
+
+from src.interfaces.http.profiling import PROFILE_HEADER, RequestProfiler, main
+
+
+def _slow_function():
+    """Função perfilada nos testes."""
+    return sum(i * i for i in range(10000))
+
+
+def test_disabled_profiler_samples_nothing():
+    """Testa que sem flag nem token nenhuma requisição é perfilada."""
+    # Arrange
+    profiler = RequestProfiler(sample_rate=1.0)
+
+    # Assert
+    assert not profiler.should_profile({PROFILE_HEADER: "x"})
+    assert not profiler.authorized({})
+
+
+def test_token_header_enables_profiling():
+    """Testa que o cabeçalho com o token certo liga o profiler."""
+    # Arrange
+    profiler = RequestProfiler(token="segredo")
+
+    # Assert
+    assert profiler.should_profile({PROFILE_HEADER: "segredo"})
+    assert not profiler.should_profile({PROFILE_HEADER: "errado"})
+    assert profiler.authorized({PROFILE_HEADER: "segredo"})
+    assert not profiler.authorized({})
+
+
+def test_non_ascii_token_header_is_compared_as_bytes():
+    """Testa que cabeçalhos e tokens fora do ASCII não quebram a comparação."""
+    # Arrange
+    profiler = RequestProfiler(token="segredo-ç")
+
+    # Assert
+    assert not profiler.should_profile({PROFILE_HEADER: "çççç"})
+    assert profiler.authorized(
+        {PROFILE_HEADER: "segredo-ç".encode("utf-8").decode("latin-1")}
+    )
+
+
+def test_aggregates_samples_per_route(tmp_path, capsys):
+    """Testa a agregação por rota, o arquivo .pstats e o resumo pela CLI."""
+    # Arrange
+    profiler = RequestProfiler(directory=str(tmp_path), enabled=True)
+
+    # Act
+    results = [profiler.run("GET /tickets", _slow_function) for _ in range(3)]
+    summary = profiler.summary("GET /tickets", top=5)
+    main([profiler.path_for("GET /tickets"), "--top", "5"])
+
+    # Assert
+    assert results == [_slow_function()] * 3
+    assert profiler.samples == {"GET /tickets": 3}
+    assert profiler.routes() == ["GET /tickets"]
+    assert "GET /tickets (3 amostra(s))" in summary
+    assert "_slow_function" in summary
+    assert (tmp_path / "GET_tickets.pstats").exists()
+    assert "_slow_function" in capsys.readouterr().out
+
+
+def test_concurrent_request_runs_without_profiler(tmp_path):
+    """Testa que só uma requisição por vez fica sob o profiler."""
+    # Arrange
+    profiler = RequestProfiler(directory=str(tmp_path), enabled=True)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+
+    thread = threading.Thread(target=profiler.run, args=("GET /a", blocking))
+    thread.start()
+    started.wait(5)
+
+    # Act
+    result = profiler.run("GET /b", _slow_function)
+    release.set()
+    thread.join()
+
+    # Assert
+    assert result == _slow_function()
+    assert profiler.samples == {"GET /a": 1}
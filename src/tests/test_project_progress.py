@@ -0,0 +1,117 @@
+"""
+Testes para o índice de progresso por projeto.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.glpi_entities import GLPITicket, TicketStatus
+from src.core.glpi_use_cases import GLPITicketUseCase
+from src.core.project_progress import ProjectProgressIndex
+
+
+class TestProjectProgressIndex:
+    """Testes para o progresso mantido incrementalmente."""
+
+    @pytest.fixture
+    def mock_ticket_repository(self):
+        """Mock do repositório com dois tickets do projeto."""
+        repository = Mock()
+        repository.search_by_project_tag.return_value = [
+            GLPITicket(id=1, name="PROJ-1 a", content="c", status=TicketStatus.NEW),
+            GLPITicket(id=2, name="PROJ-1 b", content="c", status=TicketStatus.SOLVED),
+        ]
+        return repository
+
+    @pytest.fixture
+    def ticket_use_case(self, mock_ticket_repository):
+        """Caso de uso com o índice ativo."""
+        index = ProjectProgressIndex(mock_ticket_repository, reconcile_interval=300)
+        return GLPITicketUseCase(mock_ticket_repository, index)
+
+    def test_builds_once(self, ticket_use_case, mock_ticket_repository):
+        """Testa que consultas seguidas não refazem a busca."""
+        # Act
+        ticket_use_case.get_project_progress("PROJ-1")
+        result = ticket_use_case.get_project_progress("PROJ-1")
+
+        # Assert
+        assert result["total_tickets"] == 2
+        assert result["completed_tickets"] == 1
+        mock_ticket_repository.search_by_project_tag.assert_called_once()
+
+    def test_create_update_delete_adjust_counts(
+        self, ticket_use_case, mock_ticket_repository
+    ):
+        """Testa que escritas pelo caso de uso ajustam o agregado."""
+        # Arrange
+        ticket_use_case.get_project_progress("PROJ-1")
+        mock_ticket_repository.create.return_value = GLPITicket(
+            id=3, name="PROJ-1 c", content="c", status=TicketStatus.ASSIGNED
+        )
+        mock_ticket_repository.update.return_value = GLPITicket(
+            id=1, name="PROJ-1 a", content="c", status=TicketStatus.CLOSED
+        )
+        mock_ticket_repository.delete.return_value = True
+
+        # Act
+        ticket_use_case.create_ticket(GLPITicket(name="PROJ-1 c", content="c"))
+        ticket_use_case.update_ticket(1, GLPITicket(name="PROJ-1 a", content="c"))
+        ticket_use_case.delete_ticket(2)
+        result = ticket_use_case.get_project_progress("PROJ-1")
+
+        # Assert
+        assert result["total_tickets"] == 2
+        assert result["completed_tickets"] == 1
+        assert result["in_progress_tickets"] == 1
+        mock_ticket_repository.search_by_project_tag.assert_called_once()
+
+    def test_ticket_renamed_out_of_project(
+        self, ticket_use_case, mock_ticket_repository
+    ):
+        """Testa que um ticket que deixa de ter a tag sai da contagem."""
+        # Arrange
+        ticket_use_case.get_project_progress("PROJ-1")
+        mock_ticket_repository.update.return_value = GLPITicket(
+            id=1, name="Outro projeto", content="c"
+        )
+
+        # Act
+        ticket_use_case.update_ticket(1, GLPITicket(name="Outro projeto", content="c"))
+
+        # Assert
+        assert ticket_use_case.get_project_progress("PROJ-1")["total_tickets"] == 1
+
+    def test_reconciles_when_stale(self, mock_ticket_repository):
+        """Testa que o agregado vencido é remontado a partir do GLPI."""
+        # Arrange
+        index = ProjectProgressIndex(mock_ticket_repository, reconcile_interval=0)
+
+        # Act
+        index.get_counts("PROJ-1")
+        index.get_counts("PROJ-1")
+
+        # Assert
+        assert mock_ticket_repository.search_by_project_tag.call_count == 2
+
+    def test_failed_rebuild_keeps_previous_aggregate(self, mock_ticket_repository):
+        """Testa que uma busca que falha não grava uma contagem parcial."""
+        # Arrange
+        index = ProjectProgressIndex(mock_ticket_repository, reconcile_interval=300)
+        index.get_counts("PROJ-1")
+        mock_ticket_repository.search_by_project_tag.side_effect = RuntimeError(
+            "página 2 falhou"
+        )
+
+        # Act
+        index.reconcile_all()
+
+        # Assert
+        assert index.get_counts("PROJ-1") == {
+            TicketStatus.NEW: 1,
+            TicketStatus.SOLVED: 1,
+        }
+        with pytest.raises(RuntimeError):
+            index.get_counts("PROJ-2")
+        assert "PROJ-2" not in index._tags
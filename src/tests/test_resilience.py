@@ -0,0 +1,186 @@
+"""
+Testes para as retentativas e o circuit breaker das chamadas ao GLPI.
+"""
+
+import time
+
+from src.core.glpi_entities import GLPIConfig, GLPIResponse
+from src.infrastructure.glpi_client import STATUS_INVALID_RESPONSE, GLPIHTTPClient
+from src.infrastructure.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    RetryPolicy,
+)
+
+
+def _scripted_client(monkeypatch, statuses, **config):
+    """Cliente cujas respostas do GLPI seguem a lista de status informada."""
+    options = {"retry_backoff": 0.0, **config}
+    client = GLPIHTTPClient(GLPIConfig("http://glpi", "app", "user", **options))
+    client.session_token = "token"
+    calls = []
+
+    def send(method, endpoint, data, token):
+        calls.append((method, endpoint))
+        status = statuses.pop(0) if statuses else 200
+        return GLPIResponse(status, {})
+
+    monkeypatch.setattr(client, "_send", send)
+    return client, calls
+
+
+class TestRetryPolicy:
+    """Testes para a política de retentativas."""
+
+    def test_delays_grow_with_jitter_and_cap(self):
+        """Testa o limite das esperas e a quantidade de retentativas."""
+        # Arrange
+        policy = RetryPolicy(max_retries=5, base_delay=0.1, max_delay=0.3)
+
+        # Act
+        delays = list(policy.delays("GET"))
+
+        # Assert
+        assert len(delays) == 5
+        assert all(0 <= delay <= bound for delay, bound in zip(delays, [0.1, 0.2]))
+        assert all(delay <= 0.3 for delay in delays)
+
+    def test_non_idempotent_method_is_not_retried(self):
+        """Testa que POST não recebe retentativas."""
+        # Assert
+        assert list(RetryPolicy().delays("POST")) == []
+
+
+class TestCircuitBreaker:
+    """Testes para os estados do circuit breaker."""
+
+    def test_opens_after_threshold_and_probes_once(self):
+        """Testa a abertura, o meio-aberto com uma sonda e o fechamento."""
+        # Arrange
+        breaker = CircuitBreaker("/x", failure_threshold=2, recovery_timeout=0.05)
+
+        # Act
+        breaker.record_failure()
+        breaker.record_failure()
+        rejected = breaker.allow()
+        time.sleep(0.06)
+        probe = breaker.allow()
+        second_probe = breaker.allow()
+        state_during_probe = breaker.state
+        breaker.record_success()
+
+        # Assert
+        assert rejected is False
+        assert probe is True
+        assert second_probe is False
+        assert state_during_probe == HALF_OPEN
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        """Testa que a sonda com falha volta a abrir o circuito."""
+        # Arrange
+        breaker = CircuitBreaker("/y", failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        # Act
+        breaker.allow()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == OPEN
+        assert breaker.allow() is False
+
+
+class TestClientResilience:
+    """Testes para retentativas e circuito no cliente do GLPI."""
+
+    def test_retries_idempotent_request_until_success(self, monkeypatch):
+        """Testa que um GET com 503 e falha de conexão é repetido."""
+        # Arrange
+        client, calls = _scripted_client(monkeypatch, [503, 0, 200])
+
+        # Act
+        response = client.make_request("GET", "/Ticket/1")
+
+        # Assert
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    def test_post_fails_without_retry(self, monkeypatch):
+        """Testa que um POST com 503 não é repetido."""
+        # Arrange
+        client, calls = _scripted_client(monkeypatch, [503])
+
+        # Act
+        response = client.make_request("POST", "/Ticket", {"input": {}})
+
+        # Assert
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    def test_invalid_body_is_not_retried_or_counted(self, monkeypatch):
+        """Testa que um corpo ilegível não é sobrecarga nem abre o circuito."""
+        # Arrange
+        client, calls = _scripted_client(
+            monkeypatch, [STATUS_INVALID_RESPONSE] * 2, breaker_failure_threshold=1
+        )
+
+        # Act
+        first = client.make_request("GET", "/Ticket/1")
+        second = client.make_request("GET", "/Ticket/1")
+
+        # Assert
+        assert first.status_code == second.status_code == STATUS_INVALID_RESPONSE
+        assert len(calls) == 2
+        assert client.breakers.states() == {"/Ticket/{id}": CLOSED}
+
+    def test_authentication_goes_through_the_breaker(self, monkeypatch):
+        """Testa que, com o GLPI fora do ar, a autenticação falha na hora."""
+        # Arrange
+        client = GLPIHTTPClient(
+            GLPIConfig("http://glpi", "app", "user", breaker_failure_threshold=2)
+        )
+        calls = []
+
+        def unreachable(*args, **kwargs):
+            calls.append(args)
+            raise ConnectionRefusedError("recusada")
+
+        monkeypatch.setattr(client.pool, "request", unreachable)
+
+        # Act
+        results = [client.ensure_session() for _ in range(5)]
+
+        # Assert
+        assert results == [False] * 5
+        assert len(calls) == 2
+        assert client.breakers.states() == {"/initSession": OPEN}
+
+    def test_open_circuit_fails_fast_per_endpoint(self, monkeypatch):
+        """Testa que o circuito aberto recusa sem rede só no endpoint afetado."""
+        # Arrange
+        client, calls = _scripted_client(
+            monkeypatch,
+            [500] * 3,
+            max_retries=0,
+            breaker_failure_threshold=3,
+        )
+        for _ in range(3):
+            client.make_request("GET", "/Ticket/1")
+
+        # Act
+        rejected = client.make_request("GET", "/Ticket/2")
+        other = client.make_request("GET", "/search/Ticket?range=0-49")
+
+        # Assert
+        assert rejected.status_code == 503
+        assert "circuito aberto" in rejected.error
+        assert other.status_code == 200
+        assert len(calls) == 4
+        assert client.breakers.states() == {
+            "/Ticket/{id}": OPEN,
+            "/search/Ticket": CLOSED,
+        }
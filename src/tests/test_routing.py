@@ -0,0 +1,92 @@
+"""
+Testes para a tabela de rotas da API.
+"""
+
+import pytest
+
+from src.interfaces.http.handler import APIHandler
+from src.interfaces.http.routing import (
+    ROUTES,
+    InvalidPathParameter,
+    Route,
+    Router,
+    parse_query,
+)
+from src.interfaces.http.swagger import SwaggerGenerator
+
+
+def test_matches_static_and_parameter_routes():
+    """Testa caminhos fixos, parâmetros convertidos e a prioridade dos fixos."""
+    # Act
+    batch = ROUTES.match("PUT", "/tickets/batch")
+    ticket = ROUTES.match("PUT", "/tickets/42")
+    progress = ROUTES.match("GET", "/projects/ABC/progress")
+
+    # Assert
+    assert batch.route.handler == "_update_batch"
+    assert ticket.route.handler == "_update_ticket"
+    assert ticket.params == {"id": 42}
+    assert progress.params == {"tag": "ABC"}
+
+
+def test_unknown_path_or_method_does_not_match():
+    """Testa que caminho ou método sem rota não casa."""
+    # Assert
+    assert ROUTES.match("GET", "/wp-admin") is None
+    assert ROUTES.match("POST", "/tickets/42") is None
+    assert ROUTES.match("GET", "/projects/ABC") is None
+    assert ROUTES.match("PATCH", "/tickets") is None
+
+
+def test_rejects_parameter_that_does_not_convert():
+    """Testa o erro de conversão de um parâmetro ``int``."""
+    # Act / Assert
+    with pytest.raises(InvalidPathParameter) as error:
+        ROUTES.match("GET", "/tickets/abc")
+    assert error.value.name == "id"
+
+
+def test_rejects_conflicting_parameters():
+    """Testa que parâmetros diferentes na mesma posição são recusados."""
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Router([Route("GET", "/a/{id:int}", "x"), Route("PUT", "/a/{name}", "y")])
+    with pytest.raises(ValueError):
+        Router([Route("GET", "/a/{id}", "x"), Route("GET", "/a/{id}", "y")])
+
+
+def test_template_ignores_method_and_query():
+    """Testa o padrão usado nas métricas."""
+    # Assert
+    assert ROUTES.template("/tickets/42?x=1") == "/tickets/{id}"
+    assert ROUTES.template("/tickets/batch") == "/tickets/batch"
+    assert ROUTES.template("/tickets/1/extra") == "other"
+
+
+def test_parse_query_is_cached_and_read_only():
+    """Testa que a mesma query string reaproveita o resultado imutável."""
+    # Act
+    first = parse_query("limit=10&fields=id,name")
+    second = parse_query("limit=10&fields=id,name")
+
+    # Assert
+    assert first is second
+    assert first["limit"] == ("10",)
+    with pytest.raises(TypeError):
+        first["limit"] = ("20",)
+
+
+def test_route_table_feeds_handler_and_openapi():
+    """Testa que cada rota tem método no handler e as documentadas no OpenAPI."""
+    # Act
+    paths = SwaggerGenerator()._generate_paths()
+
+    # Assert
+    for route in ROUTES.routes:
+        assert callable(getattr(APIHandler, route.handler))
+    documented = {
+        (route.template, route.method.lower())
+        for route in ROUTES.routes
+        if route.documented
+    }
+    assert {(path, method) for path in paths for method in paths[path]} == documented
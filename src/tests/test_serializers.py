@@ -0,0 +1,104 @@
+"""
+Testes para a serialização de tickets.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.core.glpi_entities import GLPITicket, TicketPriority, TicketStatus
+from src.interfaces.http import serializers
+from src.interfaces.http.serializers import (
+    SERIALIZERS,
+    SerializerRegistry,
+    ticket_detail,
+    ticket_plan,
+)
+
+
+@pytest.fixture
+def ticket():
+    """Ticket com enum, data e texto acentuado."""
+    return GLPITicket(
+        id=7,
+        name="Migração",
+        content="Atualizar servidor",
+        status=TicketStatus.SOLVED,
+        priority=TicketPriority.HIGH,
+        assigned_user_id=3,
+        modified_date=datetime(2024, 5, 1, 10, 0, 0),
+    )
+
+
+def test_plans_convert_enums_and_dates(ticket):
+    """Testa as visões nomeadas e uma lista de campos avulsa."""
+    # Act
+    detail = ticket_detail(ticket)
+    fields = ticket_plan(["status", "modified_date"]).to_dict(ticket)
+    single = ticket_plan(["priority"]).to_dict(ticket)
+
+    # Assert
+    assert detail == {
+        "id": 7,
+        "name": "Migração",
+        "content": "Atualizar servidor",
+        "status": "SOLVED",
+        "priority": "HIGH",
+        "assigned_user_id": 3,
+        "assigned_group_id": None,
+    }
+    assert fields == {"status": "SOLVED", "modified_date": "2024-05-01T10:00:00"}
+    assert single == {"priority": "HIGH"}
+
+
+def test_field_plans_are_reused():
+    """Testa que a mesma lista de campos reaproveita o plano."""
+    # Assert
+    assert ticket_plan(["id", "name"]) is ticket_plan(("id", "name"))
+    assert ticket_plan("summary") is SERIALIZERS.plan(GLPITicket, "summary")
+    with pytest.raises(KeyError):
+        SerializerRegistry().plan(GLPITicket, "summary")
+
+
+def test_adhoc_plans_are_bounded():
+    """Testa que listas de campos avulsas não acumulam planos sem limite."""
+    # Arrange
+    registry = SerializerRegistry(max_adhoc=2)
+    first = registry.plan(GLPITicket, ["id", "name"])
+
+    # Act
+    registry.plan(GLPITicket, ["name", "id"])
+    registry.plan(GLPITicket, ["status"])
+
+    # Assert
+    assert registry.plan(GLPITicket, ["id", "name"]) is not first
+    assert registry.plan(GLPITicket, ["status"]) is registry.plan(
+        GLPITicket, ("status",)
+    )
+
+
+def test_backends_produce_equivalent_json(ticket):
+    """Testa que o orjson (se instalado) e o json geram o mesmo documento."""
+    # Arrange
+    payload = [ticket_detail(ticket), {"progress_percentage": 53.33}]
+
+    # Act
+    body = serializers.dumps(payload)
+
+    # Assert
+    assert json.loads(body) == json.loads(serializers._stdlib_dumps(payload))
+    assert json.loads(body) == payload
+    assert b", " not in body
+
+
+def test_encode_many_builds_json_array(ticket):
+    """Testa o array JSON da listagem."""
+    # Act
+    body = ticket_plan("summary").encode_many([ticket, ticket])
+
+    # Assert
+    assert (
+        json.loads(body)
+        == [{"id": 7, "name": "Migração", "status": "SOLVED", "priority": "HIGH"}] * 2
+    )